@@ -10,7 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from alembic import context
 from app.database import SQLALCHEMY_DATABASE_URL
-from app.models import interview, user
+from app.models import interview, user, job, cache, outbox
 from app.database import Base
 
 # this is the Alembic Config object, which provides
@@ -18,9 +18,9 @@ from app.database import Base
 config = context.config
 config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
 
-# Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# Interpret the config file for Python logging, unless the app is running
+# the migrations in-process with its own logging (app/migrations.py)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # add your model's MetaData object here
@@ -54,6 +54,9 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         # Enable SQLite foreign keys - use text() to create a proper SQL expression
         connection.execute(text("PRAGMA foreign_keys=ON"))
+        # The statement above autobegins a transaction; end it so Alembic runs
+        # (and commits) its own instead of leaving everything to be rolled back
+        connection.commit()
         
         context.configure(
             connection=connection,
@@ -0,0 +1,96 @@
+"""processing jobs and result cache
+
+Revision ID: 2a7c9e5d1b60
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a7c9e5d1b60'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns processing_jobs gained after the table was first created
+JOB_COLUMNS = {
+    "external_id": lambda: sa.Column("external_id", sa.String(), nullable=True),
+    "external_status": lambda: sa.Column("external_status", sa.String(), nullable=True),
+    "bypass_cache": lambda: sa.Column("bypass_cache", sa.Boolean(), server_default=sa.false(), nullable=False),
+}
+
+JOB_INDEXES = {
+    "ix_processing_jobs_id": ["id"],
+    "ix_processing_jobs_session_id": ["session_id"],
+    "ix_processing_jobs_external_id": ["external_id"],
+    "ix_processing_jobs_claim": ["stage", "status", "run_after"],
+}
+
+CACHE_INDEXES = {
+    "ix_result_cache_expires_at": ["expires_at"],
+    "ix_result_cache_kind_last_used": ["kind", "last_used_at"],
+}
+
+
+def create_missing_indexes(inspector, table: str, indexes: dict) -> None:
+    existing = {index["name"] for index in inspector.get_indexes(table)}
+    for name, columns in indexes.items():
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The app also runs create_all(), so the tables may already exist, but a
+    # database created before a column was added won't have that column
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    if "processing_jobs" not in tables:
+        op.create_table(
+            "processing_jobs",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("session_id", sa.Integer(), sa.ForeignKey("interview_sessions.id"), nullable=False),
+            sa.Column("stage", sa.String(), nullable=False),
+            sa.Column("status", sa.String(), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("max_attempts", sa.Integer(), nullable=False),
+            sa.Column("run_after", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column("locked_by", sa.String(), nullable=True),
+            sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+            *(column() for column in JOB_COLUMNS.values()),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        )
+    else:
+        existing = {column["name"] for column in inspector.get_columns("processing_jobs")}
+        for name, column in JOB_COLUMNS.items():
+            if name not in existing:
+                op.add_column("processing_jobs", column())
+    create_missing_indexes(sa.inspect(op.get_bind()), "processing_jobs", JOB_INDEXES)
+
+    if "result_cache" not in tables:
+        op.create_table(
+            "result_cache",
+            sa.Column("key", sa.String(length=64), primary_key=True),
+            sa.Column("kind", sa.String(), nullable=False),
+            sa.Column("value", sa.JSON(), nullable=False),
+            sa.Column("size_bytes", sa.Integer(), nullable=False),
+            sa.Column("hits", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column("last_used_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.Column("expires_at", sa.DateTime(), nullable=True),
+        )
+    create_missing_indexes(sa.inspect(op.get_bind()), "result_cache", CACHE_INDEXES)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("result_cache")
+    op.drop_table("processing_jobs")
@@ -0,0 +1,47 @@
+"""interview session listing indexes
+
+Revision ID: 5b1f0c2a9d34
+Revises: 2a7c9e5d1b60
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0c2a9d34'
+down_revision: Union[str, None] = '2a7c9e5d1b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_interview_sessions_interviewer_id": ["interviewer_id", "id"],
+    "ix_interview_sessions_interviewer_canceled": ["interviewer_id", "is_canceled", "id"],
+    "ix_interview_sessions_created_by": ["created_by", "id"],
+    "ix_interview_sessions_creator_canceled": ["created_by", "is_canceled", "id"],
+    "ix_interview_sessions_scheduled_time": ["scheduled_time"],
+}
+
+
+def existing_indexes() -> set:
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("interview_sessions")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The app also runs create_all(), so a fresh database may already have them
+    existing = existing_indexes()
+    for name, columns in INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "interview_sessions", columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = existing_indexes()
+    for name in INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name="interview_sessions")
@@ -0,0 +1,67 @@
+"""move transcripts and analyses to interview_artifacts
+
+Revision ID: 8d4e7a1c6f02
+Revises: 5b1f0c2a9d34
+Create Date: 2026-10-17 14:00:00.000000
+
+The old interview_sessions columns are emptied but not dropped: on SQLite
+that needs a table rebuild with foreign keys switched off, which can't be
+done inside the migration transaction. They are no longer mapped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4e7a1c6f02'
+down_revision: Union[str, None] = '5b1f0c2a9d34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARTIFACT_COLUMNS = ["transcript", "transcript_json", "ai_summary", "ai_detailed_analysis"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    # The app also runs create_all(), so the table may already exist
+    if "interview_artifacts" not in inspector.get_table_names():
+        op.create_table(
+            "interview_artifacts",
+            sa.Column("session_id", sa.Integer(), sa.ForeignKey("interview_sessions.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("transcript", sa.Text(), nullable=True),
+            sa.Column("transcript_json", sa.JSON(), nullable=True),
+            sa.Column("ai_summary", sa.Text(), nullable=True),
+            sa.Column("ai_detailed_analysis", sa.JSON(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        )
+
+    existing = {column["name"] for column in inspector.get_columns("interview_sessions")}
+    columns = [name for name in ARTIFACT_COLUMNS if name in existing]
+    if not columns:
+        return
+    names = ", ".join(columns)
+    stored = " OR ".join(f"{name} IS NOT NULL" for name in columns)
+    op.execute(
+        f"INSERT INTO interview_artifacts (session_id, {names}) "
+        f"SELECT id, {names} FROM interview_sessions WHERE ({stored}) "
+        f"AND id NOT IN (SELECT session_id FROM interview_artifacts)"
+    )
+    op.execute(f"UPDATE interview_sessions SET {', '.join(f'{name} = NULL' for name in columns)} WHERE {stored}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("interview_sessions")}
+    with op.batch_alter_table("interview_sessions") as batch:
+        for name, type_ in zip(ARTIFACT_COLUMNS, [sa.Text(), sa.JSON(), sa.Text(), sa.JSON()]):
+            if name not in existing:
+                batch.add_column(sa.Column(name, type_, nullable=True))
+    for name in ARTIFACT_COLUMNS:
+        op.execute(
+            f"UPDATE interview_sessions SET {name} = "
+            f"(SELECT {name} FROM interview_artifacts WHERE session_id = interview_sessions.id)"
+        )
+    op.drop_table("interview_artifacts")
@@ -0,0 +1,52 @@
+"""email outbox
+
+Revision ID: c3e9a47b2d18
+Revises: 8d4e7a1c6f02
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9a47b2d18'
+down_revision: Union[str, None] = '8d4e7a1c6f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The app also runs create_all(), so the table may already exist
+    if "email_outbox" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("session_id", sa.Integer(), sa.ForeignKey("interview_sessions.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("to_email", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("html_content", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("locked_by", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_email_outbox_id", "email_outbox", ["id"])
+    op.create_index("ix_email_outbox_session_id", "email_outbox", ["session_id"])
+    op.create_index("ix_email_outbox_claim", "email_outbox", ["status", "run_after"])
+    op.create_index("ix_email_outbox_sent_at", "email_outbox", ["sent_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("email_outbox")
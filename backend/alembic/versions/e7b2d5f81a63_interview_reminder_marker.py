@@ -0,0 +1,32 @@
+"""interview reminder marker
+
+Revision ID: e7b2d5f81a63
+Revises: c3e9a47b2d18
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d5f81a63'
+down_revision: Union[str, None] = 'c3e9a47b2d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all() creates the column only for new databases
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("interview_sessions")}
+    if "reminders_queued_at" not in existing:
+        op.add_column("interview_sessions", sa.Column("reminders_queued_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("interview_sessions") as batch:
+        batch.drop_column("reminders_queued_at")
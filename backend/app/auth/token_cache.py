@@ -0,0 +1,177 @@
+# app/auth/token_cache.py
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from ..models.user import User
+
+# Cache settings
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Detached snapshot of the user columns routes read from current_user"""
+    id: int
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    is_admin: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=bool(user.is_active),
+            is_admin=bool(user.is_admin),
+        )
+
+class TokenCache:
+    """
+    Bounded LRU map of bearer token -> AuthenticatedUser.
+
+    Entries expire after ttl_seconds or at the token's own `exp`, whichever
+    comes first. get_current_user runs on the threadpool, so access is
+    guarded by a lock.
+
+    The cache is per process. A committed change to a user drops its
+    entries here, but other workers and instances keep serving theirs
+    until they expire (at most ttl_seconds).
+
+    Readers take generation() before loading the user and pass it to
+    set(); an entry for a user invalidated since then is not stored, so a
+    request that read the row just before a commit can't re-cache it.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_MAX_SIZE, ttl_seconds: int = TOKEN_CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, AuthenticatedUser]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        # Invalidation counter, and the value it had at each user's last invalidation
+        self._generation = 0
+        self._invalidated: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Optional[AuthenticatedUser]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.time():
+                self._remove(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return principal
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def set(
+        self,
+        token: str,
+        principal: AuthenticatedUser,
+        exp: Optional[float] = None,
+        generation: Optional[int] = None
+    ):
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            if generation is not None and self._invalidated.get(principal.id, -1) > generation:
+                # The user changed after this snapshot was read
+                return
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (expires_at, principal)
+            self._tokens_by_user.setdefault(principal.id, set()).add(token)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: int):
+        """Drop every cached token belonging to a user"""
+        with self._lock:
+            self._generation += 1
+            self._invalidated.pop(user_id, None)
+            self._invalidated[user_id] = self._generation
+            # Only in-flight reads need the marker; keep the newest ones
+            while len(self._invalidated) > self.max_size:
+                del self._invalidated[next(iter(self._invalidated))]
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+            self._invalidated.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, token: str):
+        # Caller holds the lock
+        _, principal = self._entries.pop(token)
+        tokens = self._tokens_by_user.get(principal.id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[principal.id]
+
+token_cache = TokenCache()
+
+# Any ORM update or delete of a user (profile edits, deactivation, password
+# changes) drops that user's cached tokens once the transaction commits;
+# at flush time a concurrent request could still read and re-cache the old
+# row. Bulk UPDATE statements bypass these hooks and must call
+# token_cache.invalidate_user themselves after committing.
+PENDING_INVALIDATIONS = "token_cache_user_ids"
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_invalidation(mapper, connection, target):
+    session = object_session(target)
+    if session is None:
+        token_cache.invalidate_user(target.id)
+        return
+    session.info.setdefault(PENDING_INVALIDATIONS, set()).add(target.id)
+
+# AsyncSession runs on a sync Session, so these cover both
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for user_id in session.info.pop(PENDING_INVALIDATIONS, ()):
+        token_cache.invalidate_user(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop(PENDING_INVALIDATIONS, None)
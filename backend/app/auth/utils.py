@@ -2,12 +2,13 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from ..database import get_db
 from ..models.user import User
+from .token_cache import AuthenticatedUser, token_cache
+from .password_service import password_service
 import os
 
 # Get secret key from environment or use a default for development
@@ -15,7 +16,9 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-for-development")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Shares the configured bcrypt cost; request handlers should prefer the async
+# password_service so hashing stays off the serving threads
+pwd_context = password_service.context
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 
 def verify_password(plain_password, hashed_password):
@@ -35,11 +38,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    # Tokens verified earlier resolve without jwt.decode or a DB round trip
+    cached_user = token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    # Taken before the user is read; see TokenCache.set
+    generation = token_cache.generation()
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
@@ -48,6 +58,8 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     except JWTError:
         raise credentials_exception
     user = db.query(User).filter(User.email == email).first()
-    if user is None:
+    if user is None or not user.is_active:
         raise credentials_exception
-    return user
\ No newline at end of file
+    current_user = AuthenticatedUser.from_user(user)
+    token_cache.set(token, current_user, exp=payload.get("exp"), generation=generation)
+    return current_user
\ No newline at end of file
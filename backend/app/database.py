@@ -1,5 +1,7 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
@@ -12,18 +14,124 @@ else:
     DB_DIR = Path(__file__).resolve().parent.parent / "data"
     DB_DIR.mkdir(exist_ok=True)
 
-# Database URL
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_DIR}/interview_app.db"
-    
+# Database URL (DATABASE_URL wins; default is the local SQLite file)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL") or f"sqlite:///{DB_DIR}/interview_app.db"
+# Handle Heroku/Render style PostgreSQL URLs, and pin the driver to psycopg 3
+# (requirements.txt) whatever SQLAlchemy's default is
+if SQLALCHEMY_DATABASE_URL.startswith("postgres://"):
+    SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgres://", "postgresql://", 1)
+if SQLALCHEMY_DATABASE_URL.startswith("postgresql://"):
+    SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
+
+# Connection pool settings (server databases and file-backed SQLite)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds, -1 disables
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# SQLite tuning, applied on every new DBAPI connection
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+}
+
+def to_async_url(url: str) -> str:
+    """Map a sync database URL onto its asyncio driver (aiosqlite / asyncpg)"""
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    if url.startswith(("postgresql://", "postgresql+psycopg://")):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    return url
+
+ASYNC_SQLALCHEMY_DATABASE_URL = to_async_url(SQLALCHEMY_DATABASE_URL)
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+def _engine_options(url: str, overrides: dict) -> dict:
+    """Build create_engine kwargs for a URL; explicit overrides win"""
+    parsed = make_url(url)
+    options = {}
+    if parsed.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if not _is_memory_sqlite(parsed):
+        # In-memory SQLite uses a singleton/static pool that takes none of these
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    options.update(overrides)
+    return options
+
+def apply_sqlite_pragmas(sync_engine, pragmas: dict = None):
+    """Register a connect hook that applies PRAGMAs to each new SQLite connection"""
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+    memory_db = _is_memory_sqlite(sync_engine.url)
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            # WAL needs a real file; :memory: databases only support MEMORY/OFF
+            if name == "journal_mode" and memory_db:
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def _missing_driver(error: ModuleNotFoundError, url: str) -> RuntimeError:
+    backend = make_url(url).get_backend_name()
+    return RuntimeError(
+        f"The {backend} database driver '{error.name}' is not installed; "
+        f"install the drivers listed in requirements.txt"
+    )
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, tune_sqlite: bool = True, **overrides):
+    """Create a sync engine honoring the pool settings and SQLite PRAGMAs"""
+    try:
+        db_engine = create_engine(url, **_engine_options(url, overrides))
+    except ModuleNotFoundError as e:
+        raise _missing_driver(e, url) from e
+    if tune_sqlite and db_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(db_engine)
+    return db_engine
+
+def create_async_db_engine(url: str = ASYNC_SQLALCHEMY_DATABASE_URL, tune_sqlite: bool = True, **overrides):
+    """Async counterpart of create_db_engine"""
+    options = _engine_options(url, overrides)
+    # aiosqlite runs each connection on its own thread already
+    options.get("connect_args", {}).pop("check_same_thread", None)
+    try:
+        db_engine = create_async_engine(url, **options)
+    except ModuleNotFoundError as e:
+        raise _missing_driver(e, url) from e
+    if tune_sqlite and db_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(db_engine.sync_engine)
+    return db_engine
+
 # Create SQLAlchemy engine and session
 # Create engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+engine = create_db_engine()
+
+# Async engine used by the async routes (signaling, interview scheduling)
+async_engine = create_async_db_engine()
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factory; expire_on_commit=False so attributes stay readable
+# after commit without an implicit (blocking) refresh
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -33,4 +141,14 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Dependency to get an async DB session (for async def routes)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Dependency for code that opens its own short-lived sessions (e.g. a WebSocket
+# check that mustn't hold a connection for the socket's lifetime)
+def get_async_session_factory():
+    return AsyncSessionLocal
@@ -0,0 +1,48 @@
+# backend/app/lazy.py
+"""
+Deferred imports for modules that are slow to load or need credentials.
+
+    ai_analysis = lazy_import("app.services.ai_analysis")
+    ...
+    ai_analysis.stream_analysis(...)  # imported here, on first use
+
+The module is imported on the first attribute access and cached; later
+accesses go straight to it. Processes that never use it (an API instance
+that doesn't serve analysis, a worker without the routes) never pay for
+it at startup.
+"""
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class LazyModule:
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                started = time.perf_counter()
+                self._module = importlib.import_module(self._name)
+                logger.info(f"Loaded {self._name} in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return self._module
+
+    def __getattr__(self, attr):
+        # Only called for names not set in __init__, i.e. the module's own
+        return getattr(self._module or self._load(), attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}{'' if self.loaded else ' (not loaded)'}>"
+
+def lazy_import(name: str) -> LazyModule:
+    """A module proxy that imports ``name`` (absolute) on first use"""
+    return LazyModule(name)
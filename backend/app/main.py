@@ -1,22 +1,28 @@
 # app/main.py
+from .startup_profile import startup_profile
+startup_profile.install()  # Times the imports below when STARTUP_PROFILE=true
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pathlib import Path
 import logging
 import os
-import subprocess  # Add this import for subprocess.run
+import asyncio
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import database models
-from .database import engine, Base
-from .models import interview, user  # Import all model modules
-from .routers import interviews, signaling, auth,notification  # Import all routers
-
-# Create tables directly (fallback method)
-Base.metadata.create_all(bind=engine)
+from .database import SQLALCHEMY_DATABASE_URL
+from .models import interview, user, job, cache, outbox  # Import all model modules
+from .routers import interviews, signaling, auth,notification, webhooks  # Import all routers
+from .auth.password_service import password_service
+from .services.http_clients import http_clients
+from .services.recordings import RECORDINGS_DIR  # Creates the recordings directory
+from .services.email_templates import load_templates
+from .services.transcript_completion import check_webhook_config
+from .responses import ORJSONResponse
+from .migrations import run_migrations
 
 # Define origins for CORS
 origins = [
@@ -35,46 +41,54 @@ app = FastAPI(
     title="AI Interview Co-Pilot API",
     description="API for recording, transcribing, and analyzing interviews",
     version="0.1.0",
+    # orjson for every JSON response (standard encoder if orjson is missing)
+    default_response_class=ORJSONResponse,
 )
 
 # Get environment variables
-database_url = os.getenv("DATABASE_URL")
 jwt_secret = os.getenv("JWT_SECRET_KEY")
 
-# Create recordings directory if it doesn't exist
-RECORDINGS_DIR = Path(__file__).resolve().parent.parent / "recordings"
-RECORDINGS_DIR.mkdir(exist_ok=True)
-
-# Run migrations on startup
-def run_migrations():
-    try:
-        alembic_dir = Path(__file__).resolve().parent.parent / "alembic"
-        if alembic_dir.exists():
-            logger.info("Running database migrations with Alembic...")
-            result = subprocess.run(
-                ["alembic", "upgrade", "head"], 
-                cwd=Path(__file__).resolve().parent.parent,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                logger.error(f"Alembic migration failed: {result.stderr}")
-                logger.info("Falling back to direct table creation...")
-                Base.metadata.create_all(bind=engine)
-            else:
-                logger.info("Alembic migrations completed successfully")
-        else:
-            logger.info("Alembic directory not found, using direct table creation...")
-            Base.metadata.create_all(bind=engine)
-    except Exception as e:
-        logger.error(f"Error during migrations: {str(e)}")
-        logger.info("Falling back to direct table creation...")
-        Base.metadata.create_all(bind=engine)
+# Run the pipeline worker inside this process (single-instance deployments)
+RUN_EMBEDDED_WORKER = os.getenv("RUN_EMBEDDED_WORKER", "false").lower() == "true"
+# Deliver the email outbox from this process (single-instance deployments). Off by
+# default: the rate limit is per process, so every API worker sending would multiply it
+RUN_EMBEDDED_MAIL_WORKER = os.getenv("RUN_EMBEDDED_MAIL_WORKER", "false").lower() == "true"
 
 # Register the startup event
 @app.on_event("startup")
 async def startup_event():
-    run_migrations()
+    # HTTP clients for AI services are created on first use (services/http_clients.py)
+    check_webhook_config()
+    with startup_profile.step("migrations"):
+        run_migrations()
+    with startup_profile.step("email templates"):
+        load_templates()
+    with startup_profile.step("signaling"):
+        await signaling.manager.start()
+    if RUN_EMBEDDED_WORKER:
+        with startup_profile.step("pipeline worker"):
+            # Imported here so the API doesn't need AI credentials unless it runs jobs
+            from .workers.pipeline_worker import PipelineWorker
+            app.state.pipeline_worker = PipelineWorker()
+            app.state.pipeline_worker_task = asyncio.create_task(app.state.pipeline_worker.run())
+    if RUN_EMBEDDED_MAIL_WORKER:
+        with startup_profile.step("mail worker"):
+            from .workers.mail_worker import MailWorker
+            app.state.mail_worker = MailWorker()
+            app.state.mail_worker_task = asyncio.create_task(app.state.mail_worker.run())
+    startup_profile.report()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if RUN_EMBEDDED_WORKER:
+        app.state.pipeline_worker.stop()
+        await app.state.pipeline_worker_task
+    if RUN_EMBEDDED_MAIL_WORKER:
+        app.state.mail_worker.stop()
+        await app.state.mail_worker_task
+    await signaling.manager.close()
+    await http_clients.shutdown()
+    password_service.shutdown()
 
 # Configure CORS
 app.add_middleware(
@@ -90,6 +104,7 @@ app.include_router(auth.router)
 app.include_router(interviews.router)
 app.include_router(notification.router)
 app.include_router(signaling.router)  # If you have this router
+app.include_router(webhooks.router)
 
 @app.get("/")
 def read_root():
@@ -100,7 +115,7 @@ def read_root():
 def test_env():
     # Create a settings class or import it if you have one
     class Settings:
-        DATABASE_URL = database_url or "sqlite:///./data/interview_app.db"
+        DATABASE_URL = SQLALCHEMY_DATABASE_URL
         JWT_ALGORITHM = "HS256"
         EMAIL_HOST = os.getenv("EMAIL_HOST", "")
         EMAIL_USERNAME = os.getenv("EMAIL_USERNAME", "")
@@ -0,0 +1,236 @@
+# backend/app/migrations.py
+"""
+Schema migrations at startup, in-process.
+
+run_migrations() is called by every API process as it starts, often
+several at once (uvicorn workers, autoscaled instances). It first compares
+the revisions stamped in alembic_version with the head revision(s) of
+alembic/versions. That check doesn't import Alembic, which costs a few
+hundred ms (mako and pygments come with it): the scripts' ``revision`` and
+``down_revision`` assignments are read with ast, and the stamp with one
+SELECT. At head, which is every start but the first after a deploy, that
+is all it does.
+
+Otherwise it takes a cross-process lock (pg_advisory_lock on PostgreSQL, a
+file lock next to the database elsewhere), checks again, since another
+process may have migrated while it waited, and runs Alembic through its
+API. A database with no tables at all is built with create_all() and
+stamped at head instead of replaying every migration. A database that
+has tables but was never stamped (created before Alembic was used) is
+upgraded from the base revision; if its schema doesn't match that, the
+error is logged with what to do and the app starts without migrating.
+"""
+import ast
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Set
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+
+from .database import Base, engine
+from . import models  # noqa: F401  (registers every table on Base.metadata)
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+ALEMBIC_INI = BACKEND_DIR / "alembic.ini"
+ALEMBIC_DIR = BACKEND_DIR / "alembic"
+VERSIONS_DIR = ALEMBIC_DIR / "versions"
+
+# How long a process waits for another one's migration before giving up
+MIGRATION_LOCK_TIMEOUT_SECONDS = float(os.getenv("MIGRATION_LOCK_TIMEOUT_SECONDS", "300"))
+MIGRATION_LOCK_POLL_SECONDS = 0.1
+# pg_advisory_lock key; the same for every instance of the app
+MIGRATION_LOCK_KEY = int(os.getenv("MIGRATION_LOCK_KEY", "5081972"))
+
+def _revision_ids(path: Path) -> dict:
+    """Module-level revision/down_revision literals of a migration script"""
+    values = {}
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target, value = node.targets[0], node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target, value = node.target, node.value
+        else:
+            continue
+        if isinstance(target, ast.Name) and target.id in ("revision", "down_revision"):
+            values[target.id] = ast.literal_eval(value)
+    return values
+
+def script_heads() -> Optional[Set[str]]:
+    """Head revision(s) of the migration scripts, or None if they can't be read"""
+    revisions, parents = set(), set()
+    try:
+        for path in VERSIONS_DIR.glob("*.py"):
+            if path.name == "__init__.py":
+                continue
+            values = _revision_ids(path)
+            # Alembic skips files without a revision too
+            if "revision" not in values:
+                continue
+            down_revision = values.get("down_revision")
+            if not isinstance(values["revision"], str):
+                return None
+            if isinstance(down_revision, str):
+                parents.add(down_revision)
+            elif isinstance(down_revision, (tuple, list)):
+                parents.update(down_revision)
+            elif down_revision is not None:
+                return None
+            revisions.add(values["revision"])
+    except (OSError, SyntaxError, ValueError):
+        return None
+    return revisions - parents or None
+
+def stamped_revisions(connection) -> Set[str]:
+    """Revisions recorded in the database (empty if it was never migrated)"""
+    if not inspect(connection).has_table("alembic_version"):
+        return set()
+    return set(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+
+def schema_is_current() -> bool:
+    heads = script_heads()
+    if heads is None:
+        return False
+    with engine.connect() as connection:
+        return stamped_revisions(connection) == heads
+
+def _wait_for(try_acquire, what: str):
+    deadline = time.monotonic() + MIGRATION_LOCK_TIMEOUT_SECONDS
+    while not try_acquire():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Gave up waiting for {what} after {MIGRATION_LOCK_TIMEOUT_SECONDS:.0f}s")
+        time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+
+@contextmanager
+def _advisory_lock():
+    """Session-level PostgreSQL advisory lock, held on its own connection"""
+    with engine.connect() as connection:
+        def try_lock():
+            return connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}).scalar()
+        _wait_for(try_lock, "the migration advisory lock")
+        connection.commit()
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            connection.commit()
+
+def lock_path() -> Path:
+    """Lock file next to a SQLite database, else one per database URL in the temp dir"""
+    url = engine.url
+    if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+        database = Path(url.database).resolve()
+        return database.with_name(f"{database.name}.migrate.lock")
+    digest = hashlib.sha1(url.render_as_string(hide_password=False).encode()).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"interview-app-{digest}.migrate.lock"
+
+@contextmanager
+def _file_lock(path: Path):
+    """Exclusive lock on a file; the OS releases it if the process dies"""
+    with open(path, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            def try_lock():
+                handle.seek(0)
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                    return True
+                except OSError:
+                    return False
+
+            def unlock():
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            def try_lock():
+                try:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return True
+                except BlockingIOError:
+                    return False
+
+            def unlock():
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+        _wait_for(try_lock, f"the migration lock {path}")
+        try:
+            yield
+        finally:
+            unlock()
+
+def migration_lock():
+    """Cross-process lock around migrating this database"""
+    if engine.url.get_backend_name() == "postgresql":
+        return _advisory_lock()
+    return _file_lock(lock_path())
+
+def alembic_config():
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    # env.py would otherwise replace the app's logging with alembic.ini's
+    config.attributes["configure_logger"] = False
+    return config
+
+def _migrate() -> bool:
+    """Create or upgrade the schema; False if an unstamped database couldn't be upgraded"""
+    from alembic import command
+
+    with engine.connect() as connection:
+        fresh = not inspect(connection).get_table_names()
+        legacy = not fresh and not stamped_revisions(connection)
+    # The migrations expect the base tables to exist; on a new database this
+    # builds the whole current schema
+    Base.metadata.create_all(bind=engine)
+    if fresh:
+        command.stamp(alembic_config(), "head")
+        return True
+    try:
+        command.upgrade(alembic_config(), "head")
+    except DBAPIError as e:
+        if not legacy:
+            raise
+        # Revisions that did apply stay applied (the migrations are idempotent),
+        # but the database is left unstamped so every start reports this again
+        with engine.begin() as connection:
+            connection.execute(text("DELETE FROM alembic_version"))
+        logger.error(
+            f"The database at {engine.url.render_as_string(hide_password=True)} has no Alembic revision "
+            f"and its schema doesn't match the base revision, so it can't be migrated ({e.orig}). "
+            "Back it up and recreate it (a SQLite file can simply be removed; it is rebuilt at startup), "
+            "or bring its schema to the base revision and run `alembic stamp` by hand."
+        )
+        return False
+    return True
+
+def run_migrations() -> bool:
+    """Bring the schema up to date; returns True if this process migrated it"""
+    if not ALEMBIC_DIR.exists():
+        logger.info("Alembic directory not found, using direct table creation...")
+        Base.metadata.create_all(bind=engine)
+        return True
+    if schema_is_current():
+        logger.info("Database schema is at the latest revision; skipping migrations")
+        return False
+
+    with migration_lock():
+        if schema_is_current():
+            logger.info("Database schema was migrated by another process")
+            return False
+        started = time.perf_counter()
+        logger.info("Running database migrations with Alembic...")
+        if not _migrate():
+            return False
+        logger.info(f"Database migrations completed in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
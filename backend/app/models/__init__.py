@@ -1,2 +1,5 @@
-from .interview import InterviewSession
-from .user import User
\ No newline at end of file
+from .interview import InterviewSession, InterviewArtifacts
+from .user import User
+from .job import ProcessingJob
+from .cache import CachedResult
+from .outbox import OutboundEmail
\ No newline at end of file
@@ -0,0 +1,25 @@
+# app/models/cache.py
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from ..database import Base
+
+class CachedResult(Base):
+    """A provider result (transcript or AI analysis) stored under a content hash"""
+    __tablename__ = "result_cache"
+
+    # SHA-256 of the inputs (recording bytes, or prompt + model parameters)
+    key = Column(String(64), primary_key=True)
+    # "transcript" or "analysis"
+    kind = Column(String, nullable=False)
+    value = Column(JSON, nullable=False)
+    size_bytes = Column(Integer, nullable=False, default=0)
+
+    hits = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, server_default=func.now())
+    last_used_at = Column(DateTime, nullable=False, server_default=func.now())
+    expires_at = Column(DateTime, nullable=True, index=True)
+
+    __table_args__ = (
+        # Least-recently-used eviction scans per kind
+        Index("ix_result_cache_kind_last_used", "kind", "last_used_at"),
+    )
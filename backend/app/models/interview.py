@@ -1,5 +1,5 @@
 # app/models/interview.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -30,13 +30,11 @@ class InterviewSession(Base):
     scheduled_time = Column(DateTime, nullable=True)
     is_completed = Column(Boolean, default=False)
     is_canceled = Column(Boolean, default=False)
+    # Set when the scheduler queued the reminder emails (in the same transaction)
+    reminders_queued_at = Column(DateTime, nullable=True)
     
-    # Recording and analysis fields
+    # Recording (the transcript and analysis live in InterviewArtifacts)
     recording_path = Column(String, nullable=True)
-    transcript = Column(Text, nullable=True)
-    ai_summary = Column(Text, nullable=True)
-    ai_detailed_analysis = Column(JSON, nullable=True)
-    transcript_json = Column(JSON, nullable=True)
     
     # Feedback field
     feedback = Column(Text, nullable=True)
@@ -52,4 +50,29 @@ class InterviewSession(Base):
     # Relationships
     interviewer = relationship("User", back_populates="interviews_as_interviewer", foreign_keys=[interviewer_id])
     candidate = relationship("User", back_populates="interviews_as_candidate", foreign_keys=[candidate_id])
-    creator = relationship("User", back_populates="created_interviews", foreign_keys=[created_by])
\ No newline at end of file
+    creator = relationship("User", back_populates="created_interviews", foreign_keys=[created_by])
+
+    __table_args__ = (
+        # Keyset-paginated listings per owner (newest first), all sessions or by
+        # canceled/not; completion and date filters are applied along the scan
+        Index("ix_interview_sessions_interviewer_id", "interviewer_id", "id"),
+        Index("ix_interview_sessions_interviewer_canceled", "interviewer_id", "is_canceled", "id"),
+        Index("ix_interview_sessions_created_by", "created_by", "id"),
+        Index("ix_interview_sessions_creator_canceled", "created_by", "is_canceled", "id"),
+        # Date-range scans (reminders)
+        Index("ix_interview_sessions_scheduled_time", "scheduled_time"),
+    )
+
+class InterviewArtifacts(Base):
+    """
+    Transcript and AI analysis for a session. Kept out of interview_sessions
+    so listing and scheduling queries never read megabytes of text per row.
+    """
+    __tablename__ = "interview_artifacts"
+
+    session_id = Column(Integer, ForeignKey("interview_sessions.id", ondelete="CASCADE"), primary_key=True)
+    transcript = Column(Text, nullable=True)
+    transcript_json = Column(JSON, nullable=True)
+    ai_summary = Column(Text, nullable=True)
+    ai_detailed_analysis = Column(JSON, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,49 @@
+# app/models/job.py
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from ..database import Base
+
+class ProcessingJob(Base):
+    """A unit of background work (transcription or analysis) for one interview"""
+    __tablename__ = "processing_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("interview_sessions.id"), nullable=False, index=True)
+
+    # Pipeline stage: "transcription" or "analysis"
+    stage = Column(String, nullable=False)
+    # queued -> running -> succeeded | failed (running jobs go back to queued on retry);
+    # cancelled when a newer job for the same stage replaces it
+    status = Column(String, nullable=False, default="queued")
+
+    # Retry bookkeeping
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime, nullable=False, server_default=func.now())
+    last_error = Column(Text, nullable=True)
+
+    # Lease held by the worker running the job; an expired lease means the
+    # worker died and the job can be picked up again
+    locked_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    # Provider-side handle (AssemblyAI transcript id) so a retried or resumed
+    # job waits on the existing transcript instead of re-uploading, plus the
+    # last status delivered by the provider's webhook
+    external_id = Column(String, nullable=True, index=True)
+    external_status = Column(String, nullable=True)
+
+    # Skip the result cache and go to the providers (user asked for a fresh run)
+    bypass_cache = Column(Boolean, nullable=False, default=False)
+
+    # Timestamps
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    session = relationship("InterviewSession")
+
+    __table_args__ = (
+        # Serves the worker's "next due job for this stage" claim query
+        Index("ix_processing_jobs_claim", "stage", "status", "run_after"),
+    )
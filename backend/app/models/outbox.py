@@ -0,0 +1,40 @@
+# app/models/outbox.py
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from ..database import Base
+
+class OutboundEmail(Base):
+    """An email waiting for (or done with) delivery by the mail worker"""
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # The interview it is about, if any (kept when the interview is deleted)
+    session_id = Column(Integer, ForeignKey("interview_sessions.id", ondelete="SET NULL"), nullable=True, index=True)
+
+    to_email = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html_content = Column(Text, nullable=False)
+
+    # queued -> sending -> sent | failed (sending goes back to queued on retry)
+    status = Column(String, nullable=False, default="queued")
+
+    # Retry bookkeeping
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=6)
+    run_after = Column(DateTime, nullable=False, server_default=func.now())
+    last_error = Column(Text, nullable=True)
+
+    # Lease held by the sender that claimed the message
+    locked_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    sent_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # The sender's "next due messages" claim query
+        Index("ix_email_outbox_claim", "status", "run_after"),
+        # Messages sent in the last day, for EMAIL_DAILY_LIMIT
+        Index("ix_email_outbox_sent_at", "sent_at"),
+    )
@@ -29,4 +29,11 @@ class User(Base):
         back_populates="candidate",
         foreign_keys="InterviewSession.candidate_id",
         cascade="all, delete-orphan"
+    )
+    
+    # One-to-many relationship with interviews (as creator)
+    created_interviews = relationship(
+        "InterviewSession",
+        back_populates="creator",
+        foreign_keys="InterviewSession.created_by"
     )
\ No newline at end of file
@@ -0,0 +1,65 @@
+# app/responses.py
+"""
+JSON responses and ?fields= projection for the API.
+
+ORJSONResponse is the app-wide default response class (see main.py).
+Routes whose payload is already plain JSON data return
+``json_response(...)`` themselves, so FastAPI skips response-model
+validation and serialization of every nested value. JSON columns read as
+their stored text are wrapped with ``raw_json`` and embedded as-is, never
+decoded and re-encoded.
+"""
+import json
+from typing import Any, Iterable, Optional, Set
+
+from fastapi import HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the standard encoder
+    orjson = None
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson (datetimes, UUIDs and dataclasses natively)"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+def raw_json(text: Optional[str]) -> Any:
+    """Embed already-encoded JSON in an ORJSONResponse (parsed if orjson can't)"""
+    if text is None:
+        return None
+    if orjson is not None and hasattr(orjson, "Fragment"):
+        return orjson.Fragment(text)
+    return json.loads(text)
+
+def json_response(content: Any, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    return ORJSONResponse(content, status_code=status_code)
+
+def fields_query(
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return")
+) -> Optional[Set[str]]:
+    """Dependency: the requested field names, or None for all of them"""
+    if not fields:
+        return None
+    return {name.strip() for name in fields.split(",") if name.strip()} or None
+
+def check_fields(fields: Optional[Set[str]], available: Iterable[str]):
+    """400 for field names the endpoint doesn't have"""
+    if fields is None:
+        return
+    unknown = fields.difference(available)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+
+def project(payload: dict, fields: Optional[Set[str]]) -> dict:
+    if fields is None:
+        return payload
+    return {key: value for key, value in payload.items() if key in fields}
@@ -1,14 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, File, Header, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import false, insert, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ValidationError
 from datetime import datetime
+import json
+import logging
 
-from ..database import get_db
+from ..database import AsyncSessionLocal, get_async_db
 from ..models.interview import InterviewSession
 from ..models.user import User
 from ..auth.utils import get_current_user
-from ..services.email_service import send_interview_invitation
+from ..services.email_service import interview_invitations, send_interview_invitation
+from ..services.email_outbox import queue_many
+from ..services.job_queue import enqueue_job
+from ..services import bulk_import, recordings
+from ..services.artifacts import ARTIFACT_FIELDS, JSON_FIELDS, get_artifacts, load_stored_fields
+from ..responses import check_fields, fields_query, json_response, project, raw_json
+from ..lazy import lazy_import
+
+# Loaded on the first analysis stream rather than at startup
+ai_analysis = lazy_import("app.services.ai_analysis")
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/interviews", tags=["interviews"])
 
@@ -22,11 +37,13 @@ class InterviewCreate(BaseModel):
     candidate_email: Optional[EmailStr] = None
     scheduled_time: Optional[datetime] = None
 
+def interview_link(session_id: int) -> str:
+    return f"https://your-frontend-url.com/interview/{session_id}"
+
 @router.post("/", response_model=dict)
 async def create_interview(
     interview: InterviewCreate,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
@@ -44,21 +61,22 @@ async def create_interview(
         )
         
         db.add(new_session)
-        db.commit()
-        db.refresh(new_session)
+        await db.flush()
 
-        # Send email if candidate email is provided
+        # Queue the invitation in the same transaction if candidate email is provided
         if interview.candidate_email and interview.scheduled_time:
-            interview_link = f"https://your-frontend-url.com/interview/{new_session.id}"
             send_interview_invitation(
-                background_tasks=background_tasks,
+                db,
                 to_email=interview.candidate_email,
                 candidate_name=interview.candidate_name,
                 interviewer_name=interview.interviewer_name,
                 interview_topic=interview.interview_topic,
-                scheduled_time=interview.scheduled_time.strftime("%Y-%m-%d %H:%M"),
-                interview_link=interview_link
+                scheduled_time=interview.scheduled_time,
+                interview_link=interview_link(new_session.id),
+                session_id=new_session.id
             )
+        await db.commit()
+        await db.refresh(new_session)
 
         return {
             "message": "Interview scheduled successfully",
@@ -67,8 +85,459 @@ async def create_interview(
         }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to schedule interview: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+def validation_messages(error: ValidationError) -> list:
+    return [
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    ]
+
+@router.post("/bulk", response_model=dict)
+async def create_interviews_bulk(
+    request: Request,
+    atomic: bool = Query(False, description="Schedule nothing if any row is invalid"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Schedule many interviews in one request.
+
+    The body is a JSON array, CSV with a header row of InterviewCreate
+    field names, or NDJSON; directly or as a multipart "file" upload. Rows
+    are validated as they are read. The valid ones are inserted with one
+    executemany INSERT and their invitations queued in the same
+    transaction. Results are per row (1-based): an id, or the errors.
+    """
+    results, valid = [], []
+    try:
+        async for row, record in bulk_import.request_records(request):
+            if isinstance(record, str):
+                results.append({"row": row, "errors": [record]})
+                continue
+            try:
+                valid.append((row, InterviewCreate.model_validate(record)))
+            except ValidationError as e:
+                results.append({"row": row, "errors": validation_messages(e)})
+    except bulk_import.BulkImportError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    failed = len(results)
+    if atomic and failed:
+        return json_response(
+            {"created": 0, "failed": failed, "invitations_queued": 0, "results": results},
+            status_code=422
+        )
+
+    session_ids, invitations = [], []
+    if valid:
+        try:
+            result = await db.execute(
+                insert(InterviewSession).returning(InterviewSession.id, sort_by_parameter_order=True),
+                [{**interview.model_dump(), "interviewer_id": current_user.id} for _, interview in valid]
+            )
+            session_ids = result.scalars().all()
+            invitations = interview_invitations([
+                {
+                    "session_id": session_id,
+                    "to_email": interview.candidate_email,
+                    "candidate_name": interview.candidate_name,
+                    "interviewer_name": interview.interviewer_name,
+                    "interview_topic": interview.interview_topic,
+                    "scheduled_time": interview.scheduled_time,
+                    "interview_link": interview_link(session_id),
+                }
+                for (_, interview), session_id in zip(valid, session_ids)
+                if interview.candidate_email and interview.scheduled_time
+            ])
+            await queue_many(db, invitations)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to schedule interviews: {str(e)}"
+            )
+
+    results.extend({"row": row, "id": session_id} for (row, _), session_id in zip(valid, session_ids))
+    results.sort(key=lambda item: item["row"])
+    logger.info(f"User {current_user.id} bulk-scheduled {len(session_ids)} interview(s), {failed} row(s) rejected")
+    return json_response({
+        "created": len(session_ids),
+        "failed": failed,
+        "invitations_queued": len(invitations),
+        "results": results,
+    })
+
+async def get_owned_session(db: AsyncSession, interview_id: int, current_user) -> InterviewSession:
+    """Load an interview the current user scheduled or conducts, else 404/403"""
+    interview = await db.get(InterviewSession, interview_id)
+    if interview is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Interview not found")
+    if current_user.id not in (interview.interviewer_id, interview.created_by):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this interview")
+    return interview
+
+# Listing: newest first, keyset-paginated on id. Only summary columns are
+# read; transcripts and analyses come from the detail route
+LIST_PAGE_SIZE = 20
+LIST_MAX_PAGE_SIZE = 100
+LIST_COLUMNS = (
+    InterviewSession.id,
+    InterviewSession.interviewer_name,
+    InterviewSession.candidate_name,
+    InterviewSession.candidate_email,
+    InterviewSession.interview_topic,
+    InterviewSession.candidate_level,
+    InterviewSession.scheduled_time,
+    InterviewSession.is_completed,
+    InterviewSession.is_canceled,
+    InterviewSession.is_processing,
+    InterviewSession.created_at,
+)
+LIST_STATUSES = ("active", "upcoming", "past", "completed", "canceled")
+DETAIL_FIELDS = tuple(column.key for column in InterviewSession.__table__.columns) + ARTIFACT_FIELDS
+TRANSCRIPT_FIELDS = ("id", "is_processing", "error_message", "transcript", "transcript_json")
+
+def status_conditions(state: Optional[str], now: datetime) -> list:
+    if state is None:
+        return []
+    if state == "canceled":
+        return [InterviewSession.is_canceled == true()]
+    conditions = [InterviewSession.is_canceled == false()]
+    if state == "active":
+        conditions.append(InterviewSession.is_completed == false())
+    elif state == "upcoming":
+        conditions += [InterviewSession.is_completed == false(), InterviewSession.scheduled_time > now]
+    elif state == "completed":
+        conditions.append(InterviewSession.is_completed == true())
+    elif state == "past":
+        conditions.append(or_(
+            InterviewSession.is_completed == true(),
+            InterviewSession.scheduled_time <= now,
+            InterviewSession.scheduled_time.is_(None),
+        ))
+    return conditions
+
+async def list_owned_sessions(
+    db: AsyncSession,
+    user_id: int,
+    state: Optional[str] = None,
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    limit: int = LIST_PAGE_SIZE,
+    columns: tuple = LIST_COLUMNS,
+) -> tuple:
+    """
+    One page of the user's interviews, newest first: (rows, next_cursor).
+
+    Each owner column is queried separately so both walk an (owner, ..., id)
+    index in order and stop after ``limit`` rows; an OR across the two
+    columns would sort every session the user owns on every page.
+    """
+    conditions = status_conditions(state, datetime.utcnow())
+    if scheduled_from is not None:
+        conditions.append(InterviewSession.scheduled_time >= scheduled_from)
+    if scheduled_to is not None:
+        conditions.append(InterviewSession.scheduled_time < scheduled_to)
+    if before_id is not None:
+        conditions.append(InterviewSession.id < before_id)
+
+    rows = {}
+    for owner in (InterviewSession.interviewer_id, InterviewSession.created_by):
+        result = await db.execute(
+            select(*columns)
+            .where(owner == user_id, *conditions)
+            .order_by(InterviewSession.id.desc())
+            .limit(limit + 1)
+        )
+        for row in result:
+            rows[row.id] = row
+    page = sorted(rows.values(), key=lambda row: row.id, reverse=True)
+    next_cursor = str(page[limit - 1].id) if len(page) > limit else None
+    return page[:limit], next_cursor
+
+async def stored_artifacts(db: AsyncSession, interview_id: int, fields) -> dict:
+    """Artifact fields for a response, JSON columns passed through as stored"""
+    values = await load_stored_fields(db, interview_id, fields)
+    for field in JSON_FIELDS:
+        if field in values:
+            values[field] = raw_json(values[field])
+    return values
+
+@router.get("/", response_model=dict)
+async def list_interviews(
+    state: Optional[str] = Query(None, alias="status", description="active, upcoming, past, completed or canceled"),
+    scheduled_from: Optional[datetime] = None,
+    scheduled_to: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(LIST_PAGE_SIZE, ge=1, le=LIST_MAX_PAGE_SIZE),
+    fields: Optional[set] = Depends(fields_query),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Interviews the current user conducts or scheduled; pass ``next_cursor``
+    back as ``cursor``. ``fields`` limits the columns read (id is always included).
+    """
+    if state is not None and state not in LIST_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"status must be one of: {', '.join(LIST_STATUSES)}"
+        )
+    if cursor is not None and not cursor.isdigit():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    check_fields(fields, (column.key for column in LIST_COLUMNS))
+    columns = tuple(
+        column for column in LIST_COLUMNS
+        if fields is None or column.key in fields or column.key == "id"
+    )
+
+    rows, next_cursor = await list_owned_sessions(
+        db, current_user.id, state, scheduled_from, scheduled_to,
+        int(cursor) if cursor is not None else None, limit, columns
+    )
+    return json_response({
+        "items": [dict(row._mapping) for row in rows],
+        "next_cursor": next_cursor
+    })
+
+@router.get("/{interview_id}", response_model=dict)
+async def get_interview(
+    interview_id: int,
+    fields: Optional[set] = Depends(fields_query),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """The interview with its transcript and analysis; ``fields`` selects a subset"""
+    check_fields(fields, DETAIL_FIELDS)
+    interview = await get_owned_session(db, interview_id, current_user)
+    payload = {column.key: getattr(interview, column.key) for column in InterviewSession.__table__.columns}
+    # The artifacts row is only read when one of its fields is wanted
+    wanted = ARTIFACT_FIELDS if fields is None else fields.intersection(ARTIFACT_FIELDS)
+    if wanted:
+        payload.update(await stored_artifacts(db, interview.id, wanted))
+    return json_response(project(payload, fields))
+
+@router.post("/{interview_id}/analyze", response_model=dict)
+async def request_analysis(
+    interview_id: int,
+    retranscribe: bool = False,
+    bypass_cache: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Queue transcription (if needed) and AI analysis for a recorded interview.
+
+    Results for unchanged inputs come from the result cache unless
+    ``bypass_cache`` is set.
+    """
+    interview = await get_owned_session(db, interview_id, current_user)
+    artifacts = await get_artifacts(db, interview.id)
+
+    if artifacts and artifacts.transcript and not retranscribe:
+        stage = "analysis"
+    elif interview.recording_path:
+        stage = "transcription"
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No recording has been uploaded for this interview"
+        )
+
+    job = await enqueue_job(db, interview.id, stage, bypass_cache=bypass_cache)
+    await db.commit()
+
+    return {
+        "message": f"{stage.capitalize()} queued",
+        "job_id": job.id,
+        "stage": stage,
+        "status": job.status
+    }
+
+@router.get("/{interview_id}/transcript", response_model=dict)
+async def get_transcript(
+    interview_id: int,
+    fields: Optional[set] = Depends(fields_query),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Transcript plus processing status, polled by the review page.
+    ``fields=is_processing,error_message`` polls without reading the transcript.
+    """
+    check_fields(fields, TRANSCRIPT_FIELDS)
+    interview = await get_owned_session(db, interview_id, current_user)
+    payload = {
+        "id": interview.id,
+        "is_processing": bool(interview.is_processing),
+        "error_message": interview.error_message,
+    }
+    wanted = {"transcript", "transcript_json"}
+    if fields is not None:
+        wanted &= fields
+    if wanted:
+        payload.update(await stored_artifacts(db, interview.id, wanted))
+    return json_response(project(payload, fields))
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.post("/{interview_id}/analysis/stream")
+async def stream_interview_analysis(
+    interview_id: int,
+    bypass_cache: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Run the AI analysis and stream it as Server-Sent Events.
+
+    Events: ``token`` (raw model output), ``section`` (a finished part of
+    the analysis, e.g. summary or scores), then ``done`` with the full
+    result, which is also saved to the interview. ``error`` ends the
+    stream on failure.
+    """
+    interview = await get_owned_session(db, interview_id, current_user)
+    artifacts = await get_artifacts(db, interview.id)
+    transcript = artifacts and (artifacts.transcript_json or artifacts.transcript)
+    if not transcript:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No transcript available to analyze")
+    context = ai_analysis.interview_context(interview)
+    # Don't hold a pooled connection for the length of the completion
+    await db.close()
+
+    async def events():
+        try:
+            async for event, data in ai_analysis.stream_analysis(transcript, context, use_cache=not bypass_cache):
+                if event == "done":
+                    async with AsyncSessionLocal() as session_db:
+                        artifacts = await get_artifacts(session_db, interview_id, create=True)
+                        artifacts.ai_summary = data.get("summary")
+                        artifacts.ai_detailed_analysis = data.get("detailed")
+                        await session_db.commit()
+                yield sse_event(event, data)
+        except Exception as e:
+            logger.error(f"Streaming analysis failed for interview {interview_id}: {e}")
+            yield sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Flush every event immediately, including through proxies
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def attach_recording(db: AsyncSession, interview: InterviewSession, expected_sha256: Optional[str]) -> dict:
+    """Move a fully uploaded recording into place and queue its transcription"""
+    try:
+        path = await recordings.finalize_upload(interview.id, expected_sha256)
+    except recordings.UploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    interview.recording_path = str(path)
+    artifacts = await get_artifacts(db, interview.id)
+    if artifacts is not None:
+        artifacts.transcript = None
+        artifacts.transcript_json = None
+    # A job still holding the previous recording's transcript id must not be reused
+    job = await enqueue_job(db, interview.id, "transcription", restart=True)
+    await db.commit()
+
+    return {
+        "message": "Recording uploaded; transcription queued",
+        "id": interview.id,
+        "size": path.stat().st_size,
+        "job_id": job.id
+    }
+
+@router.post("/{interview_id}/recording/upload", response_model=dict)
+async def start_recording_upload(
+    interview_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Begin (or restart) a chunked recording upload"""
+    interview = await get_owned_session(db, interview_id, current_user)
+    async with recordings.upload_lock(interview.id):
+        recordings.reset_upload(interview.id)
+    return {"offset": 0, "max_chunk_size": recordings.UPLOAD_CHUNK_MAX_BYTES}
+
+@router.get("/{interview_id}/recording/upload", response_model=dict)
+async def get_recording_upload(
+    interview_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Current offset of an interrupted upload, so the client can resume"""
+    interview = await get_owned_session(db, interview_id, current_user)
+    return {"offset": recordings.upload_offset(interview.id), "max_chunk_size": recordings.UPLOAD_CHUNK_MAX_BYTES}
+
+@router.put("/{interview_id}/recording/upload", response_model=dict)
+async def upload_recording_chunk(
+    interview_id: int,
+    offset: int,
+    request: Request,
+    x_chunk_sha256: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Append the raw request body at ``offset``; X-Chunk-SHA256 is verified when sent"""
+    interview = await get_owned_session(db, interview_id, current_user)
+    # Don't hold a pooled connection while the chunk streams in
+    await db.close()
+
+    async with recordings.upload_lock(interview.id):
+        try:
+            new_offset = await recordings.append_chunk(interview.id, offset, request.stream(), x_chunk_sha256)
+        except recordings.OffsetMismatch as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"message": str(e), "offset": e.expected}
+            )
+        except recordings.UploadError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"offset": new_offset}
+
+@router.post("/{interview_id}/recording/upload/complete", response_model=dict)
+async def complete_recording_upload(
+    interview_id: int,
+    x_content_sha256: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Finish a chunked upload (optionally checking the whole-file SHA-256)"""
+    interview = await get_owned_session(db, interview_id, current_user)
+    async with recordings.upload_lock(interview.id):
+        return await attach_recording(db, interview, x_content_sha256)
+
+@router.post("/{interview_id}/upload-recording", response_model=dict)
+async def upload_recording(
+    interview_id: int,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Single-request multipart upload; the form file is spooled to disk, then copied in blocks"""
+    interview = await get_owned_session(db, interview_id, current_user)
+
+    async def blocks():
+        while True:
+            block = await file.read(recordings.FILE_IO_BLOCK_BYTES)
+            if not block:
+                break
+            yield block
+
+    async with recordings.upload_lock(interview.id):
+        recordings.reset_upload(interview.id)
+        try:
+            await recordings.append_chunk(interview.id, 0, blocks(), max_bytes=recordings.RECORDING_MAX_BYTES)
+        except recordings.UploadError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return await attach_recording(db, interview, None)
@@ -1,63 +1,64 @@
 # backend/app/routes/notification.py
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict
-from ..database import get_db
-from ..models import Interview
-from ..auth import get_current_user
+from ..database import get_async_db
+from ..models.interview import InterviewSession
+from ..auth.utils import get_current_user
 from ..email import send_candidate_email, send_interviewer_email
 
 router = APIRouter(prefix="/api/notifications", tags=["notifications"])
 
-@router.post("/email/candidate/{interview_id}", response_model=Dict[str, str])
-async def send_candidate_notification(
-    interview_id: int,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
-):
+async def get_notifiable_interview(db: AsyncSession, interview_id: int, current_user) -> InterviewSession:
     # Get interview details
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = await db.get(InterviewSession, interview_id)
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
-    
+
     # Check permissions (optional)
-    if interview.created_by != current_user.id:
+    if current_user.id not in (interview.created_by, interview.interviewer_id):
         raise HTTPException(status_code=403, detail="Not authorized to send notifications for this interview")
-    
-    # Send email in the background
-    background_tasks.add_task(
-        send_candidate_email,
+    return interview
+
+@router.post("/email/candidate/{interview_id}", response_model=Dict[str, str])
+async def send_candidate_notification(
+    interview_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    interview = await get_notifiable_interview(db, interview_id, current_user)
+    if not interview.candidate_email or not interview.scheduled_time:
+        raise HTTPException(status_code=400, detail="Interview has no candidate email or scheduled time")
+
+    # Queued for the mail worker; stored with this request's transaction
+    send_candidate_email(
+        db,
         recipient_email=interview.candidate_email,
         recipient_name=interview.candidate_name,
         interview_details={
             "topic": interview.interview_topic,
             "scheduled_time": interview.scheduled_time,
             "interviewer_name": interview.interviewer_name
-        }
+        },
+        session_id=interview.id
     )
-    
+    await db.commit()
+
     return {"status": "Email notification to candidate queued successfully"}
 
 @router.post("/email/interviewer/{interview_id}", response_model=Dict[str, str])
 async def send_interviewer_notification(
     interview_id: int,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
-    # Get interview details
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
-    
-    # Check permissions (optional)
-    if interview.created_by != current_user.id:
-        raise HTTPException(status_code=403, detail="Not authorized to send notifications for this interview")
-    
-    # Send email in the background
-    background_tasks.add_task(
-        send_interviewer_email,
+    interview = await get_notifiable_interview(db, interview_id, current_user)
+    if not interview.interviewer_email or not interview.scheduled_time:
+        raise HTTPException(status_code=400, detail="Interview has no interviewer email or scheduled time")
+
+    # Queued for the mail worker; stored with this request's transaction
+    send_interviewer_email(
+        db,
         recipient_email=interview.interviewer_email,
         recipient_name=interview.interviewer_name,
         interview_details={
@@ -67,7 +68,9 @@ async def send_interviewer_notification(
             "candidate_level": interview.candidate_level,
             "required_skills": interview.required_skills,
             "focus_areas": interview.focus_areas
-        }
+        },
+        session_id=interview.id
     )
-    
-    return {"status": "Email notification to interviewer queued successfully"}
\ No newline at end of file
+    await db.commit()
+
+    return {"status": "Email notification to interviewer queued successfully"}
@@ -1,11 +1,17 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Union
+import asyncio
 import json
 import logging
+import os
+import time
 
-from ..database import get_db
-from ..models.interview import InterviewSession
+from ..services.signaling_backplane import BINARY, REPLACE, Backplane, create_backplane
+from ..auth.utils import get_current_user
+from ..database import get_async_session_factory
+from ..models.user import User
+from ..services.session_cache import is_active_session
+from ..services.signaling_frames import tag_sender
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -15,87 +21,330 @@ router = APIRouter(
     tags=["signaling"],
 )
 
+# Outbound delivery: every socket gets a bounded queue drained by its own
+# writer task, so a slow or dead peer never blocks the sender or other rooms
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "256"))
+WS_SEND_TIMEOUT_SECONDS = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "5"))
+# What to do with a peer whose queue is full: "disconnect" it (it will
+# reconnect and renegotiate) or "drop" the new message
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "disconnect")
+# Heartbeat: peers silent for an interval are pinged and must answer with a
+# pong (or any frame); sockets silent past the idle timeout are reaped.
+# 0 disables reaping
+WS_HEARTBEAT_INTERVAL_SECONDS = float(os.getenv("WS_HEARTBEAT_INTERVAL_SECONDS", "20"))
+WS_IDLE_TIMEOUT_SECONDS = float(os.getenv("WS_IDLE_TIMEOUT_SECONDS", "60"))
+
+# Heartbeat frames, matched verbatim so they are never parsed or relayed
+PING = '{"type":"ping"}'
+PONG = '{"type":"pong"}'
+
+# Closes started without waiting for them; referenced until done so they
+# aren't garbage collected mid-handshake
+_closing: Set[asyncio.Task] = set()
+
+def disconnected_message(role: str) -> str:
+    return json.dumps({
+        "type": "user-disconnected",
+        "sender": role
+    })
+
+class SessionStats:
+    """Traffic counters for one session's participants on this process"""
+
+    def __init__(self):
+        self.opened_at = time.time()
+        self.messages_in = 0
+        self.bytes_in = 0
+        self.messages_out = 0
+        self.bytes_out = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "opened_at": self.opened_at,
+            "messages_in": self.messages_in,
+            "bytes_in": self.bytes_in,
+            "messages_out": self.messages_out,
+            "bytes_out": self.bytes_out,
+        }
+
+class PeerConnection:
+    """A participant's socket plus its outbound queue and writer task"""
+
+    def __init__(self, websocket: WebSocket, session_id: str, role: str,
+                 max_queue: int = WS_SEND_QUEUE_SIZE, policy: str = WS_SLOW_CONSUMER_POLICY,
+                 stats: SessionStats = None):
+        self.websocket = websocket
+        self.session_id = session_id
+        self.role = role
+        self.policy = policy
+        self.stats = stats or SessionStats()
+        self.last_seen = time.monotonic()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.closed = False
+        self.writer = asyncio.create_task(self._write_loop())
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+
+    def received(self, data: Union[str, bytes]):
+        """Count a relayed frame from this peer (len() of text frames is in characters)"""
+        self.stats.messages_in += 1
+        self.stats.bytes_in += len(data)
+
+    def enqueue(self, message: Union[str, bytes]) -> bool:
+        """Queue a message without waiting; applies the slow-consumer policy when full"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.policy == "drop":
+                logger.warning(f"Dropping message for slow consumer (session {self.session_id}, role {self.role})")
+            else:
+                logger.warning(f"Disconnecting slow consumer (session {self.session_id}, role {self.role})")
+                self.close_soon(code=1008, reason="Client too slow")
+            return False
+
+    async def _write_loop(self):
+        while True:
+            message = await self.queue.get()
+            try:
+                # Binary frames are relayed as binary
+                send = self.websocket.send_bytes if isinstance(message, bytes) else self.websocket.send_text
+                await asyncio.wait_for(send(message), WS_SEND_TIMEOUT_SECONDS)
+                if message is not PING:
+                    self.stats.messages_out += 1
+                    self.stats.bytes_out += len(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Timed out or already gone; the receive loop cleans up the registration
+                logger.error(f"Error sending to session {self.session_id}, role {self.role}: {e!r}")
+                await self.close(code=1011, reason="Send failed")
+                return
+
+    def close_soon(self, code: int = 1000, reason: str = ""):
+        """Start closing without waiting (a half-open socket can stall the close handshake)"""
+        task = asyncio.create_task(self.close(code=code, reason=reason))
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        if self.closed:
+            return
+        self.closed = True
+        if self.writer is not asyncio.current_task():
+            self.writer.cancel()
+        # Free the backlog now; a stuck peer may take a while to finish closing
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        try:
+            # The server aborts the transport if the close handshake stalls
+            await self.websocket.close(code=code, reason=reason)
+        except Exception as e:
+            logger.debug(f"Error closing connection: {e}")
+
 # Store active connections
 class ConnectionManager:
-    def __init__(self):
-        # Map session_id -> {role -> websocket}
-        self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
+    def __init__(self, backplane: Backplane = None):
+        # Map session_id -> {role -> peer} (sockets held by this process)
+        self.active_connections: Dict[str, Dict[str, PeerConnection]] = {}
+        # Carries messages to participants connected to other processes
+        self.backplane = backplane or create_backplane()
+        # session_id -> counters, kept only while the session has local sockets
+        self.session_stats: Dict[str, SessionStats] = {}
+        self.counters = {"connections_accepted": 0, "idle_reaped": 0, "pings_sent": 0}
+        self._heartbeat: Optional[asyncio.Task] = None
+        # Sessions subscribed on the backplane; changed under the lock only
+        self._subscribed: Set[str] = set()
+        self._subscription_lock: Optional[asyncio.Lock] = None
+
+    async def start(self):
+        await self.backplane.start(self.on_backplane_message)
+        if WS_IDLE_TIMEOUT_SECONDS > 0:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def close(self):
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+        await self.backplane.close()
     
-    async def connect(self, websocket: WebSocket, session_id: str, role: str):
+    async def connect(self, websocket: WebSocket, session_id: str, role: str) -> PeerConnection:
         # Check if this role already has a connection for this session
         if (session_id in self.active_connections and 
             role in self.active_connections[session_id]):
             logger.warning(f"Replacing existing connection for session {session_id}, role {role}")
             # Close the existing connection
-            try:
-                await self.active_connections[session_id][role].close(
-                    code=1008, 
-                    reason="New connection established for this role"
-                )
-            except Exception as e:
-                logger.error(f"Error closing existing connection: {e}")
+            await self.active_connections[session_id][role].close(
+                code=1008, 
+                reason="New connection established for this role"
+            )
         
         await websocket.accept()
         logger.info(f"WebSocket connection established for session {session_id}, role {role}")
         
+        # Register before awaiting anything, so a participant joining meanwhile sees this one
         if session_id not in self.active_connections:
             self.active_connections[session_id] = {}
-        self.active_connections[session_id][role] = websocket
+            self.session_stats[session_id] = SessionStats()
+        peer = PeerConnection(websocket, session_id, role, stats=self.session_stats[session_id])
+        self.active_connections[session_id][role] = peer
+        self.counters["connections_accepted"] += 1
+        await self._sync_subscription(session_id)
+        # Any older socket for this role on another process is now stale
+        await self.backplane.publish(session_id, role, "", kind=REPLACE)
+        return peer
     
-    def disconnect(self, session_id: str, role: str):
+    async def disconnect(self, session_id: str, role: str, websocket: WebSocket = None) -> bool:
+        """
+        Forget a socket; ``websocket`` guards against removing its replacement.
+        Returns True if this call removed it.
+        """
+        removed = False
         if session_id in self.active_connections:
-            if role in self.active_connections[session_id]:
+            current = self.active_connections[session_id].get(role)
+            if current is not None and (websocket is None or current.websocket is websocket):
                 logger.info(f"WebSocket disconnected for session {session_id}, role {role}")
                 del self.active_connections[session_id][role]
+                current.writer.cancel()
+                removed = True
             if not self.active_connections[session_id]:
                 del self.active_connections[session_id]
+                self.session_stats.pop(session_id, None)
+                await self._sync_subscription(session_id)
+        return removed
+
+    async def _sync_subscription(self, session_id: str):
+        """Subscribe while the session has local sockets, unsubscribe once it has none"""
+        # Serialized, so a disconnect's unsubscribe can't overtake a connect's subscribe.
+        # Created here, on the serving loop
+        if self._subscription_lock is None:
+            self._subscription_lock = asyncio.Lock()
+        async with self._subscription_lock:
+            if session_id in self.active_connections:
+                if session_id not in self._subscribed:
+                    await self.backplane.subscribe(session_id)
+                    self._subscribed.add(session_id)
+            elif session_id in self._subscribed:
+                await self.backplane.unsubscribe(session_id)
+                self._subscribed.discard(session_id)
     
     async def send_message(self, message: str, session_id: str, role: str):
-        if session_id in self.active_connections:
-            roles = list(self.active_connections[session_id].keys())
-            for r in roles:
-                if r != role:  # Send to the other role
-                    try:
-                        await self.active_connections[session_id][r].send_text(message)
-                        logger.debug(f"Message sent to session {session_id}, role {r}")
-                    except Exception as e:
-                        logger.error(f"Error sending message: {e}")
+        await self.broadcast_to_session(session_id, role, message)
     
-    async def broadcast_to_session(self, session_id: str, sender_role: str, message: str):
-        if session_id in self.active_connections:
-            for role, connection in self.active_connections[session_id].items():
-                if role != sender_role:  # Don't send back to sender
-                    try:
-                        await connection.send_text(message)
-                        logger.debug(f"Message broadcast to session {session_id}, role {role}")
-                    except Exception as e:
-                        logger.error(f"Error broadcasting message: {e}")
+    async def broadcast_to_session(self, session_id: str, sender_role: str, message: Union[str, bytes]):
+        self.deliver_local(session_id, sender_role, message)
+        if isinstance(message, bytes):
+            # Latin-1 maps bytes 1:1 onto the text envelope
+            await self.backplane.publish(session_id, sender_role, message.decode("latin-1"), kind=BINARY)
+        else:
+            await self.backplane.publish(session_id, sender_role, message)
+
+    def deliver_local(self, session_id: str, sender_role: str, message: Union[str, bytes]):
+        """Queue for this process's participants in the session, except the sender"""
+        for role, peer in list(self.active_connections.get(session_id, {}).items()):
+            if role != sender_role:  # Don't send back to sender
+                peer.enqueue(message)
+
+    async def on_backplane_message(self, kind: str, session_id: str, sender_role: str, message: str):
+        if kind == REPLACE:
+            stale = self.active_connections.get(session_id, {}).get(sender_role)
+            if stale is not None:
+                logger.warning(f"Role {sender_role} of session {session_id} reconnected elsewhere; closing local socket")
+                await self.disconnect(session_id, sender_role, stale.websocket)
+                await stale.close(code=1008, reason="New connection established for this role")
+            return
+        if kind == BINARY:
+            message = message.encode("latin-1")
+        self.deliver_local(session_id, sender_role, message)
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(WS_HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Signaling heartbeat error: {e}")
+
+    async def sweep(self):
+        """Ping quiet peers and reap the ones idle past WS_IDLE_TIMEOUT_SECONDS"""
+        now = time.monotonic()
+        for session_id, peers in list(self.active_connections.items()):
+            for role, peer in list(peers.items()):
+                idle = now - peer.last_seen
+                if idle > WS_IDLE_TIMEOUT_SECONDS:
+                    logger.warning(f"Reaping idle WebSocket for session {session_id}, role {role} ({idle:.0f}s)")
+                    self.counters["idle_reaped"] += 1
+                    if await self.disconnect(session_id, role, peer.websocket):
+                        await self.broadcast_to_session(session_id, role, disconnected_message(role))
+                    # A half-open socket can stall the close handshake; don't wait for it
+                    peer.close_soon(code=1001, reason="Idle timeout")
+                elif idle >= WS_HEARTBEAT_INTERVAL_SECONDS:
+                    if peer.enqueue(PING):
+                        self.counters["pings_sent"] += 1
+
+    def stats(self, limit: int = 100) -> dict:
+        """Process-local connection metrics; the busiest ``limit`` sessions in detail"""
+        sessions = []
+        for session_id, peers in self.active_connections.items():
+            counters = self.session_stats.get(session_id) or SessionStats()
+            sessions.append({
+                "session_id": session_id,
+                "roles": sorted(peers),
+                "queued": sum(peer.queue.qsize() for peer in peers.values()),
+                "dropped": sum(peer.dropped for peer in peers.values()),
+                **counters.as_dict(),
+            })
+        sessions.sort(key=lambda item: item["bytes_in"] + item["bytes_out"], reverse=True)
+        return {
+            "node_id": self.backplane.node_id,
+            "sessions": len(self.active_connections),
+            "connections": sum(len(peers) for peers in self.active_connections.values()),
+            **self.counters,
+            "busiest_sessions": sessions[:limit],
+        }
 
 manager = ConnectionManager()
 
+@router.get("/metrics")
+async def read_signaling_metrics(limit: int = 100, current_user: User = Depends(get_current_user)):
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return manager.stats(limit)
+
 @router.websocket("/interview/{session_id}/{role}")
 async def websocket_endpoint(
     websocket: WebSocket, 
     session_id: str, 
     role: str,
-    db: Session = Depends(get_db)
+    session_factory = Depends(get_async_session_factory)
 ):
     try:
-        # Validate session exists
-        session = db.query(InterviewSession).filter(InterviewSession.id == session_id).first()
-        if not session:
-            logger.warning(f"WebSocket connection attempt for non-existent session: {session_id}")
-            await websocket.close(code=1008, reason="Interview session not found")
-            return
-        
         # Validate role
         if role not in ["interviewer", "candidate"]:
             logger.warning(f"WebSocket connection attempt with invalid role: {role}")
             await websocket.close(code=1008, reason="Invalid role")
             return
         
+        # Validate session exists and is still active. Cached, and a miss uses
+        # its own short-lived DB session: the socket holds no pool connection
+        if not session_id.isdigit() or not await is_active_session(int(session_id), session_factory):
+            logger.warning(f"WebSocket connection attempt for missing or inactive session: {session_id}")
+            await websocket.close(code=1008, reason="Interview session not found")
+            return
+        
         # Accept connection
-        await manager.connect(websocket, session_id, role)
+        peer = await manager.connect(websocket, session_id, role)
         
         # Send initial connection notification to other participant
         connect_message = json.dumps({
@@ -105,40 +354,41 @@ async def websocket_endpoint(
         await manager.broadcast_to_session(session_id, role, connect_message)
         
         while True:
-            # Receive message from this client
-            data = await websocket.receive_text()
+            # Receive message (text or binary frame) from this client
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = message.get("text")
+            if data is None:
+                data = message.get("bytes")
+            if data is None:
+                continue
             
-            try:
-                # Validate JSON format
-                message_data = json.loads(data)
-                
-                # Add sender role to the message if not present
-                if "sender" not in message_data:
-                    message_data["sender"] = role
-                
-                # Forward to other participants in the same session
-                await manager.broadcast_to_session(
-                    session_id, 
-                    role, 
-                    json.dumps(message_data)
-                )
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON received: {data}")
-                # Forward raw message as fallback
-                await manager.broadcast_to_session(session_id, role, data)
+            # Any frame proves the peer is alive; heartbeats stop here
+            peer.touch()
+            if data == PONG:
+                continue
+            if data == PING:
+                peer.enqueue(PONG)
+                continue
+            peer.received(data)
+            
+            # Add sender role to the message if not present (no full re-encode)
+            data = tag_sender(data, role)
+            if data is None:
+                continue
+            
+            # Forward to other participants in the same session
+            await manager.broadcast_to_session(session_id, role, data)
                 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for session {session_id}, role {role}")
-        manager.disconnect(session_id, role)
-        # Notify other participants
-        disconnect_message = json.dumps({
-            "type": "user-disconnected",
-            "sender": role
-        })
-        await manager.broadcast_to_session(session_id, role, disconnect_message)
+        # Notify other participants, unless the socket was already reaped or replaced
+        if await manager.disconnect(session_id, role, websocket):
+            await manager.broadcast_to_session(session_id, role, disconnected_message(role))
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        manager.disconnect(session_id, role)
+        await manager.disconnect(session_id, role, websocket)
 
 # backend/app/routers/signaling.py
 @router.websocket("/test")
@@ -0,0 +1,38 @@
+# backend/app/routers/webhooks.py
+from fastapi import APIRouter, Header, HTTPException, status
+from pydantic import BaseModel
+from typing import Optional
+import hmac
+import logging
+
+from ..services.transcript_completion import (
+    ASSEMBLYAI_WEBHOOK_SECRET,
+    TERMINAL_STATUSES,
+    transcript_completions,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
+
+class AssemblyAIWebhook(BaseModel):
+    transcript_id: str
+    status: str
+
+@router.post("/assemblyai", response_model=dict)
+async def assemblyai_webhook(
+    payload: AssemblyAIWebhook,
+    x_webhook_secret: Optional[str] = Header(None)
+):
+    """Called by AssemblyAI when a transcript finishes; wakes the waiting pipeline stage"""
+    # Webhooks are only enabled with a secret; without one every call is refused
+    if not ASSEMBLYAI_WEBHOOK_SECRET or not hmac.compare_digest(x_webhook_secret or "", ASSEMBLYAI_WEBHOOK_SECRET):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook secret")
+
+    if payload.status not in TERMINAL_STATUSES:
+        # Only completion matters; intermediate statuses are ignored
+        return {"status": "ignored"}
+
+    logger.info(f"AssemblyAI webhook: transcript {payload.transcript_id} is {payload.status}")
+    await transcript_completions.record(payload.transcript_id, payload.status)
+    return {"status": "received"}
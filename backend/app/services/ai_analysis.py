@@ -1,49 +1,107 @@
 # backend/app/services/ai_analysis.py
 import os
-import httpx
+import re
 import json
+import asyncio
 from dotenv import load_dotenv
 
+from .http_clients import http_clients
+from .result_cache import get_cached, request_key, set_cached
+
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_MODEL = "gpt-4"  # or "gpt-3.5-turbo" if you prefer
+
+# Chunked (map-reduce) analysis for long transcripts: utterances are packed
+# into windows of about ANALYSIS_CHUNK_TOKENS, analysed concurrently, and
+# the per-window results merged. Shorter transcripts use a single prompt.
+ANALYSIS_CHUNK_TOKENS = int(os.getenv("ANALYSIS_CHUNK_TOKENS", "3000"))
+ANALYSIS_SINGLE_PROMPT_MAX_TOKENS = int(os.getenv("ANALYSIS_SINGLE_PROMPT_MAX_TOKENS", "5000"))
+ANALYSIS_MAX_CONCURRENCY = int(os.getenv("ANALYSIS_MAX_CONCURRENCY", "4"))
+
+SYSTEM_PROMPT = "You are an expert technical interviewer providing objective analysis."
+
+RESPONSE_FORMAT = """{
+  "summary": "A brief 2-3 sentence summary of the interview and the candidate's performance",
+  "detailed": {
+    "technical_assessment": "A paragraph evaluating the candidate's technical knowledge and how well they demonstrated the required skills",
+    "strengths": ["Strength 1", "Strength 2", "Strength 3"],
+    "areas_for_improvement": ["Area 1", "Area 2", "Area 3"],
+    "recommendation": "Hire/Consider/Reject with a brief justification",
+    "scores": {
+      "technical_knowledge": "Score from 1-10",
+      "communication": "Score from 1-10",
+      "problem_solving": "Score from 1-10"
+    }
+  }
+}"""
+
+def interview_context(session):
+    """Prompt context for an InterviewSession"""
+    return {
+        "interview_topic": session.interview_topic,
+        "candidate_level": session.candidate_level,
+        "required_skills": session.required_skills,
+        "focus_areas": session.focus_areas,
+    }
 
-async def analyze_interview(transcript, context):
+def estimate_tokens(text):
+    """Rough token count (about 4 characters per token for English)"""
+    return len(text) // 4 + 1
+
+def format_utterance(utterance):
+    speaker = f"Speaker {utterance.get('speaker', '?')}"
+    text = utterance.get('text', '')
+    return f"{speaker}: {text}\n\n"
+
+def format_transcript(transcript):
+    """Render a list of utterances (or plain text) as prompt text"""
+    if isinstance(transcript, list):
+        # If transcript is a list of utterances
+        return "".join(format_utterance(utterance) for utterance in transcript)
+    # If transcript is just text
+    return transcript
+
+def split_transcript(utterances, max_tokens=ANALYSIS_CHUNK_TOKENS):
     """
-    Analyze interview transcript using OpenAI
-    
-    Parameters:
-    - transcript: The interview transcript text or structured data
-    - context: Dictionary containing interview context (topic, level, skills, etc.)
-    
-    Returns:
-    - Dictionary containing analysis results
+    Pack utterances into windows of at most ``max_tokens`` (estimated),
+    breaking only between speaker turns. A single turn longer than the
+    budget gets a window of its own.
     """
-    if not OPENAI_API_KEY:
-        raise ValueError("OpenAI API key not found in environment variables")
-    
-    # Extract context information
+    windows, current, current_tokens = [], [], 0
+    for utterance in utterances:
+        tokens = estimate_tokens(format_utterance(utterance))
+        if current and current_tokens + tokens > max_tokens:
+            windows.append(current)
+            current, current_tokens = [], 0
+        current.append(utterance)
+        current_tokens += tokens
+    if current:
+        windows.append(current)
+    return windows
+
+def build_prompt(formatted_transcript, context, segment=None):
+    """The analysis prompt; ``segment`` is (index, total) in chunked mode"""
     topic = context.get("interview_topic", "")
     level = context.get("candidate_level", "")
     skills = context.get("required_skills", "")
     focus_areas = context.get("focus_areas", "")
-    
-    # Format the transcript for better readability
-    formatted_transcript = ""
-    if isinstance(transcript, list):
-        # If transcript is a list of utterances
-        for utterance in transcript:
-            speaker = f"Speaker {utterance.get('speaker', '?')}"
-            text = utterance.get('text', '')
-            formatted_transcript += f"{speaker}: {text}\n\n"
+
+    if segment is None:
+        heading = "INTERVIEW TRANSCRIPT:"
+        scope = "Based on the transcript above"
     else:
-        # If transcript is just text
-        formatted_transcript = transcript
-    
-    # Create the prompt for the LLM
-    prompt = f"""
-You are an expert technical interviewer reviewing an interview transcript. 
+        index, total = segment
+        heading = f"INTERVIEW TRANSCRIPT (part {index} of {total}):"
+        scope = (
+            f"This is only part {index} of {total} of the interview; other parts are analyzed separately. "
+            "Based solely on this part"
+        )
+
+    return f"""
+You are an expert technical interviewer reviewing an interview transcript.
 
 INTERVIEW CONTEXT:
 - Topic: {topic}
@@ -51,66 +109,309 @@ INTERVIEW CONTEXT:
 - Required Skills: {skills}
 - Focus Areas: {focus_areas}
 
-INTERVIEW TRANSCRIPT:
+{heading}
 {formatted_transcript}
 
-Based on the transcript above, provide a comprehensive analysis in the following JSON format:
+{scope}, provide a comprehensive analysis in the following JSON format:
 
-{{
-  "summary": "A brief 2-3 sentence summary of the interview and the candidate's performance",
-  "detailed": {{
-    "technical_assessment": "A paragraph evaluating the candidate's technical knowledge and how well they demonstrated the required skills",
-    "strengths": ["Strength 1", "Strength 2", "Strength 3"],
-    "areas_for_improvement": ["Area 1", "Area 2", "Area 3"],
-    "recommendation": "Hire/Consider/Reject with a brief justification",
-    "scores": {{
-      "technical_knowledge": "Score from 1-10",
-      "communication": "Score from 1-10",
-      "problem_solving": "Score from 1-10"
-    }}
-  }}
-}}
+{RESPONSE_FORMAT}
 
 Ensure your analysis is fair, based solely on the transcript content, and provides specific examples from the interview to support your assessment.
 """
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {OPENAI_API_KEY}"
-    }
-    
-    data = {
-        "model": "gpt-4",  # or "gpt-3.5-turbo" if you prefer
+def needs_chunking(transcript, formatted_transcript):
+    return isinstance(transcript, list) and estimate_tokens(formatted_transcript) > ANALYSIS_SINGLE_PROMPT_MAX_TOKENS
+
+def build_request(prompt, max_tokens):
+    return {
+        "model": OPENAI_MODEL,
         "messages": [
-            {"role": "system", "content": "You are an expert technical interviewer providing objective analysis."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
         "temperature": 0.5,  # Lower temperature for more consistent results
-        "max_tokens": 1500  # Adjust based on your needs
+        "max_tokens": max_tokens  # Adjust based on your needs
+    }
+
+async def request_analysis(data, use_cache=True):
+    """Send one chat completion request and parse its JSON answer (cached by request)"""
+    # Same prompt and model parameters -> same answer; serve repeats from the cache
+    cache_key = request_key("analysis", data)
+    if use_cache:
+        cached = await get_cached("analysis", cache_key)
+        if cached is not None:
+            return cached
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {OPENAI_API_KEY}"
     }
-    
+
+    # Pooled client; its read timeout (60 s) covers slow LLM completions
+    client = http_clients.get("openai")
+    response = await client.post(
+        OPENAI_API_URL,
+        headers=headers,
+        json=data
+    )
+    response.raise_for_status()
+
+    # Extract the AI's response
+    result = response.json()
+    ai_response = result["choices"][0]["message"]["content"]
+
+    # Parse the JSON response
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                OPENAI_API_URL,
-                headers=headers,
-                json=data,
-                timeout=60.0  # Longer timeout for LLM processing
-            )
-            response.raise_for_status()
-            
-            # Extract the AI's response
-            result = response.json()
-            ai_response = result["choices"][0]["message"]["content"]
-            
-            # Parse the JSON response
-            try:
-                analysis = json.loads(ai_response)
-                return analysis
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return the raw text
-                return {"summary": ai_response, "detailed": None}
-                
+        analysis = json.loads(ai_response)
+    except json.JSONDecodeError:
+        # If JSON parsing fails, return the raw text (not cached, so a retry can do better)
+        return {"summary": ai_response, "detailed": None}
+    await set_cached("analysis", cache_key, analysis)
+    return analysis
+
+def _score_value(score):
+    """Numeric part of a score such as 7, "7" or "7/10" (None if absent)"""
+    match = re.search(r"\d+(\.\d+)?", str(score))
+    return float(match.group()) if match else None
+
+def _unique(items, limit):
+    seen, merged = set(), []
+    for item in items:
+        key = str(item).strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            merged.append(item)
+    return merged[:limit]
+
+def merge_analyses(parts, weights):
+    """
+    Combine per-window analyses into the single-prompt schema.
+
+    Deterministic: summaries and assessments are concatenated in order,
+    list items de-duplicated, scores averaged weighted by window length,
+    and the recommendation is the verdict with the most weight (ties go
+    to the more cautious one).
+    """
+    total = len(parts)
+    details = [part.get("detailed") or {} for part in parts]
+
+    summary = " ".join(part.get("summary", "").strip() for part in parts if part.get("summary"))
+    assessment = "\n\n".join(
+        f"Part {i}/{total}: {detail['technical_assessment']}"
+        for i, detail in enumerate(details, 1)
+        if detail.get("technical_assessment")
+    )
+
+    scores = {}
+    for name in ("technical_knowledge", "communication", "problem_solving"):
+        weighted = [
+            (_score_value((detail.get("scores") or {}).get(name)), weight)
+            for detail, weight in zip(details, weights)
+        ]
+        weighted = [(value, weight) for value, weight in weighted if value is not None]
+        if weighted:
+            average = sum(value * weight for value, weight in weighted) / sum(weight for _, weight in weighted)
+            scores[name] = f"{average:.1f}"
+
+    votes = {}
+    for detail, weight in zip(details, weights):
+        recommendation = str(detail.get("recommendation") or "").strip()
+        for verdict in ("Reject", "Consider", "Hire"):
+            if recommendation.lower().startswith(verdict.lower()):
+                votes.setdefault(verdict, [0, recommendation])[0] += weight
+                break
+    recommendation = None
+    if votes:
+        cautious_order = ["Reject", "Consider", "Hire"]
+        verdict = max(votes, key=lambda v: (votes[v][0], -cautious_order.index(v)))
+        recommendation = votes[verdict][1]
+
+    return {
+        "summary": summary,
+        "detailed": {
+            "technical_assessment": assessment,
+            "strengths": _unique([s for d in details for s in d.get("strengths") or []], 5),
+            "areas_for_improvement": _unique([a for d in details for a in d.get("areas_for_improvement") or []], 5),
+            "recommendation": recommendation,
+            "scores": scores,
+            "segments": total
+        }
+    }
+
+async def analyze_chunked(utterances, context, use_cache=True):
+    """Map-reduce analysis: windows are analysed concurrently, then merged"""
+    windows = split_transcript(utterances)
+    semaphore = asyncio.Semaphore(ANALYSIS_MAX_CONCURRENCY)
+
+    async def analyze_window(index, window):
+        prompt = build_prompt(format_transcript(window), context, segment=(index, len(windows)))
+        async with semaphore:
+            return await request_analysis(build_request(prompt, 800), use_cache=use_cache)
+
+    # Windows that succeed are cached, so a retry only pays for the ones that failed
+    parts = await asyncio.gather(*(analyze_window(i, w) for i, w in enumerate(windows, 1)))
+    weights = [estimate_tokens(format_transcript(window)) for window in windows]
+    return merge_analyses(parts, weights)
+
+async def analyze_interview(transcript, context, use_cache=True):
+    """
+    Analyze interview transcript using OpenAI
+
+    Parameters:
+    - transcript: The interview transcript text or structured data
+    - context: Dictionary containing interview context (topic, level, skills, etc.)
+    - use_cache: Reuse a stored result for an identical request (False forces a new call)
+
+    Returns:
+    - Dictionary containing analysis results
+    """
+    if not OPENAI_API_KEY:
+        raise ValueError("OpenAI API key not found in environment variables")
+
+    # Format the transcript for better readability
+    formatted_transcript = format_transcript(transcript)
+
+    try:
+        if needs_chunking(transcript, formatted_transcript):
+            # Too long for one prompt: analyse speaker-turn windows concurrently
+            return await analyze_chunked(transcript, context, use_cache=use_cache)
+
+        prompt = build_prompt(formatted_transcript, context)
+        return await request_analysis(build_request(prompt, 1500), use_cache=use_cache)
+
     except Exception as e:
         print(f"Error in AI analysis: {str(e)}")
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
+
+
+# Streaming mode: partial tokens are forwarded as they arrive and each
+# section of the answer is reported as soon as its JSON value is complete.
+_JSON_STRING = r'"(?:[^"\\]|\\.)*"'
+SECTION_PATTERNS = {
+    "summary": re.compile(r'"summary"\s*:\s*(' + _JSON_STRING + ')'),
+    "technical_assessment": re.compile(r'"technical_assessment"\s*:\s*(' + _JSON_STRING + ')'),
+    "strengths": re.compile(r'"strengths"\s*:\s*(\[\s*(?:' + _JSON_STRING + r'\s*(?:,\s*)?)*\])'),
+    "areas_for_improvement": re.compile(r'"areas_for_improvement"\s*:\s*(\[\s*(?:' + _JSON_STRING + r'\s*(?:,\s*)?)*\])'),
+    "recommendation": re.compile(r'"recommendation"\s*:\s*(' + _JSON_STRING + ')'),
+    "scores": re.compile(r'"scores"\s*:\s*(\{(?:[^{}"]|' + _JSON_STRING + r')*\})'),
+}
+
+# The character that ends each section's value; text without it can't complete one
+SECTION_CLOSERS = {
+    "summary": '"',
+    "technical_assessment": '"',
+    "strengths": "]",
+    "areas_for_improvement": "]",
+    "recommendation": '"',
+    "scores": "}",
+}
+
+class SectionParser:
+    """
+    Extracts finished sections from a partially received analysis JSON.
+
+    Each feed only searches the new text (plus a key's length before it)
+    for section keys, and only re-matches a section whose value the new
+    text could have closed, so a whole stream is parsed in linear time.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pending = dict(SECTION_PATTERNS)
+        # section -> offset of its key in the buffer, once seen
+        self.starts = {}
+
+    def feed(self, text):
+        """Add streamed text; returns [(section, value)] for sections completed by it"""
+        scanned = len(self.buffer)
+        self.buffer += text
+        done = []
+        for name, pattern in list(self.pending.items()):
+            start = self.starts.get(name)
+            if start is None:
+                key = f'"{name}"'
+                # A key split across two chunks is still found
+                start = self.buffer.find(key, max(0, scanned - len(key) + 1))
+                if start < 0:
+                    continue
+                self.starts[name] = start
+            elif SECTION_CLOSERS[name] not in text:
+                continue
+            match = pattern.match(self.buffer, start)
+            if match is None:
+                continue
+            try:
+                value = json.loads(match.group(1))
+            except json.JSONDecodeError:
+                continue
+            del self.pending[name]
+            done.append((name, value))
+        return done
+
+def analysis_sections(analysis):
+    """(section, value) pairs of a complete analysis, in display order"""
+    detailed = analysis.get("detailed") or {}
+    sections = [("summary", analysis.get("summary"))]
+    sections += [(name, detailed[name]) for name in SECTION_PATTERNS if name != "summary" and name in detailed]
+    return [(name, value) for name, value in sections if value is not None]
+
+async def stream_analysis(transcript, context, use_cache=True):
+    """
+    Analyze a transcript, yielding (event, data) pairs as the answer streams in:
+    ("token", {"text"}), ("section", {"name", "value"}), then ("done", analysis).
+
+    Cached results and chunked (long transcript) analyses have no token
+    stream; their sections are emitted once the result is available.
+    """
+    if not OPENAI_API_KEY:
+        raise ValueError("OpenAI API key not found in environment variables")
+
+    formatted_transcript = format_transcript(transcript)
+    analysis = None
+    if needs_chunking(transcript, formatted_transcript):
+        yield "status", {"mode": "chunked", "segments": len(split_transcript(transcript))}
+        analysis = await analyze_chunked(transcript, context, use_cache=use_cache)
+    else:
+        data = build_request(build_prompt(formatted_transcript, context), 1500)
+        # Shares cache entries with the non-streaming request
+        cache_key = request_key("analysis", data)
+        if use_cache:
+            analysis = await get_cached("analysis", cache_key)
+
+    if analysis is not None:
+        for name, value in analysis_sections(analysis):
+            yield "section", {"name": name, "value": value}
+        yield "done", analysis
+        return
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {OPENAI_API_KEY}"
+    }
+    parser = SectionParser()
+    client = http_clients.get("openai")
+    async with client.stream("POST", OPENAI_API_URL, headers=headers, json={**data, "stream": True}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            # Server-sent events: "data: {chunk}" lines, terminated by "data: [DONE]"
+            if not line.startswith("data:"):
+                continue
+            payload = line[len("data:"):].strip()
+            if payload == "[DONE]":
+                break
+            choices = json.loads(payload).get("choices") or [{}]
+            delta = (choices[0].get("delta") or {}).get("content")
+            if not delta:
+                continue
+            yield "token", {"text": delta}
+            for name, value in parser.feed(delta):
+                yield "section", {"name": name, "value": value}
+
+    try:
+        analysis = json.loads(parser.buffer)
+    except json.JSONDecodeError:
+        # If JSON parsing fails, return the raw text (not cached, so a retry can do better)
+        analysis = {"summary": parser.buffer, "detailed": None}
+    else:
+        await set_cached("analysis", cache_key, analysis)
+    yield "done", analysis
@@ -0,0 +1,48 @@
+# backend/app/services/artifacts.py
+"""
+Loading and saving an interview's transcript and analysis.
+
+They are stored in interview_artifacts, one row per session, created the
+first time something is written. Read them only where they're needed;
+session metadata queries never touch that table.
+"""
+from typing import Iterable, Optional
+
+from sqlalchemy import JSON, Text, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.interview import InterviewArtifacts
+
+ARTIFACT_FIELDS = ("transcript", "transcript_json", "ai_summary", "ai_detailed_analysis")
+JSON_FIELDS = tuple(
+    field for field in ARTIFACT_FIELDS
+    if isinstance(InterviewArtifacts.__table__.c[field].type, JSON)
+)
+
+async def get_artifacts(db: AsyncSession, session_id: int, create: bool = False) -> Optional[InterviewArtifacts]:
+    """The session's artifacts row; with ``create``, a new (pending) one if there is none"""
+    artifacts = await db.get(InterviewArtifacts, session_id)
+    if artifacts is None and create:
+        artifacts = InterviewArtifacts(session_id=session_id)
+        db.add(artifacts)
+    return artifacts
+
+def artifact_values(artifacts: Optional[InterviewArtifacts]) -> dict:
+    """Artifact fields as a dict, all None when nothing has been stored yet"""
+    return {field: getattr(artifacts, field, None) for field in ARTIFACT_FIELDS}
+
+async def load_stored_fields(db: AsyncSession, session_id: int, fields: Iterable[str] = ARTIFACT_FIELDS) -> dict:
+    """
+    Artifact fields for a response, read without building ORM objects. JSON
+    columns come back as their stored text, to be passed through undecoded.
+    """
+    fields = [field for field in ARTIFACT_FIELDS if field in fields]
+    columns = [
+        type_coerce(InterviewArtifacts.__table__.c[field], Text) if field in JSON_FIELDS
+        else InterviewArtifacts.__table__.c[field]
+        for field in fields
+    ]
+    row = (await db.execute(select(*columns).where(InterviewArtifacts.session_id == session_id))).first()
+    if row is None:
+        return dict.fromkeys(fields)
+    return dict(zip(fields, row))
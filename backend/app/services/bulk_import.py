@@ -0,0 +1,178 @@
+# backend/app/services/bulk_import.py
+"""
+Row sources for bulk interview scheduling.
+
+request_records() turns a request into (row number, record) pairs as the
+body arrives. The body may be a JSON array of objects, CSV with a header
+row, or NDJSON, sent directly or as the "file" field of a multipart form.
+BULK_MAX_BYTES applies to the raw body: a larger Content-Length is refused
+before anything is read, and the byte count is checked as the body arrives
+(a multipart body too, while it is parsed, since the upload is spooled to a
+temporary file before its rows are read). CSV and NDJSON are decoded and
+split into rows chunk by chunk. A row that
+can't be parsed comes through as an error string instead of a dict, so it
+is reported with the others rather than failing the whole request.
+"""
+import codecs
+import csv
+import json
+import os
+from typing import AsyncIterator, Tuple, Union
+
+from fastapi import Request, status
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+
+BULK_MAX_ROWS = int(os.getenv("BULK_MAX_ROWS", "5000"))
+BULK_MAX_BYTES = int(os.getenv("BULK_MAX_BYTES", str(10 * 1024 * 1024)))
+# Bytes read from a multipart upload at a time
+BULK_READ_BYTES = 64 * 1024
+
+CSV_TYPES = {"text/csv", "application/csv"}
+NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines"}
+JSON_TYPES = {"application/json"}
+
+Record = Union[dict, str]
+
+class BulkImportError(Exception):
+    """The body as a whole can't be used (format, size, encoding)"""
+
+    def __init__(self, message: str, status_code: int = status.HTTP_400_BAD_REQUEST):
+        super().__init__(message)
+        self.status_code = status_code
+
+def body_format(content_type: str, filename: str = "") -> str:
+    media_type = content_type.split(";")[0].strip().lower()
+    filename = filename.lower()
+    if media_type in CSV_TYPES or filename.endswith(".csv"):
+        return "csv"
+    if media_type in NDJSON_TYPES or filename.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    if media_type in JSON_TYPES or filename.endswith(".json"):
+        return "json"
+    raise BulkImportError(
+        f"Unsupported content type {media_type or '(none)'}; send JSON, CSV or NDJSON",
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+    )
+
+async def _limited(chunks):
+    total = 0
+    async for chunk in chunks:
+        total += len(chunk)
+        if total > BULK_MAX_BYTES:
+            raise _too_large()
+        yield chunk
+
+def _too_large() -> BulkImportError:
+    return BulkImportError(f"Body is larger than {BULK_MAX_BYTES} bytes", 413)
+
+async def _upload_chunks(upload: UploadFile):
+    while True:
+        chunk = await upload.read(BULK_READ_BYTES)
+        if not chunk:
+            break
+        yield chunk
+
+async def _multipart_upload(request: Request) -> UploadFile:
+    """The "file" field of a multipart body, parsed under the size limit"""
+    # request.form() would read the whole body first
+    parser = MultiPartParser(request.headers, _limited(request.stream()), max_files=1)
+    try:
+        form = await parser.parse()
+    except MultiPartException as e:
+        raise BulkImportError(e.message)
+    upload = form.get("file")
+    if not isinstance(upload, UploadFile):
+        await form.close()
+        raise BulkImportError("Expected the rows in a \"file\" form field")
+    return upload
+
+async def _lines(chunks) -> AsyncIterator[str]:
+    """Decoded lines (without the newline) as the chunks come in"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise BulkImportError("Body is not valid UTF-8")
+    if pending:
+        yield pending
+
+async def _csv_records(chunks) -> AsyncIterator[Tuple[int, Record]]:
+    header, record, row = None, "", 0
+    async for line in _lines(chunks):
+        record = f"{record}\n{line}" if record else line
+        if record.count('"') % 2:
+            # Inside a quoted field that spans lines
+            continue
+        text, record = record, ""
+        if not text.strip():
+            continue
+        fields = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        row += 1
+        if len(fields) != len(header):
+            yield row, f"Expected {len(header)} columns, got {len(fields)}"
+            continue
+        # Empty cells count as missing, so optional fields stay unset
+        yield row, {name: value for name, value in zip(header, fields) if value != ""}
+    if record:
+        yield row + 1, "Unterminated quoted field"
+
+async def _ndjson_records(chunks) -> AsyncIterator[Tuple[int, Record]]:
+    row = 0
+    async for line in _lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row, f"Invalid JSON: {e}"
+            continue
+        yield row, record if isinstance(record, dict) else "Expected a JSON object"
+
+async def _json_records(chunks) -> AsyncIterator[Tuple[int, Record]]:
+    body = b"".join([chunk async for chunk in chunks])
+    try:
+        records = json.loads(body)
+    except ValueError as e:
+        raise BulkImportError(f"Invalid JSON: {e}")
+    if not isinstance(records, list):
+        raise BulkImportError("Expected a JSON array of interviews")
+    for row, record in enumerate(records, start=1):
+        yield row, record if isinstance(record, dict) else "Expected a JSON object"
+
+PARSERS = {"csv": _csv_records, "ndjson": _ndjson_records, "json": _json_records}
+
+async def request_records(request: Request) -> AsyncIterator[Tuple[int, Record]]:
+    """(row number, dict or error message) for every row in the request, 1-based"""
+    content_type = request.headers.get("content-type", "")
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BULK_MAX_BYTES:
+        raise _too_large()
+
+    upload = None
+    if content_type.startswith("multipart/form-data"):
+        upload = await _multipart_upload(request)
+        chunks = _upload_chunks(upload)
+        fmt = body_format(upload.content_type or "", upload.filename or "")
+    else:
+        chunks = _limited(request.stream())
+        fmt = body_format(content_type)
+
+    try:
+        async for row, record in PARSERS[fmt](chunks):
+            if row > BULK_MAX_ROWS:
+                raise BulkImportError(f"More than {BULK_MAX_ROWS} rows", 413)
+            yield row, record
+    finally:
+        if upload is not None:
+            await upload.close()
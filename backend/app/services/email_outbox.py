@@ -0,0 +1,211 @@
+# backend/app/services/email_outbox.py
+"""
+DB-backed outbox for outgoing email.
+
+Routes call ``queue_email`` inside their own transaction, so a message is
+stored exactly when the change it announces is committed, and the request
+never waits on SMTP. The mail worker (app/workers/mail_worker.py) claims
+due messages in batches with a conditional UPDATE (queued -> sending),
+delivers them over persistent SMTP connections and records the outcome.
+Failed deliveries are retried with backoff; a sender that dies leaves
+its messages leased until the lease expires, then they are queued again.
+"""
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import AsyncSessionLocal
+from ..models.outbox import OutboundEmail
+from .job_queue import retry_delay
+
+logger = logging.getLogger(__name__)
+
+# Outbox settings
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "6"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "60"))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+EMAIL_LEASE_SECONDS = int(os.getenv("EMAIL_LEASE_SECONDS", "300"))
+
+def queue_email(
+    db,
+    to_email: str,
+    subject: str,
+    html_content: str,
+    session_id: Optional[int] = None
+) -> OutboundEmail:
+    """
+    Add a message to the outbox.
+
+    Works with a Session or an AsyncSession; the caller owns the
+    transaction and must commit.
+    """
+    message = OutboundEmail(
+        session_id=session_id,
+        to_email=to_email,
+        subject=subject,
+        html_content=html_content,
+        status="queued",
+        max_attempts=EMAIL_MAX_ATTEMPTS,
+        run_after=datetime.utcnow(),
+    )
+    db.add(message)
+    return message
+
+async def queue_many(db: AsyncSession, messages: List[dict]):
+    """
+    Add many messages with one executemany INSERT.
+
+    Each dict has to_email, subject, html_content and optionally
+    session_id. The caller owns the transaction and must commit.
+    """
+    if not messages:
+        return
+    now = datetime.utcnow()
+    await db.execute(insert(OutboundEmail), [
+        {"session_id": None, **message, "status": "queued", "attempts": 0,
+         "max_attempts": EMAIL_MAX_ATTEMPTS, "run_after": now}
+        for message in messages
+    ])
+
+async def sent_since(since: datetime) -> int:
+    """Messages delivered since the given time (by every sender)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(func.count()).select_from(OutboundEmail).where(OutboundEmail.sent_at >= since)
+        )
+        return result.scalar_one()
+
+async def claim_batch(sender_id: str, limit: int) -> List[OutboundEmail]:
+    """Move up to ``limit`` due messages to sending for this sender, oldest first"""
+    async with AsyncSessionLocal() as db:
+        now = datetime.utcnow()
+        result = await db.execute(
+            select(OutboundEmail.id)
+            .where(OutboundEmail.status == "queued", OutboundEmail.run_after <= now)
+            .order_by(OutboundEmail.run_after, OutboundEmail.id)
+            .limit(limit)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            await db.rollback()
+            return []
+        # Rows another sender got to first simply don't match
+        await db.execute(
+            update(OutboundEmail)
+            .where(OutboundEmail.id.in_(ids), OutboundEmail.status == "queued")
+            .values(
+                status="sending",
+                locked_by=sender_id,
+                lease_expires_at=now + timedelta(seconds=EMAIL_LEASE_SECONDS),
+            )
+        )
+        await db.commit()
+        result = await db.execute(
+            select(OutboundEmail)
+            .where(
+                OutboundEmail.id.in_(ids),
+                OutboundEmail.status == "sending",
+                OutboundEmail.locked_by == sender_id,
+            )
+            .order_by(OutboundEmail.run_after, OutboundEmail.id)
+        )
+        return list(result.scalars().all())
+
+async def mark_sent(message_ids: List[int], sender_id: str):
+    """Record a batch of deliveries in one UPDATE"""
+    if not message_ids:
+        return
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(OutboundEmail)
+            .where(OutboundEmail.id.in_(message_ids), OutboundEmail.locked_by == sender_id)
+            .values(
+                status="sent",
+                sent_at=datetime.utcnow(),
+                attempts=OutboundEmail.attempts + 1,
+                last_error=None,
+                locked_by=None,
+                lease_expires_at=None,
+            )
+        )
+        await db.commit()
+
+async def release(message_ids: List[int], sender_id: str):
+    """Put claimed messages that weren't attempted back in the queue"""
+    if not message_ids:
+        return
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(OutboundEmail)
+            .where(
+                OutboundEmail.id.in_(message_ids),
+                OutboundEmail.status == "sending",
+                OutboundEmail.locked_by == sender_id,
+            )
+            .values(status="queued", locked_by=None, lease_expires_at=None)
+        )
+        await db.commit()
+
+async def mark_failed(message_id: int, sender_id: str, error: str, retryable: bool = True):
+    """Record a failed delivery and either schedule a retry or give up"""
+    async with AsyncSessionLocal() as db:
+        message = await db.get(OutboundEmail, message_id)
+        if message is None or message.locked_by != sender_id:
+            return
+        message.attempts += 1
+        message.last_error = error
+        message.locked_by = None
+        message.lease_expires_at = None
+
+        if retryable and message.attempts < message.max_attempts:
+            delay = retry_delay(message.attempts, EMAIL_RETRY_BASE_SECONDS, EMAIL_RETRY_MAX_SECONDS)
+            message.status = "queued"
+            message.run_after = datetime.utcnow() + timedelta(seconds=delay)
+            logger.warning(
+                f"Email {message_id} to {message.to_email}: attempt {message.attempts}/{message.max_attempts} "
+                f"failed, retrying in {int(delay)}s: {error}"
+            )
+        else:
+            message.status = "failed"
+            logger.error(f"Email {message_id} to {message.to_email} failed after {message.attempts} attempt(s): {error}")
+        await db.commit()
+
+async def requeue_expired_leases() -> int:
+    """Return messages held by a sender that stopped responding to the queue"""
+    async with AsyncSessionLocal() as db:
+        now = datetime.utcnow()
+        expired = (OutboundEmail.status == "sending", OutboundEmail.lease_expires_at < now)
+        # Counted as an attempt: the sender may have died mid-delivery
+        failed = await db.execute(
+            update(OutboundEmail)
+            .where(*expired, OutboundEmail.attempts + 1 >= OutboundEmail.max_attempts)
+            .values(
+                status="failed",
+                attempts=OutboundEmail.attempts + 1,
+                last_error="Sender lease expired",
+                locked_by=None,
+                lease_expires_at=None,
+            )
+        )
+        requeued = await db.execute(
+            update(OutboundEmail)
+            .where(*expired)
+            .values(
+                status="queued",
+                attempts=OutboundEmail.attempts + 1,
+                last_error="Sender lease expired",
+                locked_by=None,
+                lease_expires_at=None,
+                run_after=now,
+            )
+        )
+        await db.commit()
+        if failed.rowcount:
+            logger.error(f"Gave up on {failed.rowcount} email(s) whose sender lease expired too often")
+        if requeued.rowcount:
+            logger.warning(f"Requeued {requeued.rowcount} email(s) with expired sender leases")
+        return requeued.rowcount
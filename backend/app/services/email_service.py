@@ -1,10 +1,15 @@
+import base64
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import ssl
+import time
+from email.header import Header
+from email.utils import formataddr, parseaddr
 import os
-from fastapi import BackgroundTasks
 import logging
 
+from .email_outbox import queue_email
+from .email_templates import render, render_many
+
 logger = logging.getLogger(__name__)
 
 # Email configuration
@@ -13,70 +18,200 @@ EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
 EMAIL_USERNAME = os.getenv("EMAIL_USERNAME", "")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
 EMAIL_FROM = os.getenv("EMAIL_FROM", "ai.interview.copilot@example.com")
+# Envelope sender and From header, worked out once
+SENDER_ADDRESS = parseaddr(EMAIL_FROM)[1]
+SENDER_HEADER = formataddr(parseaddr(EMAIL_FROM))
+# STARTTLS before logging in; turn off for a local stand-in such as
+# `python -m aiosmtpd -n -l localhost:8025`
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "true").lower() == "true"
+# Without credentials nothing is delivered (messages stay queued) unless
+# this is set, e.g. for an unauthenticated local SMTP server
+EMAIL_DELIVERY_ENABLED = os.getenv(
+    "EMAIL_DELIVERY_ENABLED", "true" if EMAIL_USERNAME and EMAIL_PASSWORD else "false"
+).lower() == "true"
 
-def send_email_background(
-    to_email: str,
-    subject: str,
-    html_content: str
-):
-    """Send email in the background"""
-    try:
-        # Skip sending if credentials are not configured
-        if not EMAIL_USERNAME or not EMAIL_PASSWORD:
-            logger.warning("Email credentials not configured. Skipping email send.")
+# Connection reuse
+EMAIL_SMTP_TIMEOUT_SECONDS = float(os.getenv("EMAIL_SMTP_TIMEOUT_SECONDS", "30"))
+# Providers cap messages per session (Gmail drops the connection after ~100)
+EMAIL_MESSAGES_PER_CONNECTION = int(os.getenv("EMAIL_MESSAGES_PER_CONNECTION", "90"))
+# Connections idle longer than this are checked with NOOP before reuse
+EMAIL_SMTP_NOOP_AFTER_SECONDS = float(os.getenv("EMAIL_SMTP_NOOP_AFTER_SECONDS", "30"))
+
+# 4xx replies that mean "slow down / come back later" for the whole connection
+THROTTLE_CODES = {421, 454}
+
+class SMTPConnection:
+    """
+    One authenticated SMTP session, reused for many messages.
+
+    EHLO, STARTTLS and AUTH happen once per connection instead of once per
+    message. Blocking; the mail worker drives it from a thread and never
+    shares one between threads.
+    """
+
+    def __init__(self, host: str = EMAIL_HOST, port: int = EMAIL_PORT):
+        self.host = host
+        self.port = port
+        self._smtp = None
+        self._sent = 0
+        self._last_used = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._smtp is not None
+
+    @property
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self._last_used
+
+    def _open(self):
+        smtp = smtplib.SMTP(self.host, self.port, timeout=EMAIL_SMTP_TIMEOUT_SECONDS)
+        try:
+            smtp.ehlo()
+            if EMAIL_USE_TLS:
+                smtp.starttls(context=ssl.create_default_context())
+                smtp.ehlo()
+            if EMAIL_USERNAME and EMAIL_PASSWORD:
+                smtp.login(EMAIL_USERNAME, EMAIL_PASSWORD)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+        self._sent = 0
+        logger.info(f"Opened SMTP connection to {self.host}:{self.port}")
+
+    def _usable(self) -> bool:
+        if self._smtp is None:
+            return False
+        if self._sent >= EMAIL_MESSAGES_PER_CONNECTION:
+            self.close()
             return False
-            
-        # Create message
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = EMAIL_FROM
-        message["To"] = to_email
-        
-        # Add HTML content
-        html_part = MIMEText(html_content, "html")
-        message.attach(html_part)
-        
-        # Send email
-        with smtplib.SMTP(EMAIL_HOST, EMAIL_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
-            server.sendmail(EMAIL_FROM, to_email, message.as_string())
-            
-        logger.info(f"Email sent to {to_email}")
+        if self.idle_seconds > EMAIL_SMTP_NOOP_AFTER_SECONDS:
+            try:
+                code, _ = self._smtp.noop()
+            except (smtplib.SMTPException, OSError):
+                code = None
+            if code != 250:
+                self.close()
+                return False
         return True
-    except Exception as e:
-        logger.error(f"Failed to send email: {str(e)}")
+
+    def send(self, to_email: str, subject: str, html_content: str):
+        """Deliver one message, (re)connecting as needed; raises on failure"""
+        message = build_message(to_email, subject, html_content)
+        reused = self._usable()
+        if not reused:
+            self._open()
+        try:
+            self._smtp.sendmail(SENDER_ADDRESS, [to_email], message)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            if not reused:
+                raise
+            # The server dropped a connection we had kept around; once more on a fresh one
+            self._open()
+            self._smtp.sendmail(SENDER_ADDRESS, [to_email], message)
+        self._sent += 1
+        self._last_used = time.monotonic()
+
+    def close(self):
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+def _header(value: str) -> str:
+    """A header value on one line, RFC 2047-encoded if it isn't ASCII"""
+    value = " ".join(value.splitlines())
+    if value.isascii():
+        return value
+    return Header(value, "utf-8").encode()
+
+def build_message(to_email: str, subject: str, html_content: str) -> str:
+    """
+    The message as sent: a single base64-encoded text/html part.
+
+    Written out directly; building it with email.mime and as_string()
+    cost far more per message than rendering the template.
+    """
+    body = base64.encodebytes(html_content.encode("utf-8")).decode("ascii")
+    return (
+        'Content-Type: text/html; charset="utf-8"\n'
+        "MIME-Version: 1.0\n"
+        "Content-Transfer-Encoding: base64\n"
+        f"Subject: {_header(subject)}\n"
+        f"From: {SENDER_HEADER}\n"
+        f"To: {_header(to_email)}\n"
+        "\n"
+        f"{body}"
+    )
+
+def is_permanent_failure(error: Exception) -> bool:
+    """5xx replies about the message or recipient; retrying won't help"""
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        # Bad credentials affect every message; keep them queued until fixed
         return False
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+def is_connection_failure(error: Exception) -> bool:
+    """Errors that make the connection (not just this message) unusable for now"""
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError,
+                          smtplib.SMTPAuthenticationError, OSError)):
+        return True
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code in THROTTLE_CODES
+
+def describe_failure(error: Exception) -> str:
+    if isinstance(error, smtplib.SMTPResponseException):
+        detail = error.smtp_error.decode(errors="replace") if isinstance(error.smtp_error, bytes) else error.smtp_error
+        return f"{error.smtp_code} {detail}"
+    return str(error) or error.__class__.__name__
 
 def send_interview_invitation(
-    background_tasks: BackgroundTasks,
+    db,
     to_email: str,
     candidate_name: str,
     interviewer_name: str,
     interview_topic: str,
-    scheduled_time: str,
-    interview_link: str
+    scheduled_time,
+    interview_link: str,
+    session_id: int = None
 ):
-    """Send interview invitation email to candidate"""
-    subject = f"Interview Invitation: {interview_topic}"
-    
-    html_content = f"""
-    <html>
-    <body>
-        <h2>Interview Invitation</h2>
-        <p>Hello {candidate_name},</p>
-        <p>You have been invited to an interview with {interviewer_name} for {interview_topic}.</p>
-        <p><strong>Scheduled Time:</strong> {scheduled_time}</p>
-        <p>Please click the link below to join the interview:</p>
-        <p><a href="{interview_link}">Join Interview</a></p>
-        <p>Best regards,<br>AI Interview Co-Pilot Team</p>
-    </body>
-    </html>
+    """Queue the interview invitation email to the candidate (the caller commits)"""
+    subject, html_content = render(
+        "interview_invitation",
+        recipient_name=candidate_name,
+        interviewer_name=interviewer_name,
+        topic=interview_topic,
+        scheduled_time=scheduled_time,
+        interview_link=interview_link,
+    )
+    return queue_email(db, to_email, subject, html_content, session_id=session_id)
+
+def interview_invitations(invitations) -> list:
+    """
+    Outbox rows for many invitations at once, for email_outbox.queue_many.
+
+    Each invitation is a dict with session_id, to_email, candidate_name,
+    interviewer_name, interview_topic, scheduled_time and interview_link.
     """
-    
-    background_tasks.add_task(
-        send_email_background,
-        to_email=to_email,
-        subject=subject,
-        html_content=html_content
-    )
\ No newline at end of file
+    rendered = render_many("interview_invitation", (
+        {
+            "recipient_name": invitation["candidate_name"],
+            "interviewer_name": invitation["interviewer_name"],
+            "topic": invitation["interview_topic"],
+            "scheduled_time": invitation["scheduled_time"],
+            "interview_link": invitation["interview_link"],
+        }
+        for invitation in invitations
+    ))
+    return [
+        {"session_id": invitation["session_id"], "to_email": invitation["to_email"], "subject": subject, "html_content": html}
+        for invitation, (subject, html) in zip(invitations, rendered)
+    ]
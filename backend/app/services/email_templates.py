@@ -0,0 +1,107 @@
+# backend/app/services/email_templates.py
+"""
+HTML email templates (app/templates/email).
+
+Every template is compiled once, by load_templates() at startup or on
+first use, and never re-checked on disk. Jinja2 itself is imported then
+too, so importing this module (every router does, through email_service)
+costs nothing. The pieces all emails share (the
+<style> block and the footer) are rendered once, again only when the year
+in the footer changes, and embedded as ready-made markup. render_many()
+renders a batch of messages from one template, for reminder runs.
+
+Each template sets a ``subject`` variable next to its body, read from the
+template's module (public Jinja API, no block internals). Values are
+HTML-escaped in the body; the subject is plain text.
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple
+
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+TEMPLATES = (
+    "candidate_scheduled", "interviewer_scheduled", "interview_invitation",
+    "candidate_reminder", "interviewer_reminder",
+)
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    html: str
+
+def format_datetime(value) -> str:
+    """Format a datetime (or ISO string) as a human-readable string"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value.strftime("%A, %B %d, %Y at %I:%M %p")
+
+_env = None
+_templates: Dict[str, "Template"] = {}
+# Pre-rendered shared markup, and the year the footer was rendered for
+_fragments: Dict[str, Markup] = {}
+_fragments_year = None
+
+def _environment() -> "Environment":
+    global _env
+    if _env is None:
+        from jinja2 import Environment, FileSystemLoader, StrictUndefined
+
+        env = Environment(
+            loader=FileSystemLoader(str(TEMPLATES_DIR)),
+            autoescape=True,
+            auto_reload=False,
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        env.filters["datetime"] = format_datetime
+        _env = env
+    return _env
+
+def _refresh_fragments():
+    global _fragments_year
+    year = datetime.now().year
+    if year == _fragments_year:
+        return
+    env = _environment()
+    _fragments["style"] = Markup(env.get_template("_style.html").render())
+    _fragments["footer"] = Markup(env.get_template("_footer.html").render(year=year))
+    _fragments_year = year
+
+def load_templates():
+    """Compile every email template and pre-render the shared fragments"""
+    env = _environment()
+    for name in TEMPLATES:
+        _templates[name] = env.get_template(f"{name}.html")
+    _refresh_fragments()
+
+def _template(name: str) -> "Template":
+    if not _templates:
+        load_templates()
+    try:
+        return _templates[name]
+    except KeyError:
+        raise ValueError(f"Unknown email template: {name}")
+
+def _render(template: "Template", context: dict) -> RenderedEmail:
+    # One render gives both: the module's text is the body, and top-level
+    # {% set %} values (the subject) are its attributes
+    module = template.make_module({**_fragments, **context})
+    # striptags() also undoes the escaping and collapses whitespace
+    return RenderedEmail(Markup(module.subject).striptags(), str(module))
+
+def render(name: str, **context) -> RenderedEmail:
+    """Render one email, e.g. render("candidate_scheduled", recipient_name=..., ...)"""
+    template = _template(name)
+    _refresh_fragments()
+    return _render(template, context)
+
+def render_many(name: str, contexts: Iterable[dict]) -> List[RenderedEmail]:
+    """Render one template for many recipients"""
+    template = _template(name)
+    _refresh_fragments()
+    return [_render(template, context) for context in contexts]
@@ -0,0 +1,98 @@
+# backend/app/services/http_clients.py
+"""
+App-lifetime registry of pooled httpx clients for external services.
+
+One AsyncClient per upstream keeps TCP/TLS connections alive between calls
+(and multiplexes over HTTP/2 when enabled) instead of paying a fresh
+handshake per request. Because each client talks to a single host, its
+connection limits are effectively per-host limits.
+
+Registering a client only records its settings. httpx is imported and
+the client created on first get(), so an API process that never calls an
+upstream doesn't load either; the pipeline worker opens its clients up
+front with startup(). shutdown() closes whatever was opened.
+"""
+import logging
+import os
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+HTTP_ENABLE_HTTP2 = os.getenv("HTTP_ENABLE_HTTP2", "false").lower() == "true"
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+class HTTPClientRegistry:
+    def __init__(self):
+        self._configs: Dict[str, dict] = {}
+        self._clients: Dict[str, "httpx.AsyncClient"] = {}
+
+    def register(
+        self,
+        name: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        timeout: Optional[dict] = None,
+        http2: bool = HTTP_ENABLE_HTTP2,
+    ):
+        """Record a client's settings; ``timeout`` holds httpx.Timeout arguments"""
+        self._configs[name] = {
+            "limits": {
+                "max_connections": max_connections,
+                "max_keepalive_connections": max_keepalive_connections,
+                "keepalive_expiry": keepalive_expiry,
+            },
+            "timeout": timeout or {"timeout": 30.0},
+            "http2": http2,
+        }
+
+    def _create(self, name: str) -> "httpx.AsyncClient":
+        import httpx
+
+        config = self._configs[name]
+        http2 = config["http2"]
+        if http2:
+            try:
+                import h2  # noqa: F401  (httpx needs it for HTTP/2)
+            except ImportError:
+                logger.warning("HTTP_ENABLE_HTTP2 is set but 'h2' is not installed; using HTTP/1.1")
+                http2 = False
+        return httpx.AsyncClient(
+            limits=httpx.Limits(**config["limits"]),
+            timeout=httpx.Timeout(**config["timeout"]),
+            http2=http2,
+        )
+
+    def get(self, name: str) -> "httpx.AsyncClient":
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._clients[name] = self._create(name)
+        return client
+
+    async def startup(self):
+        for name in self._configs:
+            self.get(name)
+        logger.info(f"HTTP clients ready: {', '.join(self._configs)}")
+
+    async def shutdown(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+http_clients = HTTPClientRegistry()
+
+# AssemblyAI: large uploads and long transcripts, so generous write/read timeouts
+http_clients.register(
+    "assemblyai",
+    max_connections=int(os.getenv("ASSEMBLYAI_MAX_CONNECTIONS", "10")),
+    max_keepalive_connections=int(os.getenv("ASSEMBLYAI_MAX_KEEPALIVE", "5")),
+    timeout={"connect": 10.0, "read": 120.0, "write": 300.0, "pool": 30.0},
+)
+
+# OpenAI: completions can take close to a minute
+http_clients.register(
+    "openai",
+    max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "20")),
+    max_keepalive_connections=int(os.getenv("OPENAI_MAX_KEEPALIVE", "10")),
+    timeout={"connect": 10.0, "read": 60.0, "write": 30.0, "pool": 30.0},
+)
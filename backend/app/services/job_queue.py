@@ -0,0 +1,270 @@
+# backend/app/services/job_queue.py
+"""
+Persistent, DB-backed job queue for the transcription/analysis pipeline.
+
+Jobs live in the processing_jobs table, so queued work survives restarts.
+A worker claims a job with a conditional UPDATE (queued -> running), which
+is safe across processes on both SQLite and PostgreSQL. While it runs the
+job it holds a lease that it keeps extending; jobs whose lease expires
+(worker crashed or was killed) go back to the queue. Failures are retried
+with exponential backoff until max_attempts is reached. Idle workers poll
+with a growing interval; committing a new job wakes this process's
+workers for that stage right away.
+
+Every transition is mirrored onto InterviewSession.is_processing and
+InterviewSession.error_message, which the review page polls.
+"""
+import asyncio
+import logging
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import AsyncSessionLocal
+from ..models.interview import InterviewSession
+from ..models.job import ProcessingJob
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("transcription", "analysis")
+
+# Queue settings
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "30"))
+JOB_RETRY_MAX_SECONDS = float(os.getenv("JOB_RETRY_MAX_SECONDS", "1800"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "120"))
+
+# Session.info key for stages that got a job in the current transaction
+QUEUED_STAGES = "job_queue_stages"
+# stage -> (loop, event) of the local workers waiting for it
+_wakeups: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+class PermanentJobError(Exception):
+    """Raised by a stage handler when retrying cannot help (bad input, missing config)"""
+
+def retry_delay(
+    attempts: int,
+    base: float = JOB_RETRY_BASE_SECONDS,
+    maximum: float = JOB_RETRY_MAX_SECONDS
+) -> float:
+    """Exponential backoff with full jitter for the given attempt number (1-based)"""
+    ceiling = min(maximum, base * (2 ** max(attempts - 1, 0)))
+    return random.uniform(ceiling / 2, ceiling)
+
+async def enqueue_job(
+    db: AsyncSession,
+    session_id: int,
+    stage: str,
+    run_after: Optional[datetime] = None,
+    bypass_cache: bool = False,
+    restart: bool = False
+) -> ProcessingJob:
+    """
+    Queue a stage for an interview unless one is already queued or running.
+
+    ``bypass_cache`` makes the stage ignore cached provider results.
+    ``restart`` cancels a queued or running job for the stage and queues a
+    new one (its inputs changed, e.g. a new recording). The caller owns the
+    transaction and must commit.
+    """
+    if stage not in STAGES:
+        raise ValueError(f"Unknown pipeline stage: {stage}")
+
+    result = await db.execute(
+        select(ProcessingJob).where(
+            ProcessingJob.session_id == session_id,
+            ProcessingJob.stage == stage,
+            ProcessingJob.status.in_(("queued", "running")),
+        )
+    )
+    job = result.scalars().first()
+    if job is not None and restart:
+        # A running worker sees it lost the job before storing its result
+        job.status = "cancelled"
+        job.locked_by = None
+        job.lease_expires_at = None
+        job = None
+    if job is None:
+        job = ProcessingJob(
+            session_id=session_id,
+            stage=stage,
+            status="queued",
+            max_attempts=JOB_MAX_ATTEMPTS,
+            run_after=run_after or datetime.utcnow(),
+            bypass_cache=bypass_cache,
+        )
+        db.add(job)
+    elif bypass_cache:
+        job.bypass_cache = True
+    db.info.setdefault(QUEUED_STAGES, set()).add(stage)
+
+    await db.execute(
+        update(InterviewSession)
+        .where(InterviewSession.id == session_id)
+        .values(is_processing=True, error_message=None)
+    )
+    await db.flush()
+    return job
+
+def job_wakeup(stage: str) -> asyncio.Event:
+    """An event set whenever a job for ``stage`` is committed in this process"""
+    wakeup = asyncio.Event()
+    _wakeups.setdefault(stage, []).append((asyncio.get_running_loop(), wakeup))
+    return wakeup
+
+def discard_wakeup(stage: str, wakeup: asyncio.Event):
+    _wakeups[stage] = [entry for entry in _wakeups.get(stage, ()) if entry[1] is not wakeup]
+
+# AsyncSession runs on a sync Session, so these cover both
+@event.listens_for(Session, "after_commit")
+def _wake_workers(session):
+    for stage in session.info.pop(QUEUED_STAGES, ()):
+        for loop, wakeup in _wakeups.get(stage, ()):
+            # Commits may happen on another thread or loop than the worker's
+            loop.call_soon_threadsafe(wakeup.set)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_queued(session):
+    session.info.pop(QUEUED_STAGES, None)
+
+async def claim_job(stage: str, worker_id: str) -> Optional[ProcessingJob]:
+    """Atomically move the next due job for a stage to running; None if the queue is empty"""
+    async with AsyncSessionLocal() as db:
+        now = datetime.utcnow()
+        # A few candidates so one lost race doesn't leave the worker idle
+        result = await db.execute(
+            select(ProcessingJob.id)
+            .where(
+                ProcessingJob.stage == stage,
+                ProcessingJob.status == "queued",
+                ProcessingJob.run_after <= now,
+            )
+            .order_by(ProcessingJob.run_after, ProcessingJob.id)
+            .limit(5)
+        )
+        for job_id in result.scalars().all():
+            claimed = await db.execute(
+                update(ProcessingJob)
+                .where(ProcessingJob.id == job_id, ProcessingJob.status == "queued")
+                .values(
+                    status="running",
+                    locked_by=worker_id,
+                    lease_expires_at=now + timedelta(seconds=JOB_LEASE_SECONDS),
+                    attempts=ProcessingJob.attempts + 1,
+                )
+            )
+            if claimed.rowcount == 1:
+                await db.commit()
+                return await db.get(ProcessingJob, job_id)
+        await db.rollback()
+        return None
+
+async def extend_lease(job_id: int, worker_id: str) -> bool:
+    """Heartbeat for a running job; False means the lease was lost"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.id == job_id,
+                ProcessingJob.status == "running",
+                ProcessingJob.locked_by == worker_id,
+            )
+            .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=JOB_LEASE_SECONDS))
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+async def complete_job(job_id: int, worker_id: str, processing_done: bool = False):
+    """Mark a job succeeded; processing_done clears is_processing on the interview"""
+    async with AsyncSessionLocal() as db:
+        job = await db.get(ProcessingJob, job_id)
+        if job is None or job.locked_by != worker_id:
+            logger.warning(f"Job {job_id} completed by {worker_id} but is no longer leased to it")
+            return
+        job.status = "succeeded"
+        job.last_error = None
+        job.locked_by = None
+        job.lease_expires_at = None
+        if processing_done:
+            await db.execute(
+                update(InterviewSession)
+                .where(InterviewSession.id == job.session_id)
+                .values(is_processing=False, error_message=None)
+            )
+        await db.commit()
+
+async def fail_job(job_id: int, worker_id: str, error: str, retryable: bool = True):
+    """Record a failure and either schedule a retry or give up"""
+    async with AsyncSessionLocal() as db:
+        job = await db.get(ProcessingJob, job_id)
+        if job is None or job.locked_by != worker_id:
+            return
+        job.last_error = error
+        job.locked_by = None
+        job.lease_expires_at = None
+
+        if retryable and job.attempts < job.max_attempts:
+            delay = retry_delay(job.attempts)
+            job.status = "queued"
+            job.run_after = datetime.utcnow() + timedelta(seconds=delay)
+            message = f"{job.stage} attempt {job.attempts}/{job.max_attempts} failed, retrying in {int(delay)}s: {error}"
+            values = {"error_message": message}
+            logger.warning(f"Job {job_id}: {message}")
+        else:
+            job.status = "failed"
+            values = {"is_processing": False, "error_message": f"{job.stage} failed: {error}"}
+            logger.error(f"Job {job_id} ({job.stage}) failed permanently after {job.attempts} attempts: {error}")
+
+        await db.execute(
+            update(InterviewSession).where(InterviewSession.id == job.session_id).values(**values)
+        )
+        await db.commit()
+
+async def requeue_expired_leases() -> int:
+    """Return jobs whose worker stopped heart-beating to the queue (crash recovery)"""
+    async with AsyncSessionLocal() as db:
+        now = datetime.utcnow()
+        result = await db.execute(
+            select(ProcessingJob).where(
+                ProcessingJob.status == "running",
+                ProcessingJob.lease_expires_at < now,
+            )
+        )
+        requeued = 0
+        for job in result.scalars().all():
+            # A job that keeps killing its worker must not loop forever
+            exhausted = job.attempts >= job.max_attempts
+            changed = await db.execute(
+                update(ProcessingJob)
+                .where(
+                    ProcessingJob.id == job.id,
+                    ProcessingJob.status == "running",
+                    ProcessingJob.lease_expires_at < now,
+                )
+                .values(
+                    status="failed" if exhausted else "queued",
+                    last_error="Worker lease expired",
+                    locked_by=None,
+                    lease_expires_at=None,
+                    run_after=now,
+                )
+            )
+            if changed.rowcount != 1:
+                continue
+            if exhausted:
+                await db.execute(
+                    update(InterviewSession)
+                    .where(InterviewSession.id == job.session_id)
+                    .values(is_processing=False, error_message=f"{job.stage} failed: worker lease expired")
+                )
+            else:
+                requeued += 1
+        await db.commit()
+        if requeued:
+            logger.warning(f"Requeued {requeued} job(s) with expired leases")
+        return requeued
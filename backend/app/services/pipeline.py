@@ -0,0 +1,128 @@
+# backend/app/services/pipeline.py
+"""
+Stage handlers for the recording -> transcript -> analysis pipeline.
+
+Each handler loads its inputs in a short transaction, does the slow
+external call outside any transaction, then writes results (and queues
+the next stage) in one commit. Handlers return True when the interview
+has no further processing to do.
+"""
+import logging
+
+from sqlalchemy import update
+
+from ..database import AsyncSessionLocal
+from ..models.interview import InterviewSession
+from ..models.job import ProcessingJob
+from .artifacts import get_artifacts
+from .job_queue import PermanentJobError, enqueue_job
+from .result_cache import file_key, get_cached, set_cached
+from .transcription import TRANSCRIPT_OPTIONS, TranscriptionError, transcribe_audio, wait_for_transcript
+from .ai_analysis import analyze_interview, interview_context
+
+logger = logging.getLogger(__name__)
+
+async def _set_transcript_id(job_id: int, transcript_id):
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(ProcessingJob)
+            .where(ProcessingJob.id == job_id)
+            .values(external_id=transcript_id, external_status=None)
+        )
+        await db.commit()
+
+async def run_transcription_stage(job_id: int, session_id: int) -> bool:
+    async with AsyncSessionLocal() as db:
+        session = await db.get(InterviewSession, session_id)
+        if session is None:
+            raise PermanentJobError(f"Interview session {session_id} no longer exists")
+        recording_path = session.recording_path
+        job = await db.get(ProcessingJob, job_id)
+        transcript_id = job.external_id
+        bypass_cache = job.bypass_cache
+
+    # The same recording always yields the same transcript
+    cache_key = None
+    if recording_path:
+        try:
+            cache_key = await file_key("transcript", recording_path, TRANSCRIPT_OPTIONS)
+        except FileNotFoundError:
+            if not transcript_id:
+                raise PermanentJobError(f"Recording not found: {recording_path}")
+    result = None
+    if cache_key and not bypass_cache:
+        result = await get_cached("transcript", cache_key)
+    from_cache = result is not None
+
+    try:
+        if from_cache:
+            logger.info(f"Using cached transcript for session {session_id}")
+        elif transcript_id:
+            # Retry/resume after a crash: the provider already has the audio
+            logger.info(f"Resuming wait on transcript {transcript_id} for session {session_id}")
+            result = await wait_for_transcript(transcript_id)
+        elif recording_path:
+            result = await transcribe_audio(
+                recording_path,
+                session_id,
+                on_submitted=lambda tid: _set_transcript_id(job_id, tid)
+            )
+        else:
+            raise PermanentJobError("No recording has been uploaded for this interview")
+    except FileNotFoundError as e:
+        raise PermanentJobError(str(e))
+    except TranscriptionError:
+        # The provider gave up on this transcript; resubmit on the next attempt
+        await _set_transcript_id(job_id, None)
+        raise
+
+    async with AsyncSessionLocal() as db:
+        job = await db.get(ProcessingJob, job_id)
+        if job.status == "cancelled":
+            # A new recording was uploaded meanwhile; this transcript is for the old one
+            raise PermanentJobError(f"Transcription job {job_id} was replaced by a newer recording")
+    if cache_key and not from_cache:
+        await set_cached("transcript", cache_key, result)
+
+    async with AsyncSessionLocal() as db:
+        artifacts = await get_artifacts(db, session_id, create=True)
+        artifacts.transcript = result["text"]
+        artifacts.transcript_json = result["utterances"]
+        await enqueue_job(db, session_id, "analysis", bypass_cache=bypass_cache)
+        await db.commit()
+    logger.info(f"Transcript stored for session {session_id}; analysis queued")
+    return False
+
+async def run_analysis_stage(job_id: int, session_id: int) -> bool:
+    async with AsyncSessionLocal() as db:
+        session = await db.get(InterviewSession, session_id)
+        if session is None:
+            raise PermanentJobError(f"Interview session {session_id} no longer exists")
+        context = interview_context(session)
+        artifacts = await get_artifacts(db, session_id)
+        transcript = artifacts and (artifacts.transcript_json or artifacts.transcript)
+        job = await db.get(ProcessingJob, job_id)
+        bypass_cache = job.bypass_cache
+    if not transcript:
+        raise PermanentJobError("No transcript available to analyze")
+
+    try:
+        analysis = await analyze_interview(transcript, context, use_cache=not bypass_cache)
+    except ValueError as e:
+        # Missing API key or similar configuration problem
+        raise PermanentJobError(str(e))
+    if "error" in analysis:
+        raise RuntimeError(analysis["error"])
+
+    async with AsyncSessionLocal() as db:
+        artifacts = await get_artifacts(db, session_id, create=True)
+        artifacts.ai_summary = analysis.get("summary")
+        artifacts.ai_detailed_analysis = analysis.get("detailed")
+        await db.commit()
+    logger.info(f"Analysis stored for session {session_id}")
+    return True
+
+STAGE_HANDLERS = {
+    "transcription": run_transcription_stage,
+    "analysis": run_analysis_stage,
+}
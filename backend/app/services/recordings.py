@@ -0,0 +1,218 @@
+# backend/app/services/recordings.py
+"""
+On-disk storage for interview recordings.
+
+Uploads arrive in chunks and are appended to a ``.part`` file, so a
+dropped connection only costs the chunk in flight: the client asks for
+the current offset and carries on from there. Every chunk is written
+through a bounded buffer and hashed as it streams, so memory use does
+not depend on the recording size.
+
+Writers to one interview's upload are serialized by upload_lock(): an
+asyncio lock within the process plus an exclusive OS lock on a lock file
+next to the recording, which covers every worker process on the host.
+Chunks are checked against the size of the partial file on disk while
+the lock is held, so two concurrent PUTs for the same offset can't both
+be appended. The recordings directory is local, so all requests for one
+upload must reach the same host.
+"""
+import asyncio
+import hashlib
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Where finished recordings (and in-progress .part files) live
+RECORDINGS_DIR = Path(
+    os.getenv("RECORDINGS_DIR", str(Path(__file__).resolve().parent.parent.parent / "recordings"))
+)
+RECORDINGS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Largest chunk the client may send per request, and largest recording overall
+UPLOAD_CHUNK_MAX_BYTES = int(os.getenv("UPLOAD_CHUNK_MAX_BYTES", str(8 * 1024 * 1024)))
+RECORDING_MAX_BYTES = int(os.getenv("RECORDING_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+# Bytes gathered from the socket before each write/read on disk
+FILE_IO_BLOCK_BYTES = int(os.getenv("FILE_IO_BLOCK_BYTES", str(1024 * 1024)))
+
+class UploadError(Exception):
+    """A chunk was rejected; the partial file is left at its previous offset"""
+
+class OffsetMismatch(UploadError):
+    def __init__(self, expected: int):
+        super().__init__(f"Upload is at offset {expected}")
+        self.expected = expected
+
+# How often a writer retries a lock file held by another process
+UPLOAD_LOCK_POLL_SECONDS = 0.05
+
+# session id -> (lock, holders and waiters); created inside the running loop
+# and dropped when nobody uses it
+_upload_locks: Dict[int, Tuple[asyncio.Lock, int]] = {}
+
+def lock_path(session_id: int) -> Path:
+    return RECORDINGS_DIR / f"interview_{session_id}.upload.lock"
+
+def _try_lock(handle) -> bool:
+    if os.name == "nt":
+        import msvcrt
+
+        handle.seek(0)
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+    import fcntl
+
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+def _unlock(handle):
+    if os.name == "nt":
+        import msvcrt
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+@asynccontextmanager
+async def _file_lock(session_id: int):
+    """Exclusive lock shared with other processes; the OS releases it if one dies"""
+    handle = await asyncio.to_thread(open, lock_path(session_id), "a+b")
+    try:
+        while not _try_lock(handle):
+            await asyncio.sleep(UPLOAD_LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock(handle)
+    finally:
+        await asyncio.to_thread(handle.close)
+
+@asynccontextmanager
+async def upload_lock(session_id: int):
+    """One writer per interview at a time, across the host's processes"""
+    lock, users = _upload_locks.get(session_id, (None, 0))
+    if lock is None:
+        lock = asyncio.Lock()
+    _upload_locks[session_id] = (lock, users + 1)
+    try:
+        # Same-process writers queue on the asyncio lock, not by polling the file
+        async with lock:
+            async with _file_lock(session_id):
+                yield
+    finally:
+        lock, users = _upload_locks[session_id]
+        if users == 1:
+            del _upload_locks[session_id]
+        else:
+            _upload_locks[session_id] = (lock, users - 1)
+
+def recording_path(session_id: int) -> Path:
+    return RECORDINGS_DIR / f"interview_{session_id}.webm"
+
+def partial_path(session_id: int) -> Path:
+    return RECORDINGS_DIR / f"interview_{session_id}.webm.part"
+
+def upload_offset(session_id: int) -> int:
+    """Bytes received so far for an in-progress upload (0 if none)"""
+    try:
+        return partial_path(session_id).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+def reset_upload(session_id: int):
+    """Start a fresh upload, discarding any partial data"""
+    partial_path(session_id).write_bytes(b"")
+
+def _truncate(path: Path, size: int):
+    with open(path, "r+b") as f:
+        f.truncate(size)
+
+async def append_chunk(
+    session_id: int,
+    offset: int,
+    chunks,
+    expected_sha256: str = None,
+    max_bytes: int = UPLOAD_CHUNK_MAX_BYTES
+) -> int:
+    """
+    Append one uploaded chunk, streamed from the async iterable ``chunks``.
+
+    Call it under upload_lock(). The chunk must start at the current end of
+    the partial file on disk. If it is
+    larger than ``max_bytes`` or its SHA-256 does not match, the file is
+    truncated back to ``offset`` and UploadError is raised. Returns the new
+    offset.
+    """
+    path = partial_path(session_id)
+    current = upload_offset(session_id)
+    if not path.exists():
+        raise UploadError("No upload in progress; start one first")
+    if offset != current:
+        raise OffsetMismatch(current)
+
+    digest = hashlib.sha256()
+    written = 0
+    buffer = bytearray()
+    f = await asyncio.to_thread(open, path, "ab")
+    try:
+        async for data in chunks:
+            digest.update(data)
+            written += len(data)
+            if written > max_bytes or offset + written > RECORDING_MAX_BYTES:
+                raise UploadError("Chunk exceeds the upload size limit")
+            buffer += data
+            if len(buffer) >= FILE_IO_BLOCK_BYTES:
+                await asyncio.to_thread(f.write, bytes(buffer))
+                buffer.clear()
+        if buffer:
+            await asyncio.to_thread(f.write, bytes(buffer))
+        await asyncio.to_thread(f.close)
+        if expected_sha256 and digest.hexdigest() != expected_sha256.lower():
+            raise UploadError("Chunk checksum mismatch")
+    except BaseException:
+        # Includes client disconnects mid-chunk: roll back to the last good offset
+        await asyncio.to_thread(f.close)
+        await asyncio.to_thread(_truncate, path, offset)
+        raise
+    return offset + written
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(FILE_IO_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+async def finalize_upload(session_id: int, expected_sha256: str = None) -> Path:
+    """Verify the whole file (if a checksum is given) and move it into place"""
+    path = partial_path(session_id)
+    if not path.exists() or path.stat().st_size == 0:
+        raise UploadError("No recording data has been uploaded")
+    if expected_sha256:
+        actual = await asyncio.to_thread(_file_sha256, path)
+        if actual != expected_sha256.lower():
+            raise UploadError("Recording checksum mismatch")
+    final = recording_path(session_id)
+    await asyncio.to_thread(os.replace, path, final)
+    return final
+
+async def iter_file(path, block_size: int = FILE_IO_BLOCK_BYTES):
+    """Async generator over a file's contents, read off the event loop"""
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while True:
+            block = await asyncio.to_thread(f.read, block_size)
+            if not block:
+                break
+            yield block
+    finally:
+        await asyncio.to_thread(f.close)
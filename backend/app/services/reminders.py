@@ -0,0 +1,148 @@
+# backend/app/services/reminders.py
+"""
+Reminder emails for upcoming interviews.
+
+dispatch_due_reminders() reads interviews starting within the next
+REMINDER_LEAD_MINUTES, in scheduled_time order and in batches, through
+ix_interview_sessions_scheduled_time. Its cost follows the interviews in
+that window, not the size of the table. For every batch it marks the
+sessions (reminders_queued_at) and queues the candidate and interviewer
+emails in one transaction. The marker is only set where it is still
+empty, so a session is reminded exactly once even when several
+schedulers run.
+
+An interview scheduled less than REMINDER_LEAD_MINUTES ahead is reminded
+on the next run; one whose start has passed never is. The mail worker runs
+the dispatcher every REMINDER_INTERVAL_SECONDS.
+"""
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
+
+from sqlalchemy import false, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import AsyncSessionLocal
+from ..models.interview import InterviewSession
+from ..models.user import User
+from .email_outbox import queue_many
+from .email_templates import render_many
+
+logger = logging.getLogger(__name__)
+
+REMINDER_LEAD_MINUTES = float(os.getenv("REMINDER_LEAD_MINUTES", "1440"))
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "200"))
+REMINDER_INTERVAL_SECONDS = float(os.getenv("REMINDER_INTERVAL_SECONDS", "60"))
+
+REMINDER_COLUMNS = (
+    InterviewSession.id,
+    InterviewSession.scheduled_time,
+    InterviewSession.interview_topic,
+    InterviewSession.candidate_level,
+    InterviewSession.focus_areas,
+    InterviewSession.candidate_name,
+    InterviewSession.candidate_email,
+    InterviewSession.interviewer_name,
+    # The interviewer's account address unless the session names one
+    func.coalesce(InterviewSession.interviewer_email, User.email).label("interviewer_email"),
+)
+
+def due_reminders_query(now: datetime, horizon: datetime, limit: int):
+    return (
+        select(*REMINDER_COLUMNS)
+        .outerjoin(User, User.id == InterviewSession.interviewer_id)
+        .where(
+            InterviewSession.scheduled_time >= now,
+            InterviewSession.scheduled_time < horizon,
+            InterviewSession.reminders_queued_at.is_(None),
+            InterviewSession.is_canceled == false(),
+            InterviewSession.is_completed == false(),
+        )
+        .order_by(InterviewSession.scheduled_time, InterviewSession.id)
+        .limit(limit)
+    )
+
+def reminder_messages(rows) -> List[dict]:
+    """Outbox rows for a batch of sessions, rendered per template in bulk"""
+    messages = []
+    candidates = [row for row in rows if row.candidate_email]
+    rendered = render_many("candidate_reminder", (
+        {
+            "recipient_name": row.candidate_name,
+            "topic": row.interview_topic,
+            "scheduled_time": row.scheduled_time,
+            "interviewer_name": row.interviewer_name,
+        }
+        for row in candidates
+    ))
+    for row, (subject, html) in zip(candidates, rendered):
+        messages.append({"session_id": row.id, "to_email": row.candidate_email, "subject": subject, "html_content": html})
+
+    interviewers = [row for row in rows if row.interviewer_email]
+    rendered = render_many("interviewer_reminder", (
+        {
+            "recipient_name": row.interviewer_name,
+            "topic": row.interview_topic,
+            "scheduled_time": row.scheduled_time,
+            "candidate_name": row.candidate_name,
+            "candidate_level": row.candidate_level,
+            "focus_areas": row.focus_areas,
+        }
+        for row in interviewers
+    ))
+    for row, (subject, html) in zip(interviewers, rendered):
+        messages.append({"session_id": row.id, "to_email": row.interviewer_email, "subject": subject, "html_content": html})
+    return messages
+
+async def mark_reminded(db: AsyncSession, session_ids: List[int], now: datetime) -> Set[int]:
+    """
+    Set the marker on the sessions that don't have it yet; returns those.
+
+    Sessions another scheduler marked since they were read are left to it.
+    One UPDATE ... RETURNING where the database supports it (PostgreSQL,
+    SQLite 3.35+), else one conditional UPDATE per session.
+    """
+    unmarked = (InterviewSession.reminders_queued_at.is_(None),)
+    if db.bind.dialect.update_returning:
+        result = await db.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id.in_(session_ids), *unmarked)
+            .values(reminders_queued_at=now)
+            .returning(InterviewSession.id)
+        )
+        return set(result.scalars().all())
+    marked = set()
+    for session_id in session_ids:
+        result = await db.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id == session_id, *unmarked)
+            .values(reminders_queued_at=now)
+        )
+        if result.rowcount == 1:
+            marked.add(session_id)
+    return marked
+
+async def dispatch_due_reminders(
+    now: Optional[datetime] = None,
+    lead_minutes: float = REMINDER_LEAD_MINUTES,
+    batch_size: int = REMINDER_BATCH_SIZE
+) -> int:
+    """Queue reminders for every unreminded interview in the window; returns emails queued"""
+    now = now or datetime.utcnow()
+    horizon = now + timedelta(minutes=lead_minutes)
+    queued = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(due_reminders_query(now, horizon, batch_size))).all()
+            if not rows:
+                return queued
+            marked = await mark_reminded(db, [row.id for row in rows], now)
+            claimed = [row for row in rows if row.id in marked]
+            messages = reminder_messages(claimed)
+            await queue_many(db, messages)
+            await db.commit()
+        queued += len(messages)
+        logger.info(f"Queued {len(messages)} reminder(s) for {len(claimed)} interview(s)")
+        if len(rows) < batch_size:
+            return queued
@@ -0,0 +1,151 @@
+# backend/app/services/result_cache.py
+"""
+Persistent cache for provider results, keyed by a hash of their inputs.
+
+Transcripts are keyed by the SHA-256 of the recording bytes plus the
+transcription options; analyses by the SHA-256 of the exact OpenAI
+request (prompt, model and sampling parameters). Re-running a stage on
+unchanged inputs, or retrying after a later step failed, is then served
+from the result_cache table instead of the providers.
+
+Entries expire after RESULT_CACHE_TTL_DAYS. When the stored values of
+one kind exceed RESULT_CACHE_MAX_MB, the least recently used entries of
+that kind are evicted. Callers can bypass the cache per request.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from ..database import AsyncSessionLocal
+from ..models.cache import CachedResult
+
+logger = logging.getLogger(__name__)
+
+# Cache settings
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+RESULT_CACHE_TTL_DAYS = float(os.getenv("RESULT_CACHE_TTL_DAYS", "30"))
+RESULT_CACHE_MAX_MB = float(os.getenv("RESULT_CACHE_MAX_MB", "256"))
+
+def _digest(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        # Canonical JSON so dict ordering never changes the key
+        digest.update(json.dumps(part, sort_keys=True, separators=(",", ":")).encode())
+        digest.update(b"\0")
+    return digest
+
+def request_key(kind: str, payload) -> str:
+    """Key for a JSON-serialisable request (e.g. an OpenAI request body)"""
+    return _digest(kind, payload).hexdigest()
+
+def _file_key(kind: str, path: Path, options) -> str:
+    digest = _digest(kind, options)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+async def file_key(kind: str, path, options=None) -> str:
+    """Key for a file's contents plus the options it is processed with"""
+    return await asyncio.to_thread(_file_key, kind, Path(path), options)
+
+async def get_cached(kind: str, key: str):
+    """Return the cached value for ``key`` (or None), refreshing its LRU position"""
+    if not RESULT_CACHE_ENABLED:
+        return None
+    try:
+        return await _get(kind, key)
+    except Exception as e:
+        # The cache is an optimisation; never fail a stage because of it
+        logger.warning(f"Result cache lookup failed: {e}")
+        return None
+
+async def _get(kind: str, key: str):
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        entry = await db.get(CachedResult, key)
+        if entry is None or entry.kind != kind:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= now:
+            await db.delete(entry)
+            await db.commit()
+            return None
+        await db.execute(
+            update(CachedResult)
+            .where(CachedResult.key == key)
+            .values(last_used_at=now, hits=CachedResult.hits + 1)
+        )
+        await db.commit()
+        logger.info(f"Result cache hit ({kind} {key[:12]})")
+        return entry.value
+
+async def set_cached(kind: str, key: str, value):
+    """Store a result, then evict expired and over-budget entries of its kind"""
+    if not RESULT_CACHE_ENABLED:
+        return
+    try:
+        await _set(kind, key, value)
+        await evict(kind)
+    except Exception as e:
+        logger.warning(f"Result cache store failed: {e}")
+
+async def _set(kind: str, key: str, value):
+    now = datetime.utcnow()
+    size = len(json.dumps(value, separators=(",", ":")))
+    async with AsyncSessionLocal() as db:
+        await db.merge(CachedResult(
+            key=key,
+            kind=kind,
+            value=value,
+            size_bytes=size,
+            hits=0,
+            last_used_at=now,
+            expires_at=now + timedelta(days=RESULT_CACHE_TTL_DAYS) if RESULT_CACHE_TTL_DAYS > 0 else None,
+        ))
+        try:
+            await db.commit()
+        except IntegrityError:
+            # Another worker stored the same key first; its value is equivalent
+            await db.rollback()
+
+async def evict(kind: str) -> int:
+    """Drop expired entries, then least recently used ones until under the size budget"""
+    budget = int(RESULT_CACHE_MAX_MB * 1024 * 1024)
+    removed = 0
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            delete(CachedResult).where(
+                CachedResult.kind == kind,
+                CachedResult.expires_at <= datetime.utcnow(),
+            )
+        )
+        removed += result.rowcount or 0
+
+        total = (await db.execute(
+            select(func.coalesce(func.sum(CachedResult.size_bytes), 0)).where(CachedResult.kind == kind)
+        )).scalar_one()
+        if total > budget:
+            rows = await db.execute(
+                select(CachedResult.key, CachedResult.size_bytes)
+                .where(CachedResult.kind == kind)
+                .order_by(CachedResult.last_used_at)
+            )
+            victims = []
+            for key, size in rows:
+                if total <= budget:
+                    break
+                victims.append(key)
+                total -= size
+            await db.execute(delete(CachedResult).where(CachedResult.key.in_(victims)))
+            removed += len(victims)
+        await db.commit()
+    if removed:
+        logger.info(f"Result cache evicted {removed} {kind} entries")
+    return removed
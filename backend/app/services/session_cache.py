@@ -0,0 +1,145 @@
+# backend/app/services/session_cache.py
+"""
+Which interview sessions a signaling socket may join.
+
+WebSocket connects (and reconnect storms) check a small in-process LRU of
+active session IDs before touching the database. A miss runs one short
+query on its own AsyncSession (from the factory the caller passes, by
+default AsyncSessionLocal), which is returned to the pool before the
+socket is accepted. Concurrent misses for the same session share that
+query.
+
+Entries are dropped when a session is canceled, completed or deleted
+through the ORM in this process, once that change is committed.
+SESSION_CACHE_TTL_SECONDS bounds how long
+a change made elsewhere (another process, a bulk UPDATE) can go unnoticed.
+
+Commits of sync sessions run on threadpool threads, so the LRU and the
+invalidation counter are only touched under a lock.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from ..database import AsyncSessionLocal
+from ..models.interview import InterviewSession
+
+logger = logging.getLogger(__name__)
+
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "10000"))
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "60"))
+
+# session id -> monotonic expiry, least recently used first
+_active: "OrderedDict[int, float]" = OrderedDict()
+# Only used on the event loop
+_pending: Dict[int, asyncio.Future] = {}
+# Bumped on every invalidation so a query that raced with it isn't cached
+_generation = 0
+# Guards _active and _generation
+_lock = threading.Lock()
+# Session.info key for ids to invalidate when the transaction commits
+PENDING_INVALIDATIONS = "session_cache_ids"
+
+def invalidate(session_id: int):
+    global _generation
+    with _lock:
+        _generation += 1
+        _active.pop(int(session_id), None)
+
+def clear():
+    global _generation
+    with _lock:
+        _generation += 1
+        _active.clear()
+
+def _current_generation() -> int:
+    with _lock:
+        return _generation
+
+def _remember(session_id: int, generation: int):
+    """Cache a session read as active, unless an invalidation happened since the read began"""
+    with _lock:
+        if generation != _generation:
+            return
+        _active[session_id] = time.monotonic() + SESSION_CACHE_TTL_SECONDS
+        _active.move_to_end(session_id)
+        while len(_active) > SESSION_CACHE_SIZE:
+            _active.popitem(last=False)
+
+def _cached(session_id: int) -> bool:
+    with _lock:
+        expires_at = _active.get(session_id)
+        if expires_at is None:
+            return False
+        if expires_at > time.monotonic():
+            _active.move_to_end(session_id)
+            return True
+        del _active[session_id]
+        return False
+
+async def _load(session_id: int, session_factory: Callable[[], AsyncSession]) -> bool:
+    async with session_factory() as db:
+        result = await db.execute(
+            select(InterviewSession.is_canceled, InterviewSession.is_completed)
+            .where(InterviewSession.id == session_id)
+        )
+        row = result.first()
+    return row is not None and not row.is_canceled and not row.is_completed
+
+async def is_active_session(
+    session_id: int,
+    session_factory: Callable[[], AsyncSession] = AsyncSessionLocal
+) -> bool:
+    """True if the session exists and is neither canceled nor completed"""
+    if _cached(session_id):
+        return True
+
+    pending = _pending.get(session_id)
+    if pending is None:
+        generation = _current_generation()
+        pending = asyncio.ensure_future(_load(session_id, session_factory))
+        _pending[session_id] = pending
+
+        def finished(task):
+            _pending.pop(session_id, None)
+            if not task.cancelled() and task.exception() is None and task.result():
+                _remember(session_id, generation)
+
+        pending.add_done_callback(finished)
+    # Shielded: one caller giving up must not cancel the others' query
+    return await asyncio.shield(pending)
+
+def _queue_invalidation(target):
+    # Until the commit, other sessions still read the row as active
+    session = object_session(target)
+    if session is None:
+        invalidate(target.id)
+        return
+    session.info.setdefault(PENDING_INVALIDATIONS, set()).add(target.id)
+
+@event.listens_for(InterviewSession, "after_update")
+def _session_updated(mapper, connection, target):
+    if target.is_canceled or target.is_completed:
+        _queue_invalidation(target)
+
+@event.listens_for(InterviewSession, "after_delete")
+def _session_deleted(mapper, connection, target):
+    _queue_invalidation(target)
+
+# AsyncSession runs on a sync Session, so these cover both
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for session_id in session.info.pop(PENDING_INVALIDATIONS, ()):
+        invalidate(session_id)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session):
+    session.info.pop(PENDING_INVALIDATIONS, None)
@@ -0,0 +1,182 @@
+# backend/app/services/signaling_backplane.py
+"""
+Cross-process fan-out for WebSocket signaling.
+
+Each process keeps its own sockets; the backplane carries messages for a
+session to the other processes that have participants in it. A process
+subscribes to a session's channel when its first local participant joins
+and unsubscribes when the last one leaves, so traffic is routed by
+session rather than broadcast to every node.
+
+SIGNALING_BACKPLANE_URL selects the implementation:
+- unset / "memory://"  single process, nothing leaves the process
+- "redis://..."        Redis pub/sub (one channel per session)
+"""
+import asyncio
+import logging
+import os
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SIGNALING_BACKPLANE_URL = os.getenv("SIGNALING_BACKPLANE_URL", "memory://")
+SIGNALING_CHANNEL_PREFIX = os.getenv("SIGNALING_CHANNEL_PREFIX", "signaling:")
+
+# Envelope kinds
+MESSAGE = "msg"
+# Binary frame, carried as latin-1 text
+BINARY = "bin"
+# Another node accepted a new socket for this role; drop ours
+REPLACE = "replace"
+
+# on_message(kind, session_id, sender_role, message)
+MessageHandler = Callable[[str, str, str, str], Awaitable[None]]
+
+class Backplane:
+    """Publish/subscribe interface used by the signaling ConnectionManager"""
+
+    def __init__(self):
+        self.node_id = uuid.uuid4().hex
+        self.on_message: Optional[MessageHandler] = None
+
+    async def start(self, on_message: MessageHandler):
+        self.on_message = on_message
+
+    async def close(self):
+        pass
+
+    async def subscribe(self, session_id: str):
+        """Start receiving other nodes' messages for a session"""
+
+    async def unsubscribe(self, session_id: str):
+        """Stop receiving messages for a session (no local participants left)"""
+
+    async def publish(self, session_id: str, sender_role: str, message: str, kind: str = MESSAGE):
+        """Send a message to the session's participants on other nodes"""
+
+class InMemoryHub:
+    """Channel registry shared by the in-memory backplanes of one process"""
+
+    def __init__(self):
+        self.subscribers: Dict[str, Set[Backplane]] = {}
+
+class InMemoryBackplane(Backplane):
+    """
+    In-process pub/sub. With its own hub (the default) every participant is
+    local and nothing is forwarded; backplanes sharing a hub behave like
+    separate nodes, which is how the routing is exercised without Redis.
+    """
+
+    def __init__(self, hub: InMemoryHub = None):
+        super().__init__()
+        self.hub = hub or InMemoryHub()
+
+    async def subscribe(self, session_id: str):
+        self.hub.subscribers.setdefault(session_id, set()).add(self)
+
+    async def unsubscribe(self, session_id: str):
+        subscribers = self.hub.subscribers.get(session_id)
+        if subscribers is not None:
+            subscribers.discard(self)
+            if not subscribers:
+                del self.hub.subscribers[session_id]
+
+    async def publish(self, session_id: str, sender_role: str, message: str, kind: str = MESSAGE):
+        for backplane in list(self.hub.subscribers.get(session_id, ())):
+            if backplane is not self:
+                await backplane.on_message(kind, session_id, sender_role, message)
+
+async def _aclose(resource):
+    # redis-py >= 5 renamed close() to aclose()
+    close = getattr(resource, "aclose", None) or resource.close
+    await close()
+
+class RedisBackplane(Backplane):
+    """
+    Redis pub/sub backplane. ``client`` can be any redis.asyncio-compatible
+    client (e.g. fakeredis for tests); otherwise one is created from ``url``.
+    """
+
+    def __init__(self, url: str = None, client=None):
+        super().__init__()
+        if client is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                raise RuntimeError("The redis package is required for a redis:// signaling backplane")
+            client = redis.from_url(url)
+        self.client = client
+        self.pubsub = None
+        self._subscription_lock: Optional[asyncio.Lock] = None
+        self._reader: Optional[asyncio.Task] = None
+
+    def channel(self, session_id: str) -> str:
+        return f"{SIGNALING_CHANNEL_PREFIX}{session_id}"
+
+    async def start(self, on_message: MessageHandler):
+        await super().start(on_message)
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._subscription_lock = asyncio.Lock()
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+        if self.pubsub is not None:
+            await _aclose(self.pubsub)
+        await _aclose(self.client)
+
+    # One command at a time: concurrent first subscribes would each open
+    # their own pubsub connection, and only the last one is read
+    async def subscribe(self, session_id: str):
+        async with self._subscription_lock:
+            await self.pubsub.subscribe(self.channel(session_id))
+
+    async def unsubscribe(self, session_id: str):
+        async with self._subscription_lock:
+            await self.pubsub.unsubscribe(self.channel(session_id))
+
+    async def publish(self, session_id: str, sender_role: str, message: str, kind: str = MESSAGE):
+        # Plain-text envelope: no JSON round trip for large SDP payloads
+        envelope = f"{kind}\n{self.node_id}\n{sender_role}\n{message}"
+        await self.client.publish(self.channel(session_id), envelope)
+
+    async def _read_loop(self):
+        prefix_length = len(SIGNALING_CHANNEL_PREFIX)
+        while True:
+            try:
+                if not self.pubsub.subscribed:
+                    # get_message() returns immediately until something is subscribed
+                    await asyncio.sleep(0.05)
+                    continue
+                item = await self.pubsub.get_message(timeout=1.0)
+                if item is None or item.get("type") != "message":
+                    continue
+                channel, data = item["channel"], item["data"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                if isinstance(data, bytes):
+                    data = data.decode()
+                kind, node_id, sender_role, message = data.split("\n", 3)
+                if node_id == self.node_id:
+                    # Our own publish; local peers were served directly
+                    continue
+                await self.on_message(kind, channel[prefix_length:], sender_role, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Signaling backplane read error: {e}")
+                await asyncio.sleep(1)
+
+def create_backplane(url: str = None) -> Backplane:
+    url = url or SIGNALING_BACKPLANE_URL
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackplane(url)
+    if url.startswith("memory://"):
+        return InMemoryBackplane()
+    raise ValueError(f"Unsupported SIGNALING_BACKPLANE_URL: {url}")
@@ -0,0 +1,84 @@
+# backend/app/services/signaling_frames.py
+"""
+Sender tagging for relayed signaling frames.
+
+Peers need to know who sent each SDP/ICE message, so the relay adds a
+"sender" key when the client didn't. Instead of decoding and re-encoding
+every frame, the key is spliced in front of the object's first member:
+
+    {"type": "ice-candidate", ...}  ->  {"sender":"candidate","type": "ice-candidate", ...}
+
+Only frames that already mention "sender" (or don't look like a JSON
+object) are parsed, to decide whether they need the tag; parsed frames
+are still forwarded as the original text, never re-serialized.
+
+WS_FRAME_VALIDATION:
+- "fast" (default)  splice without parsing; malformed frames are relayed as-is
+- "full"            parse every frame and drop the ones that aren't valid JSON
+
+Binary frames are treated as UTF-8 JSON and tagged the same way.
+"""
+import json
+import logging
+import os
+from typing import Optional, Union
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional, faster parser for the validation path
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+WS_FRAME_VALIDATION = os.getenv("WS_FRAME_VALIDATION", "fast")
+
+Frame = Union[str, bytes]
+
+_prefixes = {}
+
+def _prefix(role: str, binary: bool) -> Frame:
+    """'{"sender":"<role>",' for this role, built once"""
+    key = (role, binary)
+    if key not in _prefixes:
+        prefix = '{"sender":' + json.dumps(role) + ","
+        _prefixes[key] = prefix.encode() if binary else prefix
+    return _prefixes[key]
+
+def _splice(frame: Frame, role: str) -> Frame:
+    binary = isinstance(frame, bytes)
+    body = frame.lstrip()[1:].lstrip()
+    prefix = _prefix(role, binary)
+    if body[:1] == (b"}" if binary else "}"):
+        # Empty object: drop the trailing comma
+        return prefix[:-1] + body
+    return prefix + body
+
+def tag_sender(frame: Frame, role: str, validation: str = None) -> Optional[Frame]:
+    """
+    Return the frame to relay, with "sender" added when it is missing.
+
+    Returns None when the frame should be dropped (invalid JSON under
+    full validation).
+    """
+    validation = validation or WS_FRAME_VALIDATION
+    binary = isinstance(frame, bytes)
+    looks_like_object = frame.lstrip()[:1] == (b"{" if binary else "{")
+    mentions_sender = (b'"sender"' if binary else '"sender"') in frame
+
+    if validation != "full" and looks_like_object and not mentions_sender:
+        return _splice(frame, role)
+
+    try:
+        message = _loads(frame)
+    except ValueError:
+        if validation == "full":
+            logger.warning("Dropping signaling frame that is not valid JSON")
+            return None
+        logger.error(f"Invalid JSON received: {frame[:200]!r}")
+        # Forward raw message as fallback
+        return frame
+
+    if isinstance(message, dict) and "sender" not in message:
+        return _splice(frame, role)
+    return frame
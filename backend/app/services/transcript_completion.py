@@ -0,0 +1,114 @@
+# backend/app/services/transcript_completion.py
+"""
+Completion registry for AssemblyAI transcripts.
+
+The webhook route calls record(), which stores the provider status on the
+processing job that owns the transcript and wakes any coroutine in this
+process blocked in wait(). Waiters in other processes (separate pipeline
+workers) see the stored status on their next cheap local DB check, so a
+finished transcript is picked up within WEBHOOK_CHECK_INTERVAL_SECONDS
+instead of on the next provider poll.
+"""
+import asyncio
+import logging
+import os
+from typing import Dict, Optional
+
+from sqlalchemy import select, update
+
+from ..database import AsyncSessionLocal
+from ..models.job import ProcessingJob
+
+logger = logging.getLogger(__name__)
+
+# Public URL AssemblyAI should call when a transcript finishes (empty disables webhooks)
+ASSEMBLYAI_WEBHOOK_URL = os.getenv("ASSEMBLYAI_WEBHOOK_URL", "")
+# Shared secret AssemblyAI echoes back in WEBHOOK_AUTH_HEADER (required with a webhook URL)
+ASSEMBLYAI_WEBHOOK_SECRET = os.getenv("ASSEMBLYAI_WEBHOOK_SECRET", "")
+WEBHOOK_AUTH_HEADER = "X-Webhook-Secret"
+WEBHOOK_CHECK_INTERVAL_SECONDS = float(os.getenv("WEBHOOK_CHECK_INTERVAL_SECONDS", "1"))
+
+# Provider statuses that end a transcript's lifecycle
+TERMINAL_STATUSES = ("completed", "error")
+
+def check_webhook_config():
+    """Called at startup by the API and the workers; importing never raises"""
+    if ASSEMBLYAI_WEBHOOK_URL and not ASSEMBLYAI_WEBHOOK_SECRET:
+        # Without the secret anyone could mark transcripts as finished
+        raise RuntimeError("ASSEMBLYAI_WEBHOOK_URL is set but ASSEMBLYAI_WEBHOOK_SECRET is not")
+
+class TranscriptCompletionRegistry:
+    def __init__(self, check_interval: float = WEBHOOK_CHECK_INTERVAL_SECONDS):
+        self.check_interval = check_interval
+        self._waiters: Dict[str, asyncio.Future] = {}
+
+    def resolve(self, transcript_id: str, status: str) -> bool:
+        """Wake a local waiter; False if nobody in this process is waiting"""
+        waiter = self._waiters.get(transcript_id)
+        if waiter is None or waiter.done():
+            return False
+        waiter.set_result(status)
+        return True
+
+    async def record(self, transcript_id: str, status: str):
+        """Persist a webhook notification and wake local waiters"""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(ProcessingJob)
+                .where(ProcessingJob.external_id == transcript_id)
+                .values(external_status=status)
+            )
+            await db.commit()
+        self.resolve(transcript_id, status)
+
+    async def clear(self, transcript_id: str):
+        """Forget a stored status the provider contradicts, so wait() blocks again"""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(ProcessingJob)
+                .where(ProcessingJob.external_id == transcript_id)
+                .values(external_status=None)
+            )
+            await db.commit()
+
+    async def _stored_status(self, transcript_id: str) -> Optional[str]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(ProcessingJob.external_status)
+                .where(ProcessingJob.external_id == transcript_id)
+                .limit(1)
+            )
+            status = result.scalar_one_or_none()
+        return status if status in TERMINAL_STATUSES else None
+
+    async def wait(self, transcript_id: str, timeout: float) -> Optional[str]:
+        """
+        Wait up to `timeout` seconds for a webhook about this transcript.
+
+        Returns the notified status, or None on timeout (time to poll the
+        provider instead).
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters[transcript_id] = waiter
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                # Another process may have received the webhook
+                status = await self._stored_status(transcript_id)
+                if status:
+                    return status
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    return await asyncio.wait_for(
+                        asyncio.shield(waiter), timeout=min(remaining, self.check_interval)
+                    )
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            if self._waiters.get(transcript_id) is waiter:
+                del self._waiters[transcript_id]
+
+transcript_completions = TranscriptCompletionRegistry()
@@ -1,116 +1,196 @@
 # backend/app/services/transcription.py
 import os
-import httpx
 import asyncio
 import json
+import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
+from .http_clients import http_clients
+from .recordings import iter_file
+from .transcript_completion import (
+    ASSEMBLYAI_WEBHOOK_SECRET,
+    ASSEMBLYAI_WEBHOOK_URL,
+    TERMINAL_STATUSES,
+    WEBHOOK_AUTH_HEADER,
+    transcript_completions,
+)
+
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
-# Get API key from environment
+# Get API key from environment (checked when a request is made, so importing
+# this module doesn't need credentials)
 ASSEMBLYAI_API_KEY = os.getenv("ASSEMBLYAI_API_KEY")
-if not ASSEMBLYAI_API_KEY:
-    raise ValueError("ASSEMBLYAI_API_KEY not found in environment variables")
 
-# AssemblyAI API endpoints
-UPLOAD_ENDPOINT = "https://api.assemblyai.com/v2/upload"
-TRANSCRIPT_ENDPOINT = "https://api.assemblyai.com/v2/transcript"
+# AssemblyAI API endpoints (base URL overridable to point at a local fake)
+ASSEMBLYAI_API_URL = os.getenv("ASSEMBLYAI_API_URL", "https://api.assemblyai.com/v2").rstrip("/")
+UPLOAD_ENDPOINT = f"{ASSEMBLYAI_API_URL}/upload"
+TRANSCRIPT_ENDPOINT = f"{ASSEMBLYAI_API_URL}/transcript"
+
+# Fallback polling: exponential backoff between provider status checks.
+# With a webhook configured polls are only a safety net, so they back off further.
+TRANSCRIPT_POLL_INITIAL_SECONDS = float(os.getenv("TRANSCRIPT_POLL_INITIAL_SECONDS", "3"))
+TRANSCRIPT_POLL_MAX_SECONDS = float(
+    os.getenv("TRANSCRIPT_POLL_MAX_SECONDS", "120" if ASSEMBLYAI_WEBHOOK_URL else "30")
+)
+TRANSCRIPT_TIMEOUT_SECONDS = float(os.getenv("TRANSCRIPT_TIMEOUT_SECONDS", str(3 * 60 * 60)))
+
+# Options sent with every transcription request (also part of the result cache key)
+TRANSCRIPT_OPTIONS = {
+    "speaker_labels": True,  # Enable speaker diarization
+    "speakers_expected": 2,  # We expect 2 speakers (interviewer and candidate)
+    "language_code": "en"    # Specify language (optional)
+}
+
+class TranscriptionError(Exception):
+    """AssemblyAI reported the transcript as failed"""
+
+def _headers():
+    if not ASSEMBLYAI_API_KEY:
+        raise ValueError("ASSEMBLYAI_API_KEY not found in environment variables")
+    return {
+        "authorization": ASSEMBLYAI_API_KEY,
+        "content-type": "application/json"
+    }
+
+async def upload_audio(audio_file_path):
+    """Upload a local recording; returns the provider's upload_url"""
+    # Check if file exists
+    file_path = Path(audio_file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {audio_file_path}")
+
+    logger.info(f"Uploading file: {audio_file_path}")
+
+    client = http_clients.get("assemblyai")
+    headers = {**_headers(), "content-type": "application/octet-stream"}
+    # Stream the file in blocks so large recordings are never held in memory
+    response = await client.post(
+        UPLOAD_ENDPOINT,
+        headers=headers,
+        content=iter_file(file_path)
+    )
+
+    if response.status_code != 200:
+        raise Exception(f"Error uploading file: {response.text}")
+
+    upload_url = response.json()["upload_url"]
+    logger.info(f"File uploaded successfully. URL: {upload_url}")
+    return upload_url
+
+async def submit_transcription(upload_url):
+    """Start a transcription job; returns the AssemblyAI transcript id"""
+    transcript_request = {"audio_url": upload_url, **TRANSCRIPT_OPTIONS}
+    if ASSEMBLYAI_WEBHOOK_URL:
+        # AssemblyAI POSTs {"transcript_id", "status"} here when done
+        transcript_request["webhook_url"] = ASSEMBLYAI_WEBHOOK_URL
+        transcript_request["webhook_auth_header_name"] = WEBHOOK_AUTH_HEADER
+        transcript_request["webhook_auth_header_value"] = ASSEMBLYAI_WEBHOOK_SECRET
+
+    client = http_clients.get("assemblyai")
+    response = await client.post(
+        TRANSCRIPT_ENDPOINT,
+        json=transcript_request,
+        headers=_headers()
+    )
+
+    if response.status_code != 200:
+        raise Exception(f"Error submitting transcription request: {response.text}")
+
+    transcript_id = response.json()["id"]
+    logger.info(f"Transcription job submitted. ID: {transcript_id}")
+    return transcript_id
 
-async def transcribe_audio(audio_file_path, session_id):
+async def fetch_transcript(transcript_id):
+    """Fetch the current state of a transcript from AssemblyAI"""
+    client = http_clients.get("assemblyai")
+    response = await client.get(f"{TRANSCRIPT_ENDPOINT}/{transcript_id}", headers=_headers())
+    response.raise_for_status()
+    return response.json()
+
+def parse_transcript(transcript):
+    """Reduce a completed AssemblyAI transcript to text plus speaker utterances"""
+    text = transcript.get("text", "")
+    utterances = []
+
+    # Extract utterances with speaker information
+    if transcript.get("utterances"):
+        utterances = [
+            {
+                "speaker": utterance["speaker"],
+                "text": utterance["text"],
+                "start": utterance["start"],
+                "end": utterance["end"]
+            }
+            for utterance in transcript["utterances"]
+        ]
+
+    return {
+        "text": text,
+        "utterances": utterances
+    }
+
+async def wait_for_transcript(transcript_id):
+    """
+    Wait until a transcript is finished and return the parsed result.
+
+    Wakes immediately when the webhook reports completion; otherwise polls
+    the provider with exponential backoff.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + TRANSCRIPT_TIMEOUT_SECONDS
+    delay = TRANSCRIPT_POLL_INITIAL_SECONDS
+    transcript = await fetch_transcript(transcript_id)
+    while True:
+        if transcript["status"] == "completed":
+            logger.info(f"Transcript {transcript_id} completed")
+            return parse_transcript(transcript)
+        elif transcript["status"] == "error":
+            raise TranscriptionError(f"Transcription error: {transcript.get('error', 'Unknown error')}")
+
+        if loop.time() + delay > deadline:
+            raise TimeoutError(f"Transcript {transcript_id} not ready after {TRANSCRIPT_TIMEOUT_SECONDS:.0f}s")
+
+        logger.info(f"Transcript {transcript_id} status: {transcript['status']}. Next check in {delay:.0f}s unless notified")
+        if ASSEMBLYAI_WEBHOOK_URL:
+            wake_at = loop.time() + delay
+            if await transcript_completions.wait(transcript_id, timeout=delay):
+                transcript = await fetch_transcript(transcript_id)
+                if transcript["status"] in TERMINAL_STATUSES:
+                    continue
+                # The stored status says finished but the provider doesn't agree;
+                # drop it (or every wait() returns at once) and sit out the delay
+                logger.warning(f"Transcript {transcript_id} reported finished but is {transcript['status']}")
+                await transcript_completions.clear(transcript_id)
+                await asyncio.sleep(max(0.0, wake_at - loop.time()))
+        else:
+            await asyncio.sleep(delay)
+        delay = min(delay * 2, TRANSCRIPT_POLL_MAX_SECONDS)
+        transcript = await fetch_transcript(transcript_id)
+
+async def transcribe_audio(audio_file_path, session_id, on_submitted=None):
     """
     Transcribe an audio file using AssemblyAI
-    
+
     Args:
         audio_file_path (str): Path to the audio file
         session_id (int): Interview session ID
-    
+        on_submitted (callable): Optional async callback receiving the
+            transcript id once the job is submitted (used to persist it)
+
     Returns:
         dict: Transcription result
     """
-    # Check if file exists
-    file_path = Path(audio_file_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {audio_file_path}")
-    
-    # Set up headers with API key
-    headers = {
-        "authorization": ASSEMBLYAI_API_KEY,
-        "content-type": "application/json"
-    }
-    
-    print(f"Uploading file: {audio_file_path}")
-    
     # Step 1: Upload the file
-    async with httpx.AsyncClient() as client:
-        with open(audio_file_path, "rb") as f:
-            response = await client.post(
-                UPLOAD_ENDPOINT,
-                headers=headers,
-                data=f
-            )
-        
-        if response.status_code != 200:
-            raise Exception(f"Error uploading file: {response.text}")
-        
-        upload_url = response.json()["upload_url"]
-        
-        print(f"File uploaded successfully. URL: {upload_url}")
-        
-        # Step 2: Submit the audio for transcription
-        transcript_request = {
-            "audio_url": upload_url,
-            "speaker_labels": True,  # Enable speaker diarization
-            "speakers_expected": 2,  # We expect 2 speakers (interviewer and candidate)
-            "language_code": "en"    # Specify language (optional)
-        }
-        
-        response = await client.post(
-            TRANSCRIPT_ENDPOINT,
-            json=transcript_request,
-            headers=headers
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Error submitting transcription request: {response.text}")
-        
-        transcript_id = response.json()["id"]
-        
-        print(f"Transcription job submitted. ID: {transcript_id}")
-        
-        # Step 3: Poll for transcription completion
-        polling_endpoint = f"{TRANSCRIPT_ENDPOINT}/{transcript_id}"
-        while True:
-            response = await client.get(polling_endpoint, headers=headers)
-            transcript = response.json()
-            
-            if transcript["status"] == "completed":
-                print("Transcription completed successfully")
-                
-                # Process the transcript to extract text and utterances
-                text = transcript.get("text", "")
-                utterances = []
-                
-                # Extract utterances with speaker information
-                if "utterances" in transcript:
-                    utterances = [
-                        {
-                            "speaker": utterance["speaker"],
-                            "text": utterance["text"],
-                            "start": utterance["start"],
-                            "end": utterance["end"]
-                        }
-                        for utterance in transcript["utterances"]
-                    ]
-                
-                return {
-                    "text": text,
-                    "utterances": utterances
-                }
-                
-            elif transcript["status"] == "error":
-                raise Exception(f"Transcription error: {transcript.get('error', 'Unknown error')}")
-            
-            print(f"Transcription status: {transcript['status']}. Waiting...")
-            await asyncio.sleep(5)  # Poll every 5 seconds
\ No newline at end of file
+    upload_url = await upload_audio(audio_file_path)
+
+    # Step 2: Submit the audio for transcription
+    transcript_id = await submit_transcription(upload_url)
+    if on_submitted is not None:
+        await on_submitted(transcript_id)
+
+    # Step 3: Wait for completion (webhook, or polling fallback)
+    return await wait_for_transcript(transcript_id)
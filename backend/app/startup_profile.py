@@ -0,0 +1,135 @@
+# backend/app/startup_profile.py
+"""
+Cold-start timings for the API process.
+
+Every startup step run through ``startup_profile.step()`` is timed, and the
+total time to ready is logged once startup is done. With
+STARTUP_PROFILE=true, the profile also times every module imported while
+the app loads (cumulative and self time, like ``python -X importtime``)
+and logs the app modules, the slowest other imports and each step.
+
+app.main imports this module first and calls install() before anything
+else, so the import timings cover the whole app.
+"""
+import builtins
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.util import resolve_name
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+STARTUP_PROFILE = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+# How many non-app imports to list, slowest (self time) first
+STARTUP_PROFILE_TOP = int(os.getenv("STARTUP_PROFILE_TOP", "20"))
+
+class StartupProfile:
+    def __init__(self, enabled: bool = STARTUP_PROFILE):
+        self.enabled = enabled
+        self.started = time.perf_counter()
+        # module -> (cumulative, self) seconds
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        self.import_seconds = 0.0
+        self.steps: List[Tuple[str, float]] = []
+        # Time spent in nested imports, one entry per import in progress
+        self._children: List[float] = []
+        self._original_import = None
+        self._thread = None
+
+    def install(self):
+        """Start timing imports (no-op unless profiling is enabled)"""
+        if self.enabled and self._original_import is None:
+            self._original_import = builtins.__import__
+            self._thread = threading.get_ident()
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _load(self, fullname: str):
+        parent = fullname.rpartition(".")[0]
+        if parent and parent not in sys.modules:
+            self._load(parent)
+        self._children.append(0.0)
+        started = time.perf_counter()
+        try:
+            importlib.import_module(fullname)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.imports[fullname] = (elapsed, elapsed - self._children.pop())
+            if self._children:
+                self._children[-1] += elapsed
+            else:
+                self.import_seconds += elapsed
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Imports from other threads are not timed (the stack is per thread)
+        if threading.get_ident() != self._thread:
+            return self._original_import(name, globals, locals, fromlist, level)
+        try:
+            fullname = resolve_name("." * level + name, (globals or {}).get("__package__")) if level else name
+        except (ImportError, ValueError):
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        if fullname not in sys.modules:
+            self._load(fullname)
+        # "from package import module" loads the submodules itself; time them separately
+        module = sys.modules.get(fullname)
+        if fromlist and hasattr(module, "__path__"):
+            for item in fromlist:
+                submodule = f"{fullname}.{item}"
+                if item == "*" or hasattr(module, item) or submodule in sys.modules:
+                    continue
+                try:
+                    self._load(submodule)
+                except ModuleNotFoundError as e:
+                    if e.name != submodule:
+                        raise
+        return self._original_import(name, globals, locals, fromlist, level)
+
+    @contextmanager
+    def step(self, name: str):
+        """Time one startup step"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - started))
+
+    def report(self):
+        """Log the time to ready, and the full profile when enabled"""
+        total = time.perf_counter() - self.started
+        logger.info(f"Startup finished in {total * 1000:.0f} ms")
+        if not self.enabled:
+            return
+        self.uninstall()
+
+        lines = [f"Startup profile: {total * 1000:.1f} ms total, "
+                 f"{self.import_seconds * 1000:.1f} ms importing {len(self.imports)} modules"]
+        lines.append("  app modules (cumulative / self ms):")
+        app_modules = sorted(
+            ((name, times) for name, times in self.imports.items() if name == "app" or name.startswith("app.")),
+            key=lambda item: item[1][0], reverse=True
+        )
+        for name, (cumulative, own) in app_modules:
+            lines.append(f"    {cumulative * 1000:9.1f} {own * 1000:9.1f}  {name}")
+        lines.append("  slowest other imports (cumulative / self ms):")
+        others = sorted(
+            ((name, times) for name, times in self.imports.items() if not name.startswith("app.")),
+            key=lambda item: item[1][1], reverse=True
+        )
+        for name, (cumulative, own) in others[:STARTUP_PROFILE_TOP]:
+            lines.append(f"    {cumulative * 1000:9.1f} {own * 1000:9.1f}  {name}")
+        lines.append("  startup steps (ms):")
+        for name, seconds in self.steps:
+            lines.append(f"    {seconds * 1000:9.1f}  {name}")
+        logger.info("\n".join(lines))
+
+startup_profile = StartupProfile()
@@ -0,0 +1,218 @@
+# backend/app/workers/mail_worker.py
+"""
+Delivers the email outbox.
+
+    python -m app.workers.mail_worker
+
+Each process keeps EMAIL_SMTP_CONNECTIONS authenticated SMTP connections
+open and gives each one a sender loop that claims EMAIL_BATCH_SIZE due
+messages at a time. All loops in the process share one rate limit
+(EMAIL_RATE_LIMIT_PER_MINUTE); EMAIL_DAILY_LIMIT is counted in the
+database, so it holds across processes. Every REMINDER_INTERVAL_SECONDS
+(0 turns it off) it also queues reminders for upcoming interviews, see
+app/services/reminders.py. With RUN_EMBEDDED_MAIL_WORKER=true the API
+process runs one itself; only do that with a single API process, or the
+per-process rate limit is multiplied.
+
+For local testing, point it at an aiosmtpd stand-in:
+
+    python -m aiosmtpd -n -l localhost:8025
+    EMAIL_HOST=localhost EMAIL_PORT=8025 EMAIL_USE_TLS=false \\
+        EMAIL_DELIVERY_ENABLED=true python -m app.workers.mail_worker
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from ..services.email_outbox import (
+    EMAIL_LEASE_SECONDS,
+    claim_batch,
+    mark_failed,
+    mark_sent,
+    release,
+    requeue_expired_leases,
+    sent_since,
+)
+from ..services.reminders import REMINDER_INTERVAL_SECONDS, dispatch_due_reminders
+from ..services.email_service import (
+    EMAIL_DELIVERY_ENABLED,
+    SMTPConnection,
+    describe_failure,
+    is_connection_failure,
+    is_permanent_failure,
+)
+
+logger = logging.getLogger(__name__)
+
+EMAIL_SMTP_CONNECTIONS = int(os.getenv("EMAIL_SMTP_CONNECTIONS", "2"))
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "20"))
+EMAIL_POLL_INTERVAL_SECONDS = float(os.getenv("EMAIL_POLL_INTERVAL_SECONDS", "2"))
+# Provider quota; 0 disables the limit
+EMAIL_RATE_LIMIT_PER_MINUTE = float(os.getenv("EMAIL_RATE_LIMIT_PER_MINUTE", "60"))
+EMAIL_RATE_LIMIT_BURST = int(os.getenv("EMAIL_RATE_LIMIT_BURST", "10"))
+EMAIL_DAILY_LIMIT = int(os.getenv("EMAIL_DAILY_LIMIT", "0"))
+# Close connections with nothing to send for this long
+EMAIL_SMTP_IDLE_SECONDS = float(os.getenv("EMAIL_SMTP_IDLE_SECONDS", "60"))
+# Pause after the server refused or dropped a connection
+EMAIL_CONNECT_BACKOFF_SECONDS = float(os.getenv("EMAIL_CONNECT_BACKOFF_SECONDS", "30"))
+
+class RateLimiter:
+    """Token bucket: ``rate`` per minute with bursts of up to ``burst``"""
+
+    def __init__(self, per_minute: float, burst: int):
+        self.per_second = per_minute / 60
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if self.per_second <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.per_second)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.per_second)
+
+class MailWorker:
+    def __init__(self, worker_id: str = None, connections: int = EMAIL_SMTP_CONNECTIONS,
+                 batch_size: int = EMAIL_BATCH_SIZE, connection_factory=SMTPConnection):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.connections = connections
+        self.batch_size = batch_size
+        self.connection_factory = connection_factory
+        self.limiter = RateLimiter(EMAIL_RATE_LIMIT_PER_MINUTE, EMAIL_RATE_LIMIT_BURST)
+        self.sent = 0
+        self._stopping = asyncio.Event()
+
+    async def run(self):
+        if not EMAIL_DELIVERY_ENABLED:
+            logger.warning("Email credentials not configured; outbox messages stay queued")
+            return
+        logger.info(f"Mail worker {self.worker_id} starting with {self.connections} SMTP connection(s)")
+        await requeue_expired_leases()
+        senders = [
+            asyncio.create_task(self._sender_loop(f"{self.worker_id}/{slot}"))
+            for slot in range(self.connections)
+        ]
+        loops = [asyncio.create_task(self._lease_reaper())]
+        if REMINDER_INTERVAL_SECONDS > 0:
+            loops.append(asyncio.create_task(self._reminder_loop()))
+        # Senders notice the stop between messages and release what's left of their batch
+        await asyncio.gather(*senders, *loops)
+        logger.info(f"Mail worker {self.worker_id} stopped after sending {self.sent} email(s)")
+
+    def stop(self):
+        self._stopping.set()
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _batch_limit(self) -> int:
+        if EMAIL_DAILY_LIMIT <= 0:
+            return self.batch_size
+        remaining = EMAIL_DAILY_LIMIT - await sent_since(datetime.utcnow() - timedelta(days=1))
+        return max(0, min(self.batch_size, remaining))
+
+    async def _sender_loop(self, sender_id: str):
+        connection = self.connection_factory()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    limit = await self._batch_limit()
+                    batch = await claim_batch(sender_id, limit) if limit else []
+                except Exception as e:
+                    logger.error(f"Error claiming emails: {e}")
+                    batch = []
+                if not batch:
+                    if connection.is_open and connection.idle_seconds > EMAIL_SMTP_IDLE_SECONDS:
+                        await asyncio.to_thread(connection.close)
+                    await self._sleep(EMAIL_POLL_INTERVAL_SECONDS)
+                    continue
+                try:
+                    healthy = await self._send_batch(connection, sender_id, batch)
+                except Exception:
+                    # Anything left leased goes back to the queue when the lease expires
+                    logger.exception(f"Error sending emails via {sender_id}")
+                    healthy = False
+                if not healthy:
+                    await self._sleep(EMAIL_CONNECT_BACKOFF_SECONDS)
+        finally:
+            await asyncio.to_thread(connection.close)
+
+    async def _send_batch(self, connection, sender_id: str, batch) -> bool:
+        """Send a claimed batch over one connection; False if the connection gave out"""
+        sent, healthy = [], True
+        pending = [message.id for message in batch]
+        try:
+            for message in batch:
+                if self._stopping.is_set():
+                    break
+                await self.limiter.acquire()
+                try:
+                    await asyncio.to_thread(connection.send, message.to_email, message.subject, message.html_content)
+                except Exception as e:
+                    pending.remove(message.id)
+                    await mark_failed(message.id, sender_id, describe_failure(e), retryable=not is_permanent_failure(e))
+                    if is_connection_failure(e):
+                        logger.warning(f"SMTP connection unusable, backing off: {describe_failure(e)}")
+                        await asyncio.to_thread(connection.close)
+                        healthy = False
+                        break
+                    continue
+                pending.remove(message.id)
+                sent.append(message.id)
+        finally:
+            await mark_sent(sent, sender_id)
+            await release(pending, sender_id)
+            self.sent += len(sent)
+        if sent:
+            logger.info(f"Sent {len(sent)} email(s) via {sender_id}")
+        return healthy
+
+    async def _lease_reaper(self):
+        while True:
+            await self._sleep(EMAIL_LEASE_SECONDS / 2)
+            if self._stopping.is_set():
+                return
+            try:
+                await requeue_expired_leases()
+            except Exception as e:
+                logger.error(f"Error requeueing expired emails: {e}")
+
+    async def _reminder_loop(self):
+        while not self._stopping.is_set():
+            try:
+                await dispatch_due_reminders()
+            except Exception as e:
+                logger.error(f"Error queueing interview reminders: {e}")
+            await self._sleep(REMINDER_INTERVAL_SECONDS)
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    async def run():
+        # Build inside the loop: asyncio primitives bind to it on Python 3.9
+        worker = MailWorker()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# backend/app/workers/pipeline_worker.py
+"""
+Background worker for the transcription/analysis job queue.
+
+    python -m app.workers.pipeline_worker
+
+Run as many processes as needed; they coordinate through the
+processing_jobs table. Each process runs at most TRANSCRIPTION_CONCURRENCY
+transcription jobs and ANALYSIS_CONCURRENCY analysis jobs at a time. A
+stage with nothing to do is polled every JOB_POLL_INTERVAL_SECONDS,
+doubling up to JOB_POLL_MAX_SECONDS while it stays idle; jobs queued by
+the same process wake it at once.
+Set RUN_EMBEDDED_WORKER=true to run one inside the API process instead
+(for single-instance SQLite deployments).
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+
+from ..services.job_queue import (
+    JOB_LEASE_SECONDS,
+    PermanentJobError,
+    claim_job,
+    complete_job,
+    discard_wakeup,
+    extend_lease,
+    fail_job,
+    job_wakeup,
+    requeue_expired_leases,
+)
+from ..services.http_clients import http_clients
+from ..services.pipeline import STAGE_HANDLERS
+from ..services.transcript_completion import check_webhook_config
+
+logger = logging.getLogger(__name__)
+
+# Per-stage concurrency limits (per worker process)
+STAGE_CONCURRENCY = {
+    "transcription": int(os.getenv("TRANSCRIPTION_CONCURRENCY", "2")),
+    "analysis": int(os.getenv("ANALYSIS_CONCURRENCY", "2")),
+}
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "2"))
+JOB_POLL_MAX_SECONDS = float(os.getenv("JOB_POLL_MAX_SECONDS", "30"))
+WORKER_SHUTDOWN_GRACE_SECONDS = float(os.getenv("WORKER_SHUTDOWN_GRACE_SECONDS", "30"))
+
+class PipelineWorker:
+    def __init__(self, worker_id: str = None, concurrency: dict = None, handlers: dict = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.concurrency = concurrency or STAGE_CONCURRENCY
+        self.handlers = handlers or STAGE_HANDLERS
+        self._stopping = asyncio.Event()
+        self._running_jobs = set()
+
+    async def run(self):
+        check_webhook_config()
+        logger.info(f"Pipeline worker {self.worker_id} starting with limits {self.concurrency}")
+        # Pick up work orphaned by a previous crash right away
+        await requeue_expired_leases()
+        loops = [
+            asyncio.create_task(self._stage_loop(stage, limit))
+            for stage, limit in self.concurrency.items()
+        ]
+        loops.append(asyncio.create_task(self._lease_reaper()))
+
+        await self._stopping.wait()
+        for loop in loops:
+            loop.cancel()
+        if self._running_jobs:
+            # Unfinished jobs keep their lease and are requeued once it expires
+            logger.info(f"Waiting for {len(self._running_jobs)} running job(s) to finish")
+            await asyncio.wait(self._running_jobs, timeout=WORKER_SHUTDOWN_GRACE_SECONDS)
+        logger.info(f"Pipeline worker {self.worker_id} stopped")
+
+    def stop(self):
+        self._stopping.set()
+
+    async def _sleep(self, seconds: float, wakeup: asyncio.Event = None):
+        """Sleep until the timeout, stop() or ``wakeup`` is set"""
+        waits = [asyncio.ensure_future(self._stopping.wait())]
+        if wakeup is not None:
+            waits.append(asyncio.ensure_future(wakeup.wait()))
+        try:
+            await asyncio.wait(waits, timeout=seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waits:
+                waiter.cancel()
+
+    async def _stage_loop(self, stage: str, limit: int):
+        slots = asyncio.Semaphore(limit)
+        wakeup = job_wakeup(stage)
+        idle_interval = JOB_POLL_INTERVAL_SECONDS
+        try:
+            while not self._stopping.is_set():
+                await slots.acquire()
+                wakeup.clear()
+                try:
+                    job = await claim_job(stage, self.worker_id)
+                except Exception as e:
+                    logger.error(f"Error claiming {stage} job: {e}")
+                    job = None
+                if job is None:
+                    slots.release()
+                    await self._sleep(idle_interval, wakeup)
+                    # Poll less often the longer the queue stays empty
+                    idle_interval = JOB_POLL_INTERVAL_SECONDS if wakeup.is_set() else min(idle_interval * 2, JOB_POLL_MAX_SECONDS)
+                    continue
+                idle_interval = JOB_POLL_INTERVAL_SECONDS
+
+                task = asyncio.create_task(self._execute(job.id, job.stage, job.session_id))
+                self._running_jobs.add(task)
+
+                def _done(finished, slots=slots):
+                    self._running_jobs.discard(finished)
+                    slots.release()
+
+                task.add_done_callback(_done)
+        finally:
+            discard_wakeup(stage, wakeup)
+
+    async def _execute(self, job_id: int, stage: str, session_id: int):
+        logger.info(f"Running {stage} job {job_id} for session {session_id}")
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            processing_done = await self.handlers[stage](job_id, session_id)
+        except PermanentJobError as e:
+            await fail_job(job_id, self.worker_id, str(e), retryable=False)
+        except Exception as e:
+            logger.exception(f"{stage} job {job_id} failed")
+            await fail_job(job_id, self.worker_id, str(e) or e.__class__.__name__)
+        else:
+            await complete_job(job_id, self.worker_id, processing_done=processing_done)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: int):
+        while True:
+            await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+            try:
+                if not await extend_lease(job_id, self.worker_id):
+                    logger.warning(f"Lost lease on job {job_id}")
+                    return
+            except Exception as e:
+                logger.error(f"Error extending lease on job {job_id}: {e}")
+
+    async def _lease_reaper(self):
+        while not self._stopping.is_set():
+            await self._sleep(JOB_LEASE_SECONDS / 2)
+            try:
+                await requeue_expired_leases()
+            except Exception as e:
+                logger.error(f"Error requeueing expired jobs: {e}")
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    async def run():
+        # Build inside the loop: asyncio primitives bind to it on Python 3.9
+        worker = PipelineWorker()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await http_clients.startup()
+        try:
+            await worker.run()
+        finally:
+            await http_clients.shutdown()
+
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
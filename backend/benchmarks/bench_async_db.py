@@ -0,0 +1,186 @@
+# backend/benchmarks/bench_async_db.py
+"""
+Load benchmark: concurrent create-interview requests while signaling sockets are open.
+
+Compares the blocking sync-session path (the old create_interview) with the
+AsyncSession path. For each mode it reports p50/p99 latency of the POST
+itself and of WebSocket relay messages flowing between interviewer and
+candidate at the same time.
+
+    python benchmarks/bench_async_db.py --pairs 50 --writers 20 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from common import percentiles, print_table, run_server
+
+import httpx
+import websockets
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.auth.utils import get_current_user
+from app.database import Base, get_async_db, get_async_session_factory, get_db, to_async_url
+from app.models.interview import InterviewSession
+from app.routers import interviews, signaling
+from app.routers.interviews import InterviewCreate
+
+
+def build_app(db_url, pool_size):
+    # Signaling sockets keep their session checked out, so size the pools to
+    # measure event-loop blocking rather than pool exhaustion
+    engine = create_engine(db_url, connect_args={"check_same_thread": False}, pool_size=pool_size)
+    Base.metadata.create_all(bind=engine)
+    SyncSession = sessionmaker(bind=engine, autoflush=False)
+    AsyncSessionFactory = async_sessionmaker(
+        create_async_engine(to_async_url(db_url), pool_size=pool_size),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    def override_get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSessionFactory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(interviews.router)
+    app.include_router(signaling.router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # The signaling route's active-session check opens its own sessions
+    app.dependency_overrides[get_async_session_factory] = lambda: AsyncSessionFactory
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=None, email="bench@example.com")
+
+    # The pre-async implementation: a blocking Session inside an async def route
+    @app.post("/legacy/interviews/")
+    async def legacy_create_interview(interview: InterviewCreate, db: Session = Depends(override_get_db)):
+        new_session = InterviewSession(**interview.model_dump())
+        db.add(new_session)
+        db.commit()
+        db.refresh(new_session)
+        return {"id": new_session.id}
+
+    with SyncSession() as db:
+        rows = [
+            InterviewSession(
+                interviewer_name="I", candidate_name="C", interview_topic="T",
+                candidate_level="mid", required_skills="python", focus_areas="apis",
+            )
+            for _ in range(1000)
+        ]
+        db.add_all(rows)
+        db.commit()
+        session_ids = [row.id for row in rows]
+    return app, session_ids
+
+
+PAYLOAD = {
+    "interviewer_name": "Bench Interviewer",
+    "candidate_name": "Bench Candidate",
+    "interview_topic": "System design",
+    "candidate_level": "senior",
+    "required_skills": "python, sql",
+    "focus_areas": "scalability",
+}
+
+
+async def writer(client, path, ready, stop_at, samples, errors):
+    await ready.wait()
+    while time.perf_counter() < stop_at:
+        started = time.perf_counter()
+        try:
+            response = await client.post(path, json=PAYLOAD)
+            response.raise_for_status()
+            samples.append(time.perf_counter() - started)
+        except Exception:
+            errors.append(1)
+
+
+async def signaling_pair(base, session_id, connected, stop_at, samples, interval):
+    uri = f"ws://{base}/ws/interview/{session_id}"
+    async with websockets.connect(f"{uri}/interviewer") as interviewer, \
+            websockets.connect(f"{uri}/candidate") as candidate:
+        await interviewer.recv()  # user-connected from the candidate
+        await connected()
+
+        async def receive():
+            while True:
+                message = json.loads(await candidate.recv())
+                if message.get("type") == "bench":
+                    samples.append(time.perf_counter() - message["t"])
+                    if message.get("last"):
+                        return
+
+        receiver = asyncio.create_task(receive())
+        while time.perf_counter() < stop_at:
+            await interviewer.send(json.dumps({"type": "bench", "t": time.perf_counter()}))
+            await asyncio.sleep(interval)
+        await interviewer.send(json.dumps({"type": "bench", "t": time.perf_counter(), "last": True}))
+        await asyncio.wait_for(receiver, timeout=30)
+
+
+async def run_mode(base, session_ids, path, args):
+    post_samples, ws_samples, errors = [], [], []
+    ready, pending = asyncio.Event(), [args.pairs]
+    stop_at = time.perf_counter() + args.duration
+
+    async def connected():
+        # Start the writers only once every socket pair is established
+        pending[0] -= 1
+        if not pending[0]:
+            ready.set()
+        await ready.wait()
+
+    limits = httpx.Limits(max_connections=args.writers)
+    async with httpx.AsyncClient(base_url=f"http://{base}", limits=limits, timeout=60) as client:
+        await asyncio.gather(
+            *(signaling_pair(base, sid, connected, stop_at, ws_samples, args.interval) for sid in session_ids[: args.pairs]),
+            *(writer(client, path, ready, stop_at, post_samples, errors) for _ in range(args.writers)),
+        )
+    return post_samples, ws_samples, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=50, help="interviewer/candidate socket pairs")
+    parser.add_argument("--writers", type=int, default=20, help="concurrent create-interview clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--interval", type=float, default=0.05, help="seconds between relay messages")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        app, session_ids = build_app(f"sqlite:///{Path(tmp) / 'bench.db'}", 2 * args.pairs + args.writers)
+        with run_server(app) as base:
+            for mode, path in (("sync-session", "/legacy/interviews/"), ("async-session", "/api/interviews/")):
+                post_samples, ws_samples, errors = asyncio.run(run_mode(base, session_ids, path, args))
+                post, relay = percentiles(post_samples), percentiles(ws_samples)
+                rows.append({
+                    "mode": mode,
+                    "creates": post["count"],
+                    "create_p50_ms": post.get("p50_ms"),
+                    "create_p99_ms": post.get("p99_ms"),
+                    "relay_msgs": relay["count"],
+                    "relay_p50_ms": relay.get("p50_ms"),
+                    "relay_p99_ms": relay.get("p99_ms"),
+                    "errors": len(errors),
+                })
+    print_table("create-interview + signaling under load", rows)
+
+
+if __name__ == "__main__":
+    main()
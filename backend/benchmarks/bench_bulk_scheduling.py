@@ -0,0 +1,138 @@
+# backend/benchmarks/bench_bulk_scheduling.py
+"""
+Scheduling N interviews one POST at a time vs one bulk request.
+
+Every interview has a candidate email and a time, so each one also
+queues an invitation. Times:
+- single:      N sequential POST /api/interviews/ over one keep-alive
+               connection (one INSERT, one outbox row, one commit each)
+- bulk json:   one POST /api/interviews/bulk with a JSON array
+- bulk csv:    the same rows as a CSV body
+- bulk ndjson: the same rows as NDJSON
+
+The outbox and sessions tables are emptied before each run; bulk times
+are the median of --repeat runs.
+
+    python benchmarks/bench_bulk_scheduling.py --rows 1000
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from common import print_table, run_server
+
+import httpx
+
+
+def interview_rows(count):
+    start = datetime(2030, 1, 1, 9, 0)
+    return [
+        {
+            "interviewer_name": "Interviewer",
+            "candidate_name": f"Candidate {i}",
+            "interview_topic": "Backend",
+            "candidate_level": "mid",
+            "required_skills": "python, sql",
+            "focus_areas": "apis",
+            "candidate_email": f"candidate{i}@example.com",
+            "scheduled_time": (start + timedelta(minutes=30 * i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def as_csv(rows):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue().encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bulk.db")
+    from fastapi import FastAPI
+    from sqlalchemy import delete, func, select
+    from app.auth.utils import get_current_user
+    from app.database import Base, engine
+    from app.models import interview, user, job, cache, outbox  # noqa: F401
+    from app.models.interview import InterviewSession
+    from app.models.outbox import OutboundEmail
+    from app.routers import interviews
+    from app.services.email_templates import load_templates
+
+    Base.metadata.create_all(bind=engine)
+    load_templates()
+    app = FastAPI()
+    app.include_router(interviews.router)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=None, email="bench@example.com")
+
+    rows = interview_rows(args.rows)
+    bodies = {
+        "bulk json": (json.dumps(rows).encode(), "application/json"),
+        "bulk csv": (as_csv(rows), "text/csv"),
+        "bulk ndjson": ("\n".join(json.dumps(row) for row in rows).encode(), "application/x-ndjson"),
+    }
+
+    def reset():
+        with engine.begin() as conn:
+            conn.execute(delete(OutboundEmail))
+            conn.execute(delete(InterviewSession))
+
+    def counts():
+        with engine.connect() as conn:
+            return (
+                conn.execute(select(func.count()).select_from(InterviewSession)).scalar_one(),
+                conn.execute(select(func.count()).select_from(OutboundEmail)).scalar_one(),
+            )
+
+    def record(mode, elapsed, requests):
+        sessions, emails = counts()
+        results.append({
+            "mode": mode,
+            "requests": requests,
+            "sessions": sessions,
+            "emails_queued": emails,
+            "total_ms": round(elapsed * 1000, 1),
+            "per_interview_ms": round(elapsed * 1000 / args.rows, 3),
+        })
+
+    results = []
+    with run_server(app) as base, httpx.Client(base_url=f"http://{base}", timeout=120) as client:
+        reset()
+        started = time.perf_counter()
+        for row in rows:
+            client.post("/api/interviews/", json=row).raise_for_status()
+        record("single", time.perf_counter() - started, args.rows)
+
+        for mode, (body, content_type) in bodies.items():
+            samples = []
+            for _ in range(args.repeat):
+                reset()
+                started = time.perf_counter()
+                response = client.post("/api/interviews/bulk", content=body, headers={"content-type": content_type})
+                samples.append(time.perf_counter() - started)
+                response.raise_for_status()
+                assert response.json()["created"] == args.rows
+            record(mode, statistics.median(samples), 1)
+
+    single = results[0]["total_ms"]
+    for row in results:
+        row["speedup"] = f"{single / row['total_ms']:.1f}x"
+    print_table(f"Scheduling {args.rows} interviews with invitations", results)
+
+
+if __name__ == "__main__":
+    main()
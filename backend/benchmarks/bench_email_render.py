@@ -0,0 +1,155 @@
+# backend/benchmarks/bench_email_render.py
+"""
+Email rendering throughput, messages per second, for the interviewer
+notification (the largest email):
+- f-string:            the old inline f-string template (copied below)
+- f-string + MIME:     plus MIMEMultipart(...).as_string(), as the old
+                       send_email built every message
+- template:            email_templates.render()
+- template, bulk:      email_templates.render_many() over the batch
+- template + message:  render() plus email_service.build_message(), what a
+                       message now costs from render to wire format
+
+    python benchmarks/bench_email_render.py --messages 5000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from common import print_table
+
+
+def legacy_interviewer_email(recipient_name, details):
+    """The old app/email.py body, minus the send"""
+    subject = f"Interview Scheduled: {details['topic']} with {details['candidate_name']}"
+    formatted_time = details["scheduled_time"].strftime("%A, %B %d, %Y at %I:%M %p")
+    html_content = f"""
+    <html>
+    <head>
+        <style>
+            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+            .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+            .header {{ background-color: #4a6fa5; color: white; padding: 10px 20px; text-align: center; }}
+            .content {{ padding: 20px; background-color: #f9f9f9; }}
+            .footer {{ text-align: center; margin-top: 20px; font-size: 12px; color: #777; }}
+            .details {{ background-color: #eef2f7; padding: 15px; border-radius: 5px; margin: 15px 0; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h2>Interview Scheduled</h2>
+            </div>
+            <div class="content">
+                <p>Hello {recipient_name},</p>
+                <p>You have an upcoming interview scheduled with <strong>{details['candidate_name']}</strong>.</p>
+                <div class="details">
+                    <p><strong>Interview Details:</strong></p>
+                    <ul>
+                        <li><strong>Date & Time:</strong> {formatted_time}</li>
+                        <li><strong>Candidate:</strong> {details['candidate_name']}</li>
+                        <li><strong>Topic:</strong> {details['topic']}</li>
+                        <li><strong>Level:</strong> {details['candidate_level']}</li>
+                        <li><strong>Required Skills:</strong> {details['required_skills']}</li>
+                        <li><strong>Focus Areas:</strong> {details['focus_areas']}</li>
+                    </ul>
+                </div>
+                <p>Please prepare your questions based on the candidate's level and the focus areas mentioned above.</p>
+                <p>You'll receive a link to host the interview closer to the scheduled date.</p>
+                <p>Best regards,<br>AI Interview Co-Pilot Team</p>
+            </div>
+            <div class="footer">
+                <p>© {datetime.now().year} AI Interview Co-Pilot. All rights reserved.</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+    return subject, html_content
+
+
+def legacy_message(to_email, subject, html_content):
+    message = MIMEMultipart("alternative")
+    message["Subject"] = subject
+    message["From"] = "ai.interview.copilot@example.com"
+    message["To"] = to_email
+    message.attach(MIMEText(html_content, "html"))
+    return message.as_string()
+
+
+def contexts(count):
+    start = datetime(2026, 11, 2, 9)
+    return [
+        {
+            "recipient_name": f"Interviewer {i}",
+            "topic": "Backend systems",
+            "scheduled_time": start + timedelta(minutes=30 * i),
+            "candidate_name": f"Candidate {i}",
+            "candidate_level": "senior",
+            "required_skills": "python, sql, distributed systems",
+            "focus_areas": "api design, data modelling",
+        }
+        for i in range(count)
+    ]
+
+
+def rate(fn, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return {"msgs_per_s": round(count / best), "us_per_msg": round(best / count * 1e6, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from app.services import email_templates
+    from app.services.email_service import build_message
+
+    started = time.perf_counter()
+    email_templates.load_templates()
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    batch = contexts(args.messages)
+    n = args.messages
+
+    def legacy():
+        for ctx in batch:
+            legacy_interviewer_email(ctx["recipient_name"], ctx)
+
+    def legacy_mime():
+        for ctx in batch:
+            subject, html = legacy_interviewer_email(ctx["recipient_name"], ctx)
+            legacy_message("someone@example.com", subject, html)
+
+    def template():
+        for ctx in batch:
+            email_templates.render("interviewer_scheduled", **ctx)
+
+    def bulk():
+        email_templates.render_many("interviewer_scheduled", batch)
+
+    def template_message():
+        for ctx in batch:
+            subject, html = email_templates.render("interviewer_scheduled", **ctx)
+            build_message("someone@example.com", subject, html)
+
+    rows = [
+        {"path": "f-string", **rate(legacy, n, args.repeat)},
+        {"path": "f-string + MIME", **rate(legacy_mime, n, args.repeat)},
+        {"path": "template", **rate(template, n, args.repeat)},
+        {"path": "template, bulk", **rate(bulk, n, args.repeat)},
+        {"path": "template + message", **rate(template_message, n, args.repeat)},
+    ]
+    print_table(f"{n} interviewer emails, best of {args.repeat} (templates compiled in {compile_ms:.1f} ms)", rows)
+
+
+if __name__ == "__main__":
+    main()
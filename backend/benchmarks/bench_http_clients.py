@@ -0,0 +1,93 @@
+# backend/benchmarks/bench_http_clients.py
+"""
+Requests/second against a local stub server: a new httpx.AsyncClient per
+call (the old transcription/analysis code) vs the shared pooled client from
+app.services.http_clients.
+
+The stub answers like the OpenAI chat endpoint after a small artificial
+delay. It speaks plain HTTP, so the savings shown are TCP setup and
+connection reuse; against the real TLS endpoints the gap is larger.
+
+    python benchmarks/bench_http_clients.py --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+
+from common import percentiles, print_table, run_server
+
+import httpx
+
+from app.services.http_clients import HTTPClientRegistry
+
+COMPLETION = b'{"choices": [{"message": {"content": "{\\"summary\\": \\"ok\\", \\"detailed\\": null}"}}]}'
+
+
+async def stub_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    while (await receive()).get("more_body"):
+        pass
+    await asyncio.sleep(0.002)  # simulated upstream work
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": COMPLETION})
+
+
+async def per_call_client(url):
+    async with httpx.AsyncClient() as client:
+        response = await client.post(url, json={"model": "stub"}, timeout=60.0)
+        response.raise_for_status()
+
+
+async def run(label, call, total, concurrency):
+    samples = []
+    queue = iter(range(total))
+
+    async def worker():
+        for _ in queue:
+            started = time.perf_counter()
+            await call()
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stats = percentiles(samples)
+    return {
+        "client": label,
+        "requests": total,
+        "req_per_s": round(total / elapsed, 1),
+        "p50_ms": stats["p50_ms"],
+        "p99_ms": stats["p99_ms"],
+    }
+
+
+async def main_async(args, base):
+    url = f"http://{base}/v1/chat/completions"
+    registry = HTTPClientRegistry()
+    registry.register("stub", max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    await registry.startup()
+
+    async def pooled():
+        response = await registry.get("stub").post(url, json={"model": "stub"})
+        response.raise_for_status()
+
+    rows = [
+        await run("new client per call", lambda: per_call_client(url), args.requests, args.concurrency),
+        await run("shared pooled client", pooled, args.requests, args.concurrency),
+    ]
+    await registry.shutdown()
+    print_table(f"{args.requests} requests, concurrency {args.concurrency}", rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    with run_server(stub_app) as base:
+        asyncio.run(main_async(args, base))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# backend/benchmarks/bench_interview_artifacts.py
+"""
+Dashboard list latency with realistic transcripts stored per session.
+
+Each session gets a ~--transcript-kb plain transcript, its utterance JSON
+(about 3x larger) and a few KB of analysis. Pages of 20 are read:
+- inline, full rows:   the old layout, blobs in interview_sessions, loading
+                       whole rows (what an ORM list of InterviewSession did)
+- inline, summary:     the old layout with only the list columns selected
+                       (what deferred / load_only would give)
+- artifacts, *:        the current layout, blobs in interview_artifacts;
+                       whole InterviewSession rows (db.get, scheduling
+                       queries) no longer carry them either
+
+    python benchmarks/bench_interview_artifacts.py --sessions 400 --transcript-kb 60
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from common import percentiles, print_table
+
+
+def legacy_table(metadata):
+    """interview_sessions as it was, with the blobs between recording_path and the status columns"""
+    from sqlalchemy import JSON, Column, Table, Text
+    from app.models.interview import InterviewSession
+
+    columns = []
+    for column in InterviewSession.__table__.columns:
+        columns.append(Column(column.name, column.type, primary_key=column.primary_key))
+        if column.name == "recording_path":
+            columns += [
+                Column("transcript", Text), Column("ai_summary", Text),
+                Column("ai_detailed_analysis", JSON), Column("transcript_json", JSON),
+            ]
+    return Table("legacy_interview_sessions", metadata, *columns)
+
+
+def artifacts_for(i, transcript_kb):
+    words = ("so tell me about a system you designed and the trade offs you made there " * 200).split()
+    utterances, size = [], 0
+    while size < transcript_kb * 1024:
+        text = " ".join(words[(size // 7) % 500:(size // 7) % 500 + 40])
+        utterances.append({"speaker": "AB"[len(utterances) % 2], "text": text, "start": size, "end": size + 900, "confidence": 0.93})
+        size += len(text) + 2
+    return {
+        "transcript": "\n\n".join(u["text"] for u in utterances),
+        "transcript_json": [
+            {**u, "words": [{"text": w, "start": u["start"], "end": u["end"], "confidence": 0.9} for w in u["text"].split()[:10]]}
+            for u in utterances
+        ],
+        "ai_summary": f"Session {i}: solid fundamentals. " * 40,
+        "ai_detailed_analysis": {"strengths": ["design"] * 20, "weaknesses": ["testing"] * 20, "scores": {"overall": 7}},
+    }
+
+
+def timed(engine, query, repeat):
+    samples = []
+    with engine.connect() as conn:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(query).all()
+            samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=400)
+    parser.add_argument("--transcript-kb", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/artifacts.db")
+    from sqlalchemy import MetaData, insert, select
+    from app.database import Base, engine
+    from app.models import interview, user, job, cache  # noqa: F401
+    from app.models.interview import InterviewArtifacts, InterviewSession
+    from app.routers.interviews import LIST_COLUMNS
+
+    Base.metadata.create_all(bind=engine)
+    legacy = legacy_table(MetaData())
+    legacy.create(bind=engine)
+
+    blob_bytes = 0
+    with engine.begin() as conn:
+        for i in range(args.sessions):
+            session = {
+                "interviewer_id": 1, "interviewer_name": "Interviewer", "candidate_name": f"Candidate {i}",
+                "interview_topic": "Backend", "candidate_level": "mid", "required_skills": "python, sql",
+                "focus_areas": "apis", "is_canceled": False, "is_completed": True, "is_processing": False,
+            }
+            blobs = artifacts_for(i, args.transcript_kb)
+            blob_bytes += sum(len(json.dumps(value)) for value in blobs.values())
+            session_id = conn.execute(insert(InterviewSession).values(**session)).inserted_primary_key[0]
+            conn.execute(insert(InterviewArtifacts).values(session_id=session_id, **blobs))
+            conn.execute(insert(legacy).values(id=session_id, **session, **blobs))
+
+    names = [column.key for column in LIST_COLUMNS]
+    pages = {
+        "inline, full rows": select(legacy),
+        "inline, summary": select(*(legacy.c[name] for name in names)),
+        "artifacts, full rows": select(InterviewSession.__table__),
+        "artifacts, summary": select(*LIST_COLUMNS),
+    }
+    rows = []
+    for layout, query in pages.items():
+        table = legacy if layout.startswith("inline") else InterviewSession.__table__
+        query = query.where(table.c.interviewer_id == 1).order_by(table.c.id.desc()).limit(args.limit)
+        rows.append({"layout": layout, **timed(engine, query, args.repeat)})
+
+    print_table(
+        f"page of {args.limit} from {args.sessions} sessions, "
+        f"~{blob_bytes // args.sessions // 1024} KB of transcript/analysis each",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
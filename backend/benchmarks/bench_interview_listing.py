@@ -0,0 +1,119 @@
+# backend/benchmarks/bench_interview_listing.py
+"""
+Interview listing latency as the sessions table grows.
+
+Sessions are spread over --users owners, plus one "sparse" owner with
+50 of the oldest sessions. For each table size it times:
+- keyset first/deep: list_owned_sessions (indexes, id cursor) for a busy
+  owner; "deep" starts halfway through the owner's history
+- offset deep:       the same page via OR + ORDER BY + OFFSET
+- sparse first:      the sparse owner's first page, with and without the
+                     listing indexes
+
+    python benchmarks/bench_interview_listing.py --sizes 10000,100000,300000
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from common import percentiles, print_table
+
+
+SPARSE_SESSIONS = 50
+
+
+def seed(engine, start, stop, users):
+    from sqlalchemy import insert
+    from app.models.interview import InterviewSession
+
+    rows = [
+        {
+            "interviewer_id": i % users + 1,
+            "created_by": i % users + 1 if i % 10 == 0 else None,
+            "interviewer_name": "Interviewer", "candidate_name": f"Candidate {i}",
+            "interview_topic": "Backend", "candidate_level": "mid",
+            "required_skills": "python, sql", "focus_areas": "apis",
+            "is_canceled": i % 17 == 0, "is_completed": i % 3 == 0,
+        }
+        for i in range(start, stop)
+    ]
+    if start == 0:
+        for row in rows[:SPARSE_SESSIONS]:
+            row["interviewer_id"] = users + 1
+    with engine.begin() as conn:
+        for offset in range(0, len(rows), 10000):
+            conn.execute(insert(InterviewSession), rows[offset:offset + 10000])
+
+
+async def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)["p50_ms"]
+
+
+async def measure(user_id, repeat, limit):
+    from sqlalchemy import or_, select
+    from app.database import AsyncSessionLocal
+    from app.models.interview import InterviewSession
+    from app.routers.interviews import LIST_COLUMNS, list_owned_sessions
+
+    owned = or_(InterviewSession.interviewer_id == user_id, InterviewSession.created_by == user_id)
+    async with AsyncSessionLocal() as db:
+        ids = (await db.execute(select(InterviewSession.id).where(owned).order_by(InterviewSession.id.desc()))).scalars().all()
+        middle = ids[len(ids) // 2]
+
+        async def offset_page():
+            await db.execute(
+                select(*LIST_COLUMNS).where(owned, InterviewSession.is_canceled == False)  # noqa: E712
+                .order_by(InterviewSession.id.desc()).offset(len(ids) // 2).limit(limit)
+            )
+
+        return {
+            "owner_sessions": len(ids),
+            "keyset_first_ms": await timed(lambda: list_owned_sessions(db, user_id, "active", limit=limit), repeat),
+            "keyset_deep_ms": await timed(lambda: list_owned_sessions(db, user_id, "active", before_id=middle, limit=limit), repeat),
+            "offset_deep_ms": await timed(offset_page, repeat),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,300000", help="table sizes to measure, ascending")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/listing.db")
+    from app.database import Base, engine
+    from app.models import interview, user, job, cache  # noqa: F401
+    from app.models.interview import InterviewSession
+
+    Base.metadata.create_all(bind=engine)
+    indexes = [index for index in InterviewSession.__table__.indexes if index.name != "ix_interview_sessions_id"]
+
+    rows, seeded = [], 0
+    for size in (int(value) for value in args.sizes.split(",")):
+        seed(engine, seeded, size, args.users)
+        seeded = size
+        result = asyncio.run(measure(1, args.repeat, args.limit))
+        result["sparse_first_ms"] = asyncio.run(measure(args.users + 1, args.repeat, args.limit))["keyset_first_ms"]
+
+        for index in indexes:
+            index.drop(bind=engine)
+        sparse = asyncio.run(measure(args.users + 1, max(1, args.repeat // 4), args.limit))
+        result["sparse_no_index_ms"] = sparse["keyset_first_ms"]
+        for index in indexes:
+            index.create(bind=engine)
+        rows.append({"sessions": size, **result})
+
+    print_table(f"list page of {args.limit}, {args.users} owners, p50 over {args.repeat} runs", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# backend/benchmarks/bench_migrations.py
+"""
+N processes migrating one database at once, as N uvicorn workers do at startup.
+
+Each child is a new interpreter that imports the app's models and then:
+- in-process:  app.migrations.run_migrations()
+- alembic CLI: create_all() and a subprocess running ``alembic upgrade
+               head``, the previous startup path
+
+against a database that is:
+- fresh:  new file, no tables
+- behind: one revision below head
+- head:   already up to date
+
+Reported per mode/state: wall time until every child is done (how long the
+slowest worker waits before serving), how many children ran a migration,
+how many failed, and whether the database ended up at head.
+
+    python benchmarks/bench_migrations.py --workers 4
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import print_table
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IN_PROCESS = """
+import logging
+logging.basicConfig(level=logging.WARNING)
+from app.migrations import run_migrations
+print("migrated" if run_migrations() else "skipped")
+"""
+
+ALEMBIC_CLI = """
+import subprocess, sys
+from app.database import Base, engine
+from app import models
+Base.metadata.create_all(bind=engine)
+result = subprocess.run(["alembic", "upgrade", "head"], capture_output=True, text=True)
+sys.stderr.write(result.stderr)
+print("migrated" if "Running upgrade" in result.stderr else "skipped")
+sys.exit(result.returncode)
+"""
+
+
+def prepare(db_url, state):
+    """Bring a new database to the given state using the in-process runner"""
+    if state == "fresh":
+        return
+    subprocess.run([sys.executable, "-c", IN_PROCESS], cwd=BACKEND_DIR, env={**os.environ, "DATABASE_URL": db_url},
+                   check=True, capture_output=True)
+    if state == "behind":
+        subprocess.run(["alembic", "downgrade", "-1"], cwd=BACKEND_DIR, env={**os.environ, "DATABASE_URL": db_url},
+                       check=True, capture_output=True)
+
+
+def at_head(db_url):
+    env = {**os.environ, "DATABASE_URL": db_url}
+    check = "from app.migrations import schema_is_current; print(schema_is_current())"
+    output = subprocess.run([sys.executable, "-c", check], cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    return output.stdout.strip() == "True"
+
+
+def run(script, db_url, workers):
+    env = {**os.environ, "DATABASE_URL": db_url}
+    started = time.perf_counter()
+    children = [
+        subprocess.Popen([sys.executable, "-c", script], cwd=BACKEND_DIR, env=env,
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for _ in range(workers)
+    ]
+    outputs = [(child.communicate(), child.returncode) for child in children]
+    elapsed = time.perf_counter() - started
+    return {
+        "wall_ms": round(elapsed * 1000),
+        "migrated": sum(out.strip() == "migrated" for (out, _), code in outputs if code == 0),
+        "failed": sum(code != 0 for _, code in outputs),
+        "at_head": at_head(db_url),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rows = []
+    for mode, script in (("alembic CLI", ALEMBIC_CLI), ("in-process", IN_PROCESS)):
+        for state in ("fresh", "behind", "head"):
+            db_url = f"sqlite:///{tempfile.mkdtemp()}/migrations.db"
+            prepare(db_url, state)
+            rows.append({"mode": mode, "database": state, **run(script, db_url, args.workers)})
+
+    print_table(f"{args.workers} processes migrating one SQLite database at once", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# backend/benchmarks/bench_reminders.py
+"""
+Reminder dispatch cost as the sessions table grows.
+
+Sessions are spread over two years around "now". Exactly --due of them
+start within the reminder window, so the due work stays fixed while the
+table grows. For each table size it times:
+- dispatch:    dispatch_due_reminders() queueing the due reminders
+               (select, mark, render, bulk insert into the outbox)
+- idle run:    the same call once everything is marked, i.e. the
+               steady-state cost of each scheduler tick
+- idle, no ix: the idle run with ix_interview_sessions_scheduled_time
+               dropped
+
+    python benchmarks/bench_reminders.py --sizes 10000,100000,300000 --due 200
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from common import percentiles, print_table
+
+
+def seed(engine, start, stop, due, now):
+    from sqlalchemy import insert
+    from app.models.interview import InterviewSession
+
+    rows = []
+    for i in range(start, stop):
+        if i < due:
+            # Inside the 24h window
+            scheduled = now + timedelta(minutes=5 + i * 1380 / due)
+        else:
+            # Outside it: a year either side, skipping the next two days
+            offset = timedelta(minutes=(i * 7919) % (365 * 24 * 60))
+            scheduled = now - offset - timedelta(days=1) if i % 2 else now + timedelta(days=2) + offset
+        rows.append({
+            "interviewer_id": None, "interviewer_name": "Interviewer", "interviewer_email": "interviewer@example.com",
+            "candidate_name": f"Candidate {i}", "candidate_email": f"candidate{i}@example.com",
+            "interview_topic": "Backend", "candidate_level": "mid", "required_skills": "python, sql",
+            "focus_areas": "apis", "is_canceled": False, "is_completed": False, "scheduled_time": scheduled,
+        })
+    with engine.begin() as conn:
+        for offset in range(0, len(rows), 10000):
+            conn.execute(insert(InterviewSession), rows[offset:offset + 10000])
+
+
+async def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)["p50_ms"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,300000", help="table sizes to measure, ascending")
+    parser.add_argument("--due", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/reminders.db")
+    from sqlalchemy import delete, update
+    from app.database import Base, async_engine, engine
+    from app.models import interview, user, job, cache, outbox  # noqa: F401
+    from app.models.interview import InterviewSession
+    from app.models.outbox import OutboundEmail
+    from app.services.reminders import dispatch_due_reminders
+
+    Base.metadata.create_all(bind=engine)
+    index = next(ix for ix in InterviewSession.__table__.indexes if ix.name == "ix_interview_sessions_scheduled_time")
+    now = datetime.utcnow()
+
+    def reset():
+        with engine.begin() as conn:
+            conn.execute(update(InterviewSession).values(reminders_queued_at=None))
+            conn.execute(delete(OutboundEmail))
+
+    async def measure():
+        dispatch = []
+        for _ in range(args.repeat):
+            reset()
+            started = time.perf_counter()
+            queued = await dispatch_due_reminders(now=now)
+            dispatch.append(time.perf_counter() - started)
+        idle = await timed(lambda: dispatch_due_reminders(now=now), args.repeat)
+        index.drop(bind=engine)
+        idle_no_index = await timed(lambda: dispatch_due_reminders(now=now), max(1, args.repeat // 2))
+        index.create(bind=engine)
+        await async_engine.dispose()
+        return {
+            "emails_queued": queued,
+            "dispatch_ms": percentiles(dispatch)["p50_ms"],
+            "idle_run_ms": idle,
+            "idle_no_index_ms": idle_no_index,
+        }
+
+    rows, seeded = [], 0
+    for size in (int(value) for value in args.sizes.split(",")):
+        seed(engine, seeded, size, args.due, now)
+        seeded = size
+        rows.append({"sessions": size, **asyncio.run(measure())})
+
+    print_table(f"{args.due} interviews due in the next 24h, p50 over {args.repeat} runs", rows)
+
+
+if __name__ == "__main__":
+    main()
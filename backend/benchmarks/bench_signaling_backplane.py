@@ -0,0 +1,172 @@
+# backend/benchmarks/bench_signaling_backplane.py
+"""
+Cross-node signaling through the Redis backplane.
+
+Starts two API processes ("nodes") sharing a SQLite database and a Redis
+backplane, then relays messages between interviewer/candidate pairs:
+- same-node:  both participants on node A (local delivery only)
+- cross-node: interviewer on node A, candidate on node B (via Redis)
+
+Without --redis-url an in-process fakeredis TCP server is used
+(pip install fakeredis).
+
+    python benchmarks/bench_signaling_backplane.py --sessions 20 --messages 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from common import free_port, percentiles, print_table
+
+
+def run_node(port):
+    import uvicorn
+    from fastapi import FastAPI
+
+    from app.routers import signaling
+
+    app = FastAPI()
+    app.include_router(signaling.router)
+
+    @app.on_event("startup")
+    async def startup():
+        await signaling.manager.start()
+
+    @app.on_event("shutdown")
+    async def shutdown():
+        await signaling.manager.close()
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def wait_for_port(port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"Node on port {port} did not start")
+
+
+def create_sessions(db_url, count):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from app.database import Base
+    from app.models.interview import InterviewSession
+
+    engine = create_engine(db_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        sessions = [
+            InterviewSession(
+                interviewer_name="I", candidate_name="C", interview_topic="T",
+                candidate_level="mid", required_skills="python", focus_areas="apis",
+            )
+            for _ in range(count)
+        ]
+        db.add_all(sessions)
+        db.commit()
+        return [s.id for s in sessions]
+
+
+async def relay(session_id, interviewer_port, candidate_port, messages, latencies):
+    import websockets
+
+    interviewer = await websockets.connect(f"ws://127.0.0.1:{interviewer_port}/ws/interview/{session_id}/interviewer")
+    candidate = await websockets.connect(f"ws://127.0.0.1:{candidate_port}/ws/interview/{session_id}/candidate")
+    # The interviewer hears about the candidate once both nodes are subscribed
+    while json.loads(await interviewer.recv()).get("type") != "user-connected":
+        pass
+
+    received = 0
+
+    async def receive():
+        nonlocal received
+        while received < messages:
+            message = json.loads(await candidate.recv())
+            if message.get("type") == "bench":
+                latencies.append(time.perf_counter() - message["sent_at"])
+                received += 1
+
+    receiver = asyncio.create_task(receive())
+    for i in range(messages):
+        await interviewer.send(json.dumps({"type": "bench", "seq": i, "sent_at": time.perf_counter()}))
+        await asyncio.sleep(0.001)
+    try:
+        await asyncio.wait_for(receiver, timeout=10)
+    except asyncio.TimeoutError:
+        pass
+    await interviewer.close()
+    await candidate.close()
+    return received
+
+
+async def run_mode(session_ids, interviewer_port, candidate_port, messages):
+    latencies = []
+    started = time.perf_counter()
+    delivered = await asyncio.gather(*(
+        relay(sid, interviewer_port, candidate_port, messages, latencies) for sid in session_ids
+    ))
+    elapsed = time.perf_counter() - started
+    return {
+        "delivered": f"{sum(delivered)}/{len(session_ids) * messages}",
+        "msgs_per_s": round(sum(delivered) / elapsed),
+        **percentiles(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--redis-url", help="Use a real Redis instead of fakeredis")
+    parser.add_argument("--node", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.node:
+        run_node(args.node)
+        return
+
+    redis_url = args.redis_url
+    if not redis_url:
+        from fakeredis import TcpFakeServer
+
+        redis_port = free_port()
+        fake = TcpFakeServer(("127.0.0.1", redis_port), server_type="redis")
+        threading.Thread(target=fake.serve_forever, daemon=True).start()
+        redis_url = f"redis://127.0.0.1:{redis_port}"
+
+    db_url = f"sqlite:///{tempfile.mkdtemp()}/signaling.db"
+    # Both modes need fresh sessions: a role's previous socket would be "replaced"
+    session_ids = create_sessions(db_url, args.sessions * 2)
+    env = {**os.environ, "DATABASE_URL": db_url, "SIGNALING_BACKPLANE_URL": redis_url}
+    ports = [free_port(), free_port()]
+    nodes = [
+        subprocess.Popen([sys.executable, __file__, "--node", str(port)], env=env)
+        for port in ports
+    ]
+    try:
+        for port in ports:
+            wait_for_port(port)
+        rows = [
+            {"mode": "same-node", **asyncio.run(run_mode(session_ids[:args.sessions], ports[0], ports[0], args.messages))},
+            {"mode": "cross-node", **asyncio.run(run_mode(session_ids[args.sessions:], ports[0], ports[1], args.messages))},
+        ]
+    finally:
+        for node in nodes:
+            node.terminate()
+            node.wait()
+    print_table(f"{args.sessions} sessions x {args.messages} messages, backplane {redis_url}", rows)
+
+
+if __name__ == "__main__":
+    main()
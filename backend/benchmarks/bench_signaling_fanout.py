@@ -0,0 +1,207 @@
+# backend/benchmarks/bench_signaling_fanout.py
+"""
+Healthy-peer latency while one signaling client stops reading.
+
+Two nodes share a Redis backplane (fakeredis unless --redis-url is given).
+Every session has its interviewer on node A and its candidate on node B,
+so node B delivers all of them from one backplane reader. One extra
+session has a candidate that never reads while its interviewer floods
+large SDP-sized frames.
+
+- serial: the previous delivery, awaiting each peer's send_text inline
+- queued: per-connection bounded queues with writer tasks and the
+          slow-consumer policy (WS_SLOW_CONSUMER_POLICY)
+
+    python benchmarks/bench_signaling_fanout.py --sessions 20 --duration 10
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from common import free_port, percentiles, print_table
+from bench_signaling_backplane import create_sessions, run_node, wait_for_port
+
+
+def run_variant_node(port, variant):
+    from app.routers import signaling
+
+    if variant == "serial":
+        class SerialConnectionManager(signaling.ConnectionManager):
+            """The previous behaviour: each peer's send is awaited inline"""
+
+            async def send_inline(self, session_id, sender_role, message):
+                for role, peer in list(self.active_connections.get(session_id, {}).items()):
+                    if role != sender_role:
+                        try:
+                            await peer.websocket.send_text(message)
+                        except Exception:
+                            pass
+
+            async def broadcast_to_session(self, session_id, sender_role, message):
+                await self.send_inline(session_id, sender_role, message)
+                await self.backplane.publish(session_id, sender_role, message)
+
+            async def on_backplane_message(self, kind, session_id, sender_role, message):
+                if kind == signaling.REPLACE:
+                    return await super().on_backplane_message(kind, session_id, sender_role, message)
+                await self.send_inline(session_id, sender_role, message)
+
+        signaling.manager = SerialConnectionManager()
+    run_node(port)
+
+
+async def connect(port, session_id, role, **kwargs):
+    import websockets
+
+    return await websockets.connect(f"ws://127.0.0.1:{port}/ws/interview/{session_id}/{role}", **kwargs)
+
+
+async def healthy_session(session_id, ports, duration, rate, latencies, counts):
+    interviewer = await connect(ports[0], session_id, "interviewer")
+    candidate = await connect(ports[1], session_id, "candidate")
+    while json.loads(await interviewer.recv()).get("type") != "user-connected":
+        pass
+
+    async def receive():
+        async for raw in candidate:
+            message = json.loads(raw)
+            if message.get("type") == "ice-candidate":
+                latencies.append(time.perf_counter() - message["sent_at"])
+                counts["received"] += 1
+
+    receiver = asyncio.create_task(receive())
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        await interviewer.send(json.dumps({"type": "ice-candidate", "sent_at": time.perf_counter()}))
+        counts["sent"] += 1
+        await asyncio.sleep(1 / rate)
+    await asyncio.sleep(2)  # grace period for in-flight messages
+    receiver.cancel()
+    await interviewer.close()
+    await candidate.close()
+
+
+def stalled_client(port, session_id, role):
+    """A raw socket that completes the WebSocket handshake and then never reads"""
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect(("127.0.0.1", port))
+    key = base64.b64encode(os.urandom(16)).decode()
+    sock.sendall((
+        f"GET /ws/interview/{session_id}/{role} HTTP/1.1\r\n"
+        f"Host: 127.0.0.1:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+    ).encode())
+    response = b""
+    while b"\r\n\r\n" not in response:
+        response += sock.recv(1)
+    if b" 101 " not in response.split(b"\r\n", 1)[0]:
+        raise RuntimeError(f"Handshake failed: {response!r}")
+    return sock
+
+
+def peer_closed(sock):
+    """True once the server has closed the stalled connection"""
+    sock.setblocking(False)
+    try:
+        while True:
+            if not sock.recv(1 << 20):
+                return True
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+
+
+async def slow_session(session_id, ports, duration, frame_kb):
+    candidate = stalled_client(ports[1], session_id, "candidate")
+    interviewer = await connect(ports[0], session_id, "interviewer")
+    blob = "x" * (frame_kb * 1024)
+    deadline = time.perf_counter() + duration
+    try:
+        while time.perf_counter() < deadline:
+            await interviewer.send(json.dumps({"type": "offer", "sdp": blob}))
+            await asyncio.sleep(0.005)
+    except Exception:
+        pass
+    await interviewer.close()
+    # Drains whatever was buffered, so only a close made by the server counts;
+    # a stalled close handshake is aborted after the server's close timeout
+    deadline = time.perf_counter() + 15
+    closed = peer_closed(candidate)
+    while not closed and time.perf_counter() < deadline:
+        await asyncio.sleep(0.5)
+        closed = peer_closed(candidate)
+    candidate.close()
+    return closed
+
+
+async def run_scenario(session_ids, ports, args):
+    latencies, counts = [], {"sent": 0, "received": 0}
+    healthy = [healthy_session(sid, ports, args.duration, args.rate, latencies, counts) for sid in session_ids[1:]]
+    slow_close = (await asyncio.gather(slow_session(session_ids[0], ports, args.duration, args.frame_kb), *healthy))[0]
+    return {
+        "delivered": f"{counts['received']}/{counts['sent']}",
+        "slow_client_closed": slow_close,
+        **percentiles(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20, help="healthy sessions")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--rate", type=float, default=20.0, help="messages/s per healthy interviewer")
+    parser.add_argument("--frame-kb", type=int, default=64, help="size of the slow session's frames")
+    parser.add_argument("--redis-url", help="Use a real Redis instead of fakeredis")
+    parser.add_argument("--node", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--variant", choices=["serial", "queued"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.node:
+        run_variant_node(args.node, args.variant)
+        return
+
+    redis_url = args.redis_url
+    if not redis_url:
+        from fakeredis import TcpFakeServer
+
+        redis_port = free_port()
+        fake = TcpFakeServer(("127.0.0.1", redis_port), server_type="redis")
+        threading.Thread(target=fake.serve_forever, daemon=True).start()
+        redis_url = f"redis://127.0.0.1:{redis_port}"
+
+    rows = []
+    for variant in ("serial", "queued"):
+        db_url = f"sqlite:///{tempfile.mkdtemp()}/signaling.db"
+        session_ids = create_sessions(db_url, args.sessions + 1)
+        env = {**os.environ, "DATABASE_URL": db_url, "SIGNALING_BACKPLANE_URL": redis_url}
+        ports = [free_port(), free_port()]
+        nodes = [
+            subprocess.Popen([sys.executable, __file__, "--node", str(port), "--variant", variant], env=env)
+            for port in ports
+        ]
+        try:
+            for port in ports:
+                wait_for_port(port)
+            rows.append({"delivery": variant, **asyncio.run(run_scenario(session_ids, ports, args))})
+        finally:
+            for node in nodes:
+                node.terminate()
+                node.wait()
+    print_table(
+        f"{args.sessions} healthy sessions at {args.rate:g} msg/s + 1 stalled reader, {args.duration:g}s",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_signaling_frames.py
+"""
+Frames per second (single core) for tagging relayed signaling frames.
+
+- decode+encode: the previous relay (json.loads, add "sender", json.dumps)
+- splice:        WS_FRAME_VALIDATION=fast, sender spliced in without parsing
+- full/json:     WS_FRAME_VALIDATION=full with the stdlib parser
+- full/orjson:   WS_FRAME_VALIDATION=full with orjson (if installed)
+
+    python benchmarks/bench_signaling_frames.py --seconds 1
+"""
+import argparse
+import json
+import time
+
+from common import print_table
+
+from app.services import signaling_frames
+
+
+def sdp(lines):
+    body = [
+        "v=0", "o=- 4611731400430051336 2 IN IP4 127.0.0.1", "s=-", "t=0 0",
+        "a=group:BUNDLE 0 1", "a=msid-semantic: WMS stream",
+    ]
+    for i in range(lines):
+        body.append(f"a=candidate:{i} 1 udp 2122260223 192.168.1.{i % 255} {50000 + i} typ host generation 0")
+        body.append(f"a=rtpmap:{96 + i % 32} VP8/90000")
+    return "\r\n".join(body) + "\r\n"
+
+
+FRAMES = {
+    "ice-candidate": json.dumps({
+        "type": "ice-candidate",
+        "candidate": {
+            "candidate": "candidate:842163049 1 udp 1677729535 203.0.113.7 61665 typ srflx raddr 0.0.0.0 rport 0 generation 0",
+            "sdpMid": "0",
+            "sdpMLineIndex": 0,
+        },
+    }),
+    "sdp-offer-4k": json.dumps({"type": "offer", "offer": {"type": "offer", "sdp": sdp(25)}}),
+    "sdp-offer-32k": json.dumps({"type": "offer", "offer": {"type": "offer", "sdp": sdp(220)}}),
+}
+
+
+def decode_encode(frame, role):
+    message = json.loads(frame)
+    if "sender" not in message:
+        message["sender"] = role
+    return json.dumps(message)
+
+
+def rate(fn, frame, seconds):
+    done = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(200):
+            fn(frame, "candidate")
+        done += 200
+    return done / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=1.0, help="measurement time per cell")
+    args = parser.parse_args()
+
+    variants = {
+        "decode+encode": decode_encode,
+        "splice": lambda frame, role: signaling_frames.tag_sender(frame, role, "fast"),
+        "full/json": lambda frame, role: signaling_frames.tag_sender(frame, role, "full"),
+    }
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    rows = []
+    for name, frame in FRAMES.items():
+        for binary in (False, True):
+            payload = frame.encode() if binary else frame
+            row = {"frame": name + (" (binary)" if binary else ""), "bytes": len(payload)}
+            for variant, fn in variants.items():
+                if binary and variant == "decode+encode":
+                    row[variant] = ""
+                    continue
+                signaling_frames._loads = json.loads
+                row[variant] = f"{rate(fn, payload, args.seconds):,.0f}"
+            if orjson is not None:
+                signaling_frames._loads = orjson.loads
+                row["full/orjson"] = f"{rate(variants['full/json'], payload, args.seconds):,.0f}"
+            rows.append(row)
+    print_table("frames/s on one core", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# backend/benchmarks/bench_sqlite_concurrency.py
+"""
+Concurrency benchmark: default SQLite engine vs the tuned engine factory.
+
+Runs concurrent writer threads (insert + commit) alongside reader threads
+holding short read transactions, first against a plain create_engine() and
+then against app.database.create_db_engine() (WAL, synchronous=NORMAL,
+mmap, busy_timeout, sized pool). Reports throughput, commit latency and
+"database is locked" failures for each.
+
+    python benchmarks/bench_sqlite_concurrency.py --writers 8 --readers 8 --ops 200
+"""
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from common import percentiles, print_table
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_db_engine
+from app.models.interview import InterviewArtifacts, InterviewSession
+
+
+def writer(Session, ops, samples, errors):
+    for i in range(ops):
+        started = time.perf_counter()
+        try:
+            with Session() as db:
+                session = InterviewSession(
+                    interviewer_name="I", candidate_name=f"C{i}", interview_topic="T",
+                    candidate_level="mid", required_skills="python", focus_areas="apis",
+                )
+                db.add(session)
+                db.flush()
+                db.add(InterviewArtifacts(session_id=session.id, transcript="lorem ipsum " * 200))
+                db.commit()
+            samples.append(time.perf_counter() - started)
+        except OperationalError as e:
+            errors.append(str(e.orig))
+
+
+def reader(Session, stop, samples, errors):
+    while not stop.is_set():
+        started = time.perf_counter()
+        try:
+            with Session() as db:
+                db.execute(select(func.count(InterviewSession.id))).scalar()
+                time.sleep(0.002)  # work done while the read transaction is open
+                db.execute(select(InterviewSession.id).order_by(InterviewSession.id.desc()).limit(20)).all()
+            samples.append(time.perf_counter() - started)
+        except OperationalError as e:
+            errors.append(str(e.orig))
+
+
+def run(engine, args):
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    write_samples, read_samples, errors = [], [], []
+    stop = threading.Event()
+    readers = [threading.Thread(target=reader, args=(Session, stop, read_samples, errors)) for _ in range(args.readers)]
+    writers = [threading.Thread(target=writer, args=(Session, args.ops, write_samples, errors)) for _ in range(args.writers)]
+    started = time.perf_counter()
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for t in readers:
+        t.join()
+    engine.dispose()
+    commits = percentiles(write_samples)
+    return {
+        "commits_per_s": round(len(write_samples) / elapsed, 1),
+        "reads_per_s": round(len(read_samples) / elapsed, 1),
+        "commit_p50_ms": commits.get("p50_ms"),
+        "commit_p99_ms": commits.get("p99_ms"),
+        "locked_errors": sum("locked" in e for e in errors),
+        "other_errors": sum("locked" not in e for e in errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=200, help="commits per writer")
+    args = parser.parse_args()
+
+    pool_size = args.writers + args.readers
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        default_url = f"sqlite:///{Path(tmp) / 'default.db'}"
+        tuned_url = f"sqlite:///{Path(tmp) / 'tuned.db'}"
+        engines = (
+            ("default", create_engine(default_url, connect_args={"check_same_thread": False})),
+            ("tuned", create_db_engine(tuned_url, pool_size=pool_size)),
+        )
+        for name, engine in engines:
+            rows.append({"engine": name, **run(engine, args)})
+    print_table(f"{args.writers} writers x {args.ops} commits, {args.readers} readers", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# backend/benchmarks/bench_startup.py
+"""
+Cold start of the API process.
+
+Each run spawns a new interpreter and times:
+- import:       python -c "import app.main"
+- ready, fresh: uvicorn app.main:app until GET / answers, on a new database
+- ready, head:  the same on a database that is already migrated (the
+                usual case for an autoscaled instance)
+
+The embedded mail worker is disabled so only the API itself is measured.
+Start with STARTUP_PROFILE=true for the per-import/per-step breakdown.
+
+    python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import free_port, percentiles, print_table
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def environment(db_url):
+    return {**os.environ, "DATABASE_URL": db_url, "RUN_EMBEDDED_MAIL_WORKER": "false"}
+
+
+def time_import(db_url):
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import app.main"], cwd=BACKEND_DIR, env=environment(db_url),
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def time_ready(db_url):
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=environment(db_url), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                httpx.get(f"http://127.0.0.1:{port}/", timeout=1).raise_for_status()
+                return time.perf_counter() - started
+            except httpx.TransportError:
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited before it was ready")
+                time.sleep(0.005)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    def fresh_db():
+        return f"sqlite:///{tempfile.mkdtemp()}/startup.db"
+
+    migrated = fresh_db()
+    time_ready(migrated)
+
+    samples = {"import": [], "ready, fresh": [], "ready, head": []}
+    for _ in range(args.runs):
+        samples["import"].append(time_import(migrated))
+        samples["ready, fresh"].append(time_ready(fresh_db()))
+        samples["ready, head"].append(time_ready(migrated))
+
+    rows = [{"phase": phase, **percentiles(values)} for phase, values in samples.items()]
+    print_table(f"API cold start, {args.runs} runs", rows)
+
+
+if __name__ == "__main__":
+    main()
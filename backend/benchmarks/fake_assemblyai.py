@@ -0,0 +1,183 @@
+# backend/benchmarks/fake_assemblyai.py
+"""
+Local fake AssemblyAI server and an end-to-end check of the transcription flow.
+
+The fake implements /v2/upload, POST /v2/transcript and
+GET /v2/transcript/{id}. It finishes each transcript after
+--processing-seconds and, when the request carried a webhook_url, POSTs
+the completion to it with the configured auth header.
+
+Running this script drives the real pipeline (upload -> submit -> wait ->
+store) through PipelineWorker twice: once with the webhook route mounted
+and once in polling-only mode. It reports how long after the fake
+finished the transcript landed in the DB and how many status polls were
+spent.
+
+    python benchmarks/fake_assemblyai.py --processing-seconds 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from common import free_port, print_table, run_server
+
+WEBHOOK_SECRET = "fake-webhook-secret"
+
+
+def create_fake_app(processing_seconds):
+    import httpx
+    from fastapi import FastAPI, Request
+
+    fake = FastAPI()
+    fake.state.transcripts = {}
+    fake.state.polls = 0
+    fake.state.uploaded_bytes = 0
+
+    @fake.post("/v2/upload")
+    async def upload(request: Request):
+        async for chunk in request.stream():
+            fake.state.uploaded_bytes += len(chunk)
+        return {"upload_url": f"https://cdn.fake/{uuid.uuid4().hex}"}
+
+    async def finish(transcript_id):
+        await asyncio.sleep(processing_seconds)
+        record = fake.state.transcripts[transcript_id]
+        record["status"] = "completed"
+        record["completed_at"] = time.time()
+        if record.get("webhook_url"):
+            headers = {}
+            if record.get("webhook_auth_header_name"):
+                headers[record["webhook_auth_header_name"]] = record["webhook_auth_header_value"]
+            async with httpx.AsyncClient() as client:
+                await client.post(
+                    record["webhook_url"],
+                    json={"transcript_id": transcript_id, "status": "completed"},
+                    headers=headers,
+                )
+
+    @fake.post("/v2/transcript")
+    async def submit(request: Request):
+        body = await request.json()
+        transcript_id = uuid.uuid4().hex
+        fake.state.transcripts[transcript_id] = {**body, "status": "queued"}
+        asyncio.create_task(finish(transcript_id))
+        return {"id": transcript_id, "status": "queued"}
+
+    @fake.get("/v2/transcript/{transcript_id}")
+    async def status(transcript_id: str):
+        fake.state.polls += 1
+        record = fake.state.transcripts[transcript_id]
+        response = {"id": transcript_id, "status": record["status"]}
+        if record["status"] == "completed":
+            response["text"] = "Tell me about yourself. I build APIs."
+            response["utterances"] = [
+                {"speaker": "A", "text": "Tell me about yourself.", "start": 0, "end": 1500},
+                {"speaker": "B", "text": "I build APIs.", "start": 1600, "end": 2900},
+            ]
+        elif record["status"] == "queued":
+            record["status"] = "processing"
+        return response
+
+    return fake
+
+
+def run_child(mode, processing_seconds):
+    """Runs in a subprocess: app settings are read from the environment at import time."""
+    fake_port, app_port = free_port(), free_port()
+    tmp = tempfile.mkdtemp()
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{tmp}/flow.db",
+        "ASSEMBLYAI_API_KEY": "fake-key",
+        "ASSEMBLYAI_API_URL": f"http://127.0.0.1:{fake_port}/v2",
+        "ASSEMBLYAI_WEBHOOK_URL": f"http://127.0.0.1:{app_port}/api/webhooks/assemblyai" if mode == "webhook" else "",
+        "ASSEMBLYAI_WEBHOOK_SECRET": WEBHOOK_SECRET,
+        "JOB_POLL_INTERVAL_SECONDS": "0.2",
+    })
+
+    from fastapi import FastAPI
+
+    from app.database import AsyncSessionLocal, Base, SessionLocal, engine
+    from app.models.interview import InterviewSession
+    from app.routers import webhooks
+    from app.services.job_queue import enqueue_job
+    from app.services.pipeline import run_transcription_stage
+    from app.workers.pipeline_worker import PipelineWorker
+
+    Base.metadata.create_all(bind=engine)
+    recording = Path(tmp) / "recording.webm"
+    recording.write_bytes(os.urandom(256 * 1024))
+    with SessionLocal() as db:
+        session = InterviewSession(
+            interviewer_name="I", candidate_name="C", interview_topic="T", candidate_level="mid",
+            required_skills="python", focus_areas="apis", recording_path=str(recording),
+        )
+        db.add(session)
+        db.commit()
+        session_id = session.id
+
+    api = FastAPI()
+    api.include_router(webhooks.router)
+    fake = create_fake_app(processing_seconds)
+
+    async def skip_analysis(job_id, session_id):
+        return True
+
+    async def flow():
+        async with AsyncSessionLocal() as db:
+            await enqueue_job(db, session_id, "transcription")
+            await db.commit()
+        worker = PipelineWorker(handlers={"transcription": run_transcription_stage, "analysis": skip_analysis})
+        runner = asyncio.create_task(worker.run())
+        while True:
+            await asyncio.sleep(0.05)
+            async with AsyncSessionLocal() as db:
+                stored = await db.get(InterviewSession, session_id)
+                await db.refresh(stored)
+                if stored.transcript:
+                    break
+        stored_at = time.time()
+        worker.stop()
+        await runner
+        return stored_at
+
+    with run_server(fake, port=fake_port), run_server(api, port=app_port):
+        stored_at = asyncio.run(flow())
+    (record,) = fake.state.transcripts.values()
+    print(json.dumps({
+        "mode": mode,
+        "uploaded_kb": fake.state.uploaded_bytes // 1024,
+        "provider_polls": fake.state.polls,
+        "added_latency_s": round(stored_at - record["completed_at"], 2),
+        "used_webhook": bool(record.get("webhook_url")),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processing-seconds", type=float, default=20.0)
+    parser.add_argument("--child", choices=["webhook", "polling"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.processing_seconds)
+        return
+
+    rows = []
+    for mode in ("polling", "webhook"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--processing-seconds", str(args.processing_seconds)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        rows.append(json.loads(output.strip().splitlines()[-1]))
+    print_table(f"transcript ready after {args.processing_seconds}s of provider processing", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# backend/benchmarks/fake_smtp.py
+"""
+Local aiosmtpd stand-in for the mail provider, and a delivery benchmark.
+
+The fake server accepts everything, but can:
+- add --rtt-ms to every SMTP command and --handshake-ms to each new
+  connection, standing in for network latency and for the STARTTLS + AUTH
+  round trips a real provider needs (the stand-in runs without TLS);
+- drop every connection after --session-cap messages, as Gmail does;
+- answer 451 (try again later) for every --defer-every'th recipient.
+
+It queues --messages emails in the outbox and delivers them twice:
+- per-message connection: connect, handshake, send, quit for each
+  message (what send_email_background / send_email did)
+- mail worker:            MailWorker draining the outbox over
+                          --connections persistent connections
+
+    pip install aiosmtpd
+    python benchmarks/fake_smtp.py --messages 200 --rtt-ms 20 --handshake-ms 150
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from common import free_port, print_table
+
+
+class FakeProvider:
+    """aiosmtpd handler; hooks run on the controller's own event loop"""
+
+    def __init__(self, rtt_ms, handshake_ms, session_cap, defer_every):
+        self.rtt = rtt_ms / 1000
+        self.handshake = handshake_ms / 1000
+        self.session_cap = session_cap
+        self.defer_every = defer_every
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.delivered = 0
+        self.deferred = 0
+        self.recipients = 0
+        self.delivered_to = set()
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        if not getattr(session, "counted", False):
+            session.counted = True
+            session.messages = 0
+            with self.lock:
+                self.connections += 1
+            await asyncio.sleep(self.handshake)
+        await asyncio.sleep(self.rtt)
+        return responses
+
+    async def handle_MAIL(self, server, session, envelope, address, mail_options):
+        await asyncio.sleep(self.rtt)
+        envelope.mail_from = address
+        envelope.mail_options.extend(mail_options)
+        return "250 OK"
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        await asyncio.sleep(self.rtt)
+        with self.lock:
+            self.recipients += 1
+            defer = self.defer_every and self.recipients % self.defer_every == 0
+            if defer:
+                self.deferred += 1
+        if defer:
+            return "451 4.3.0 Try again later"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.rtt)
+        with self.lock:
+            self.delivered += 1
+            self.delivered_to.update(envelope.rcpt_tos)
+        session.messages += 1
+        if self.session_cap and session.messages >= self.session_cap:
+            # Accept this one, then hang up like a provider enforcing its per-session cap
+            asyncio.get_running_loop().call_soon(server.transport.close)
+        return "250 Message accepted"
+
+
+def queue(count, prefix):
+    from app.database import SessionLocal
+    from app.services.email_outbox import queue_email
+
+    with SessionLocal() as db:
+        for i in range(count):
+            queue_email(db, f"{prefix}-{i}@example.com", f"Interview invitation {i}", f"<p>Hello candidate {i}</p>")
+        db.commit()
+
+
+def outbox_counts():
+    from sqlalchemy import func, select
+    from app.database import SessionLocal
+    from app.models.outbox import OutboundEmail
+
+    with SessionLocal() as db:
+        return dict(db.execute(select(OutboundEmail.status, func.count()).group_by(OutboundEmail.status)).all())
+
+
+def per_message(count, prefix):
+    """Old behaviour: a fresh connection, handshake and QUIT per message"""
+    from app.services.email_service import SMTPConnection
+
+    failures = 0
+    for i in range(count):
+        connection = SMTPConnection()
+        try:
+            connection.send(f"{prefix}-{i}@example.com", f"Interview invitation {i}", f"<p>Hello candidate {i}</p>")
+        except Exception:
+            failures += 1
+        finally:
+            connection.close()
+    return failures
+
+
+async def drain(connections, expected):
+    from app.database import async_engine
+    from app.workers.mail_worker import MailWorker
+
+    worker = MailWorker(connections=connections)
+    task = asyncio.create_task(worker.run())
+    while outbox_counts().get("sent", 0) < expected:
+        await asyncio.sleep(0.05)
+    worker.stop()
+    await task
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--connections", type=int, default=2)
+    parser.add_argument("--rtt-ms", type=float, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=150)
+    parser.add_argument("--session-cap", type=int, default=90)
+    parser.add_argument("--defer-every", type=int, default=0, help="answer 451 to every Nth recipient")
+    args = parser.parse_args()
+
+    port = free_port()
+    os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/outbox.db")
+    os.environ.update({
+        "EMAIL_HOST": "127.0.0.1", "EMAIL_PORT": str(port), "EMAIL_USE_TLS": "false",
+        "EMAIL_DELIVERY_ENABLED": "true", "EMAIL_RATE_LIMIT_PER_MINUTE": "0",
+        "EMAIL_POLL_INTERVAL_SECONDS": "0.05", "EMAIL_RETRY_BASE_SECONDS": "0.2",
+        "EMAIL_RETRY_MAX_SECONDS": "1", "EMAIL_CONNECT_BACKOFF_SECONDS": "0.2",
+    })
+    from aiosmtpd.controller import Controller
+    from app.database import Base, engine
+    from app.models import interview, user, job, cache, outbox  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+    provider = FakeProvider(args.rtt_ms, args.handshake_ms, args.session_cap, args.defer_every)
+    controller = Controller(provider, hostname="127.0.0.1", port=port)
+    controller.start()
+    rows = []
+    try:
+        for mode in ("per-message connection", "mail worker"):
+            before_connections, before_delivered = provider.connections, provider.delivered
+            started = time.perf_counter()
+            if mode == "mail worker":
+                queue(args.messages, "worker")
+                asyncio.run(drain(args.connections, args.messages))
+                failed = sum(1 for i in range(args.messages) if f"worker-{i}@example.com" not in provider.delivered_to)
+            else:
+                failed = per_message(args.messages, "direct")
+            elapsed = time.perf_counter() - started
+            delivered = provider.delivered - before_delivered
+            rows.append({
+                "mode": mode,
+                "delivered": delivered,
+                "undelivered": failed,
+                "smtp_connections": provider.connections - before_connections,
+                "seconds": round(elapsed, 2),
+                "msgs_per_s": round(delivered / elapsed, 1),
+            })
+    finally:
+        controller.stop()
+
+    print_table(
+        f"{args.messages} emails, rtt {args.rtt_ms} ms, handshake {args.handshake_ms} ms, "
+        f"session cap {args.session_cap}, 451 every {args.defer_every or '-'}",
+        rows,
+    )
+    print(f"outbox: {outbox_counts()}, 451 replies: {provider.deferred}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# backend/tests/conftest.py
+"""
+Shared fixtures. The app reads its settings at import time, so the test
+database and recordings directory are set here, before anything from
+``app`` is imported.
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+
+_tmp = tempfile.mkdtemp(prefix="interview-app-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/test.db"
+os.environ["RECORDINGS_DIR"] = os.path.join(_tmp, "recordings")
+os.environ["RUN_EMBEDDED_WORKER"] = "false"
+os.environ["RUN_EMBEDDED_MAIL_WORKER"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import models  # noqa: F401  (registers every table on Base.metadata)
+from app.auth.token_cache import token_cache
+from app.auth.utils import get_current_user
+from app.database import AsyncSessionLocal, Base, engine
+from app.main import app
+from app.models.interview import InterviewSession
+from app.services import recordings, session_cache
+
+Base.metadata.create_all(bind=engine)
+
+def run(coroutine):
+    """Run a coroutine to completion (tests are plain functions)"""
+    return asyncio.run(coroutine)
+
+@pytest.fixture(autouse=True)
+def clean_database():
+    yield
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    token_cache.clear()
+    session_cache.clear()
+    # Ids are reused once their rows are gone, so uploads must not outlive a test
+    shutil.rmtree(recordings.RECORDINGS_DIR)
+    recordings.RECORDINGS_DIR.mkdir()
+
+@pytest.fixture
+def current_user():
+    return SimpleNamespace(id=1, email="interviewer@example.com")
+
+@pytest.fixture
+def client(current_user):
+    """TestClient authenticated as ``current_user`` (startup hooks are not run)"""
+    app.dependency_overrides[get_current_user] = lambda: current_user
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+
+@pytest.fixture
+def make_interview():
+    """Insert an interview and return its id"""
+
+    def make(**values) -> int:
+        async def insert():
+            async with AsyncSessionLocal() as db:
+                interview = InterviewSession(**{
+                    "interviewer_name": "Ada",
+                    "interviewer_id": 1,
+                    "candidate_name": "Grace",
+                    "interview_topic": "Python",
+                    "candidate_level": "senior",
+                    "required_skills": "python",
+                    "focus_areas": "apis",
+                    **values,
+                })
+                db.add(interview)
+                await db.commit()
+                return interview.id
+
+        return run(insert())
+
+    return make
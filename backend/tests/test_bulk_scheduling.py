@@ -0,0 +1,106 @@
+# backend/tests/test_bulk_scheduling.py
+import json
+
+from sqlalchemy import func, select
+
+from app.database import SessionLocal
+from app.models.interview import InterviewSession
+from app.models.outbox import OutboundEmail
+from app.services import bulk_import
+
+ROW = {
+    "interviewer_name": "Ada",
+    "candidate_name": "Grace",
+    "interview_topic": "Python",
+    "candidate_level": "senior",
+    "required_skills": "python",
+    "focus_areas": "apis",
+    "candidate_email": "grace@example.com",
+    "scheduled_time": "2030-01-01T10:00:00",
+}
+CSV_HEADER = ",".join(ROW) + "\r\n"
+
+def count(model) -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(model))
+
+def post_bulk(client, body, content_type, **params):
+    return client.post("/api/interviews/bulk", params=params, content=body, headers={"content-type": content_type})
+
+def test_json_rows_report_errors_per_row(client):
+    rows = [ROW, {"candidate_name": "x"}, 5, {**ROW, "candidate_email": "not-an-email"}, {**ROW, "scheduled_time": None}]
+    response = client.post("/api/interviews/bulk", json=rows)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"], body["invitations_queued"]) == (2, 3, 1)
+
+    results = body["results"]
+    assert [result["row"] for result in results] == [1, 2, 3, 4, 5]
+    assert "id" in results[0] and "id" in results[4]
+    assert "interviewer_name: Field required" in results[1]["errors"]
+    assert results[2]["errors"] == ["Expected a JSON object"]
+    assert results[3]["errors"][0].startswith("candidate_email:")
+    assert count(InterviewSession) == 2
+    assert count(OutboundEmail) == 1
+
+def test_csv_rows_with_wrong_column_count(client):
+    good = ",".join(ROW.values())
+    body = f"{CSV_HEADER}{good}\r\nshort,row\r\n{good}\r\n"
+    results = post_bulk(client, body, "text/csv").json()["results"]
+    assert results[1] == {"row": 2, "errors": ["Expected 8 columns, got 2"]}
+    assert "id" in results[0] and "id" in results[2]
+
+def test_csv_unterminated_quote_is_a_row_error(client):
+    body = CSV_HEADER + '"Ada,Grace'
+    body = post_bulk(client, body, "text/csv").json()
+    assert body["created"] == 0
+    assert body["results"] == [{"row": 1, "errors": ["Unterminated quoted field"]}]
+
+def test_ndjson_invalid_line_is_a_row_error(client):
+    body = "\n".join([json.dumps(ROW), "{bad", json.dumps(ROW)])
+    results = post_bulk(client, body, "application/x-ndjson").json()["results"]
+    assert results[1]["row"] == 2
+    assert results[1]["errors"][0].startswith("Invalid JSON")
+    assert count(InterviewSession) == 2
+
+def test_atomic_schedules_nothing_if_any_row_fails(client):
+    body = "\n".join([json.dumps(ROW), json.dumps({"candidate_name": "x"})])
+    response = post_bulk(client, body, "application/x-ndjson", atomic="true")
+    assert response.status_code == 422
+    assert response.json()["created"] == 0
+    assert response.json()["failed"] == 1
+    assert count(InterviewSession) == 0
+    assert count(OutboundEmail) == 0
+
+def test_multipart_file_upload(client):
+    body = f"{CSV_HEADER}{','.join(ROW.values())}\r\n".encode()
+    response = client.post("/api/interviews/bulk", files={"file": ("rows.csv", body, "application/octet-stream")})
+    assert response.json()["created"] == 1
+    missing = client.post("/api/interviews/bulk", files={"other": ("rows.csv", body, "text/csv")})
+    assert missing.status_code == 400
+
+def test_whole_body_errors(client):
+    assert post_bulk(client, "x", "text/plain").status_code == 415
+    assert post_bulk(client, "{bad", "application/json").status_code == 400
+    assert post_bulk(client, json.dumps(ROW), "application/json").json()["detail"] == "Expected a JSON array of interviews"
+    assert post_bulk(client, b"\xff\xfe", "text/csv").json()["detail"] == "Body is not valid UTF-8"
+    assert count(InterviewSession) == 0
+
+def test_size_and_row_limits(client, monkeypatch):
+    monkeypatch.setattr(bulk_import, "BULK_MAX_BYTES", 1000)
+    rows = f"{CSV_HEADER}{','.join(ROW.values())}\r\n" * 20
+
+    assert post_bulk(client, rows, "text/csv").status_code == 413
+
+    def streamed():
+        for _ in range(20):
+            yield rows[:100].encode()
+
+    assert post_bulk(client, streamed(), "text/csv").status_code == 413
+    too_big = client.post("/api/interviews/bulk", files={"file": ("rows.csv", rows.encode(), "text/csv")})
+    assert too_big.status_code == 413
+
+    monkeypatch.setattr(bulk_import, "BULK_MAX_BYTES", 10 * 1024 * 1024)
+    monkeypatch.setattr(bulk_import, "BULK_MAX_ROWS", 2)
+    assert client.post("/api/interviews/bulk", json=[ROW] * 3).status_code == 413
+    assert count(InterviewSession) == 0
@@ -0,0 +1,56 @@
+# backend/tests/test_field_projection.py
+import pytest
+
+from app.database import SessionLocal
+from app.models.interview import InterviewArtifacts
+
+@pytest.fixture
+def analyzed_interview(make_interview):
+    session_id = make_interview()
+    with SessionLocal() as db:
+        db.add(InterviewArtifacts(
+            session_id=session_id,
+            transcript="Hello.",
+            transcript_json={"utterances": [{"speaker": "A", "text": "Hello."}]},
+            ai_detailed_analysis={"scores": {"python": 4}},
+        ))
+        db.commit()
+    return session_id
+
+def test_listing_returns_requested_columns_and_id(client, make_interview):
+    session_id = make_interview()
+    response = client.get("/api/interviews/", params={"fields": "candidate_name, interview_topic"})
+    assert response.json()["items"] == [{"id": session_id, "candidate_name": "Grace", "interview_topic": "Python"}]
+
+def test_listing_rejects_unknown_and_detail_only_fields(client):
+    response = client.get("/api/interviews/", params={"fields": "candidate_name,transcript,bogus"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: bogus, transcript"
+
+def test_detail_returns_only_requested_fields(client, analyzed_interview):
+    response = client.get(f"/api/interviews/{analyzed_interview}", params={"fields": "candidate_name,transcript_json"})
+    assert response.json() == {
+        "candidate_name": "Grace",
+        "transcript_json": {"utterances": [{"speaker": "A", "text": "Hello."}]},
+    }
+
+def test_detail_without_fields_includes_artifacts(client, analyzed_interview):
+    body = client.get(f"/api/interviews/{analyzed_interview}").json()
+    assert body["id"] == analyzed_interview
+    assert body["transcript"] == "Hello."
+    assert body["ai_detailed_analysis"] == {"scores": {"python": 4}}
+    assert body["ai_summary"] is None
+
+def test_detail_artifact_fields_are_null_before_processing(client, make_interview):
+    session_id = make_interview()
+    response = client.get(f"/api/interviews/{session_id}", params={"fields": "transcript,ai_summary"})
+    assert response.json() == {"transcript": None, "ai_summary": None}
+
+def test_detail_rejects_unknown_fields(client, analyzed_interview):
+    response = client.get(f"/api/interviews/{analyzed_interview}", params={"fields": "transcript,password"})
+    assert response.status_code == 400
+
+def test_empty_fields_means_all(client, make_interview):
+    make_interview()
+    item = client.get("/api/interviews/", params={"fields": " , "}).json()["items"][0]
+    assert {"id", "candidate_name", "scheduled_time", "created_at"} <= set(item)
@@ -0,0 +1,52 @@
+# backend/tests/test_interview_listing.py
+from datetime import datetime, timedelta
+
+def walk(client, **params):
+    """Every page of the listing: (ids in order, number of pages)"""
+    ids, pages, cursor = [], 0, None
+    while True:
+        response = client.get("/api/interviews/", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.json()
+        ids += [item["id"] for item in body["items"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids, pages
+
+def test_cursor_walks_every_owned_interview_once(client, make_interview):
+    conducted = [make_interview() for _ in range(3)]
+    scheduled = [make_interview(interviewer_id=2, created_by=1) for _ in range(2)]
+    conducted.append(make_interview())
+    make_interview(interviewer_id=2)
+
+    ids, pages = walk(client, limit=2)
+    assert ids == sorted(conducted + scheduled, reverse=True)
+    assert pages == 3
+
+def test_last_full_page_has_no_cursor(client, make_interview):
+    for _ in range(4):
+        make_interview()
+    first = client.get("/api/interviews/", params={"limit": 2}).json()
+    assert first["next_cursor"] == str(first["items"][-1]["id"])
+    second = client.get("/api/interviews/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    assert len(second["items"]) == 2
+    assert second["next_cursor"] is None
+
+def test_cursor_pages_keep_status_filter(client, make_interview):
+    tomorrow = datetime.utcnow() + timedelta(days=1)
+    upcoming = [make_interview(scheduled_time=tomorrow) for _ in range(3)]
+    make_interview(scheduled_time=tomorrow, is_canceled=True)
+    make_interview(scheduled_time=tomorrow - timedelta(days=2))
+
+    ids, _ = walk(client, limit=1, status="upcoming")
+    assert ids == sorted(upcoming, reverse=True)
+
+def test_invalid_listing_parameters(client):
+    assert client.get("/api/interviews/", params={"cursor": "abc"}).status_code == 400
+    assert client.get("/api/interviews/", params={"status": "archived"}).status_code == 400
+    assert client.get("/api/interviews/", params={"limit": 0}).status_code == 422
+    assert client.get("/api/interviews/", params={"limit": 101}).status_code == 422
+
+def test_empty_listing(client):
+    assert client.get("/api/interviews/").json() == {"items": [], "next_cursor": None}
@@ -0,0 +1,112 @@
+# backend/tests/test_job_queue.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.interview import InterviewSession
+from app.models.job import ProcessingJob
+from app.services import job_queue
+
+from conftest import run
+
+@pytest.fixture
+def queued_job(make_interview):
+    """A due transcription job for a new interview: (job id, interview id)"""
+    session_id = make_interview()
+
+    async def enqueue():
+        async with AsyncSessionLocal() as db:
+            job = await job_queue.enqueue_job(db, session_id, "transcription")
+            await db.commit()
+            return job.id
+
+    return run(enqueue()), session_id
+
+def expire_lease(job_id: int):
+    with SessionLocal() as db:
+        db.execute(
+            update(ProcessingJob)
+            .where(ProcessingJob.id == job_id)
+            .values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        db.commit()
+
+def load(model, key):
+    with SessionLocal() as db:
+        return db.get(model, key)
+
+def test_claim_leases_job_to_one_worker(queued_job):
+    job_id, _ = queued_job
+    job = run(job_queue.claim_job("transcription", "worker-a"))
+    assert job.id == job_id
+    assert (job.status, job.locked_by, job.attempts) == ("running", "worker-a", 1)
+    assert job.lease_expires_at > datetime.utcnow()
+    assert run(job_queue.claim_job("transcription", "worker-b")) is None
+
+def test_expired_lease_is_requeued(queued_job):
+    job_id, _ = queued_job
+    run(job_queue.claim_job("transcription", "worker-a"))
+    assert run(job_queue.requeue_expired_leases()) == 0
+
+    expire_lease(job_id)
+    assert run(job_queue.requeue_expired_leases()) == 1
+    job = load(ProcessingJob, job_id)
+    assert (job.status, job.locked_by, job.last_error) == ("queued", None, "Worker lease expired")
+    # The crashed worker can no longer heartbeat or finish the job
+    assert run(job_queue.extend_lease(job_id, "worker-a")) is False
+
+    reclaimed = run(job_queue.claim_job("transcription", "worker-b"))
+    assert (reclaimed.id, reclaimed.attempts) == (job_id, 2)
+
+def test_expired_lease_on_last_attempt_fails_job(queued_job):
+    job_id, session_id = queued_job
+    with SessionLocal() as db:
+        db.execute(update(ProcessingJob).where(ProcessingJob.id == job_id).values(max_attempts=1))
+        db.commit()
+    run(job_queue.claim_job("transcription", "worker-a"))
+    expire_lease(job_id)
+
+    assert run(job_queue.requeue_expired_leases()) == 0
+    assert load(ProcessingJob, job_id).status == "failed"
+    interview = load(InterviewSession, session_id)
+    assert interview.is_processing is False
+    assert interview.error_message == "transcription failed: worker lease expired"
+
+def test_retryable_failure_backs_off(queued_job):
+    job_id, session_id = queued_job
+    run(job_queue.claim_job("transcription", "worker-a"))
+    run(job_queue.fail_job(job_id, "worker-a", "provider timeout"))
+
+    job = load(ProcessingJob, job_id)
+    assert (job.status, job.locked_by, job.last_error) == ("queued", None, "provider timeout")
+    assert job.run_after > datetime.utcnow()
+    # Not due until the backoff has passed
+    assert run(job_queue.claim_job("transcription", "worker-a")) is None
+    interview = load(InterviewSession, session_id)
+    assert interview.is_processing is True
+    assert "retrying" in interview.error_message
+
+def test_permanent_failure_gives_up(queued_job):
+    job_id, session_id = queued_job
+    run(job_queue.claim_job("transcription", "worker-a"))
+    run(job_queue.fail_job(job_id, "worker-a", "bad audio", retryable=False))
+
+    assert load(ProcessingJob, job_id).status == "failed"
+    interview = load(InterviewSession, session_id)
+    assert interview.is_processing is False
+    assert interview.error_message == "transcription failed: bad audio"
+
+def test_failure_from_worker_without_lease_is_ignored(queued_job):
+    job_id, _ = queued_job
+    run(job_queue.claim_job("transcription", "worker-a"))
+    run(job_queue.fail_job(job_id, "worker-b", "not mine"))
+    job = load(ProcessingJob, job_id)
+    assert (job.status, job.locked_by, job.last_error) == ("running", "worker-a", None)
+
+def test_retry_delay_is_capped():
+    for attempts in range(1, 20):
+        delay = job_queue.retry_delay(attempts, base=1, maximum=60)
+        assert 0 < delay <= 60
+    assert job_queue.retry_delay(20, base=1, maximum=60) >= 30
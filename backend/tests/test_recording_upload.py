@@ -0,0 +1,88 @@
+# backend/tests/test_recording_upload.py
+import hashlib
+
+import pytest
+
+from app.database import SessionLocal
+from app.models.interview import InterviewSession
+from app.models.job import ProcessingJob
+from app.services import recordings
+
+@pytest.fixture
+def upload_url(client, make_interview):
+    """Upload URL of an interview with a freshly started upload"""
+    session_id = make_interview()
+    url = f"/api/interviews/{session_id}/recording/upload"
+    response = client.post(url)
+    assert response.json()["offset"] == 0
+    return url
+
+def put_chunk(client, url, offset, data, **headers):
+    return client.put(url, params={"offset": offset}, content=data, headers=headers)
+
+def session_id_of(url: str) -> int:
+    return int(url.split("/")[3])
+
+def test_chunks_append_at_offset(client, upload_url):
+    assert put_chunk(client, upload_url, 0, b"first-").json() == {"offset": 6}
+    assert put_chunk(client, upload_url, 6, b"second").json() == {"offset": 12}
+    assert client.get(upload_url).json()["offset"] == 12
+
+def test_wrong_offset_is_rejected_with_current_offset(client, upload_url):
+    put_chunk(client, upload_url, 0, b"abc")
+    for offset in (0, 5):
+        response = put_chunk(client, upload_url, offset, b"xyz")
+        assert response.status_code == 409
+        assert response.json()["detail"]["offset"] == 3
+    assert client.get(upload_url).json()["offset"] == 3
+
+def test_chunk_checksum_mismatch_rolls_back(client, upload_url):
+    put_chunk(client, upload_url, 0, b"abc")
+    response = put_chunk(client, upload_url, 3, b"def", **{"X-Chunk-SHA256": hashlib.sha256(b"other").hexdigest()})
+    assert response.status_code == 400
+    assert client.get(upload_url).json()["offset"] == 3
+
+    good = put_chunk(client, upload_url, 3, b"def", **{"X-Chunk-SHA256": hashlib.sha256(b"def").hexdigest()})
+    assert good.json() == {"offset": 6}
+
+def test_chunk_without_started_upload_is_rejected(client, make_interview):
+    url = f"/api/interviews/{make_interview()}/recording/upload"
+    assert put_chunk(client, url, 0, b"abc").status_code == 400
+
+def test_complete_moves_recording_and_queues_transcription(client, upload_url):
+    put_chunk(client, upload_url, 0, b"hello ")
+    put_chunk(client, upload_url, 6, b"world")
+    response = client.post(
+        f"{upload_url}/complete",
+        headers={"X-Content-SHA256": hashlib.sha256(b"hello world").hexdigest()}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["size"] == 11
+
+    session_id = session_id_of(upload_url)
+    assert recordings.recording_path(session_id).read_bytes() == b"hello world"
+    assert not recordings.partial_path(session_id).exists()
+    with SessionLocal() as db:
+        assert db.get(InterviewSession, session_id).recording_path == str(recordings.recording_path(session_id))
+        job = db.get(ProcessingJob, body["job_id"])
+        assert (job.stage, job.status) == ("transcription", "queued")
+
+def test_complete_with_wrong_checksum_keeps_partial_upload(client, upload_url):
+    put_chunk(client, upload_url, 0, b"hello")
+    response = client.post(f"{upload_url}/complete", headers={"X-Content-SHA256": "0" * 64})
+    assert response.status_code == 400
+    assert client.get(upload_url).json()["offset"] == 5
+
+def test_complete_without_data_is_rejected(client, upload_url):
+    assert client.post(f"{upload_url}/complete").status_code == 400
+
+def test_restart_discards_partial_data(client, upload_url):
+    put_chunk(client, upload_url, 0, b"stale")
+    assert client.post(upload_url).json()["offset"] == 0
+    assert client.get(upload_url).json()["offset"] == 0
+
+def test_upload_locks_are_released(client, upload_url):
+    put_chunk(client, upload_url, 0, b"abc")
+    client.post(f"{upload_url}/complete")
+    assert recordings._upload_locks == {}
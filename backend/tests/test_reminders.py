@@ -0,0 +1,64 @@
+# backend/tests/test_reminders.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models.interview import InterviewSession
+from app.models.outbox import OutboundEmail
+from app.services import reminders
+
+from conftest import run
+
+@pytest.fixture(params=[True, False], ids=["returning", "per-row"], autouse=True)
+def update_returning(request, monkeypatch):
+    """Run every test with and without UPDATE ... RETURNING support"""
+    monkeypatch.setattr(async_engine.dialect, "update_returning", request.param)
+
+async def mark(session_ids, now):
+    async with AsyncSessionLocal() as db:
+        marked = await reminders.mark_reminded(db, session_ids, now)
+        await db.commit()
+        return marked
+
+def test_mark_reminded_only_claims_unmarked_sessions(make_interview):
+    now = datetime.utcnow()
+    first, second, third = (make_interview() for _ in range(3))
+
+    assert run(mark([first, second], now)) == {first, second}
+    assert run(mark([first, second, third], now)) == {third}
+    assert run(mark([first, second, third], now)) == set()
+    with SessionLocal() as db:
+        assert all(db.get(InterviewSession, session_id).reminders_queued_at == now for session_id in (first, second, third))
+
+def outbox_count() -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(OutboundEmail))
+
+def test_dispatch_queues_each_reminder_once(make_interview):
+    now = datetime.utcnow()
+    soon = now + timedelta(hours=2)
+    for _ in range(3):
+        make_interview(scheduled_time=soon, candidate_email="grace@example.com", interviewer_email="ada@example.com")
+    make_interview(scheduled_time=soon, candidate_email="grace@example.com", is_canceled=True)
+    make_interview(scheduled_time=now + timedelta(days=3), candidate_email="grace@example.com")
+    make_interview(scheduled_time=now - timedelta(hours=1), candidate_email="grace@example.com")
+
+    assert run(reminders.dispatch_due_reminders(now=now, lead_minutes=24 * 60, batch_size=2)) == 6
+    assert run(reminders.dispatch_due_reminders(now=now, lead_minutes=24 * 60, batch_size=2)) == 0
+    assert outbox_count() == 6
+
+def test_concurrent_dispatchers_do_not_duplicate(make_interview):
+    now = datetime.utcnow()
+    for _ in range(5):
+        make_interview(scheduled_time=now + timedelta(hours=1), candidate_email="grace@example.com")
+
+    async def dispatch_twice():
+        return await asyncio.gather(*(
+            reminders.dispatch_due_reminders(now=now, lead_minutes=120, batch_size=2) for _ in range(2)
+        ))
+
+    assert sum(run(dispatch_twice())) == 5
+    assert outbox_count() == 5
@@ -0,0 +1,57 @@
+# backend/tests/test_session_cache.py
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.interview import InterviewSession
+from app.services import session_cache
+
+from conftest import run
+
+def test_active_session_is_cached(make_interview):
+    session_id = make_interview()
+    assert run(session_cache.is_active_session(session_id)) is True
+    assert session_id in session_cache._active
+
+def test_inactive_or_missing_sessions_are_not_cached(make_interview):
+    canceled = make_interview(is_canceled=True)
+    completed = make_interview(is_completed=True)
+    for session_id in (canceled, completed, 999999):
+        assert run(session_cache.is_active_session(session_id)) is False
+        assert session_id not in session_cache._active
+
+def test_cancel_invalidates_on_commit_not_flush(make_interview):
+    session_id = make_interview()
+    run(session_cache.is_active_session(session_id))
+
+    async def cancel():
+        async with AsyncSessionLocal() as db:
+            (await db.get(InterviewSession, session_id)).is_canceled = True
+            await db.flush()
+            assert session_id in session_cache._active
+            await db.commit()
+
+    run(cancel())
+    assert session_id not in session_cache._active
+    assert run(session_cache.is_active_session(session_id)) is False
+
+def test_rolled_back_change_keeps_entry(make_interview):
+    session_id = make_interview()
+    run(session_cache.is_active_session(session_id))
+    with SessionLocal() as db:
+        db.get(InterviewSession, session_id).is_completed = True
+        db.flush()
+        db.rollback()
+    assert session_id in session_cache._active
+
+def test_delete_invalidates_on_commit(make_interview):
+    session_id = make_interview()
+    run(session_cache.is_active_session(session_id))
+    with SessionLocal() as db:
+        db.delete(db.get(InterviewSession, session_id))
+        db.commit()
+    assert session_id not in session_cache._active
+
+def test_query_racing_an_invalidation_is_not_cached(make_interview):
+    session_id = make_interview()
+    generation = session_cache._current_generation()
+    session_cache.invalidate(session_id)
+    session_cache._remember(session_id, generation)
+    assert session_id not in session_cache._active
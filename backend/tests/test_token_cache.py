@@ -0,0 +1,52 @@
+# backend/tests/test_token_cache.py
+from app.auth.token_cache import AuthenticatedUser, token_cache
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.user import User
+
+from conftest import run
+
+def cached_user(email="ada@example.com") -> AuthenticatedUser:
+    with SessionLocal() as db:
+        user = User(email=email, hashed_password="x", full_name="Ada")
+        db.add(user)
+        db.commit()
+        principal = AuthenticatedUser.from_user(user)
+    token_cache.set("token", principal)
+    return principal
+
+def test_update_invalidates_on_commit_not_flush():
+    principal = cached_user()
+    with SessionLocal() as db:
+        db.get(User, principal.id).full_name = "Ada L."
+        db.flush()
+        assert token_cache.get("token") == principal
+        db.commit()
+    assert token_cache.get("token") is None
+
+def test_rolled_back_update_keeps_entry():
+    principal = cached_user()
+    with SessionLocal() as db:
+        db.get(User, principal.id).is_active = False
+        db.flush()
+        db.rollback()
+    assert token_cache.get("token") == principal
+
+def test_async_session_delete_invalidates_on_commit():
+    principal = cached_user()
+
+    async def delete():
+        async with AsyncSessionLocal() as db:
+            await db.delete(await db.get(User, principal.id))
+            await db.flush()
+            assert token_cache.get("token") == principal
+            await db.commit()
+
+    run(delete())
+    assert token_cache.get("token") is None
+
+def test_snapshot_read_before_invalidation_is_not_cached():
+    principal = cached_user()
+    generation = token_cache.generation()
+    token_cache.invalidate_user(principal.id)
+    token_cache.set("token", principal, generation=generation)
+    assert token_cache.get("token") is None
@@ -6,6 +6,7 @@ import { API_URL } from '../config';
 
 function Dashboard() {
   const [interviews, setInterviews] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState(null);
   const [activeTab, setActiveTab] = useState('upcoming');
@@ -14,16 +15,22 @@ function Dashboard() {
   const navigate = useNavigate();
 
   useEffect(() => {
+    setInterviews([]);
     fetchInterviews();
-  }, []);
+  }, [activeTab]);
 
-  const fetchInterviews = async () => {
+  // The API filters by tab and pages with a cursor; "Load more" appends
+  const fetchInterviews = async (cursor = null) => {
     setIsLoading(true);
     setError(null);
     
     try {
       const token = localStorage.getItem('token');
-      const response = await fetch(`${API_URL}/api/interviews/`, {
+      const params = new URLSearchParams({ status: activeTab });
+      if (cursor) {
+        params.set('cursor', cursor);
+      }
+      const response = await fetch(`${API_URL}/api/interviews/?${params}`, {
         headers: {
           'Authorization': `Bearer ${token}`
         }
@@ -34,7 +41,8 @@ function Dashboard() {
       }
       
       const data = await response.json();
-      setInterviews(data);
+      setInterviews(cursor ? [...interviews, ...data.items] : data.items);
+      setNextCursor(data.next_cursor);
     } catch (err) {
       console.error('Error fetching interviews:', err);
       setError(err.message);
@@ -43,25 +51,6 @@ function Dashboard() {
     }
   };
 
-  const getFilteredInterviews = () => {
-    const now = new Date();
-    
-    switch (activeTab) {
-      case 'upcoming':
-        return interviews.filter(interview => 
-          new Date(interview.scheduled_time) > now && !interview.is_canceled && !interview.is_completed
-        );
-      case 'past':
-        return interviews.filter(interview => 
-          (new Date(interview.scheduled_time) < now || interview.is_completed) && !interview.is_canceled
-        );
-      case 'canceled':
-        return interviews.filter(interview => interview.is_canceled);
-      default:
-        return interviews;
-    }
-  };
-
   const formatDate = (dateString) => {
     if (!dateString) return 'Not scheduled';
     const date = new Date(dateString);
@@ -101,17 +90,17 @@ function Dashboard() {
         </button>
       </div>
       
-      {isLoading ? (
+      {isLoading && interviews.length === 0 ? (
         <div className="loading">Loading interviews...</div>
       ) : error ? (
         <div className="error-message">{error}</div>
-      ) : getFilteredInterviews().length === 0 ? (
+      ) : interviews.length === 0 ? (
         <div className="no-interviews">
           No {activeTab} interviews found.
         </div>
       ) : (
         <div className="interviews-list">
-          {getFilteredInterviews().map(interview => (
+          {interviews.map(interview => (
             <div key={interview.id} className="interview-card">
               <div className="interview-info">
                 <h3>{interview.interview_topic}</h3>
@@ -152,6 +141,16 @@ function Dashboard() {
               </div>
             </div>
           ))}
+
+          {nextCursor && (
+            <button
+              className="load-more-button"
+              onClick={() => fetchInterviews(nextCursor)}
+              disabled={isLoading}
+            >
+              {isLoading ? 'Loading...' : 'Load more'}
+            </button>
+          )}
         </div>
       )}
     </div>
@@ -1,6 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { useParams } from 'react-router-dom';
 import axios from 'axios';
+import apiService from '../services/apiService';
 
 function InterviewReview() {
   const { sessionId } = useParams();
@@ -89,28 +90,33 @@ function InterviewReview() {
     setIsAnalysisLoading(true);
     
     try {
-      await axios.post(`${API_URL}/api/interviews/${sessionId}/analyze`);
-      
-      // Poll for analysis completion
-      const pollInterval = setInterval(async () => {
-        const response = await axios.get(`${API_URL}/api/interviews/${sessionId}`);
-        setSessionData(response.data);
-        
-        if (response.data.ai_summary) {
-          clearInterval(pollInterval);
+      // Sections appear as soon as the model has written them
+      const detailed = {
+        technical_assessment: '',
+        strengths: [],
+        areas_for_improvement: [],
+        recommendation: '',
+        scores: {},
+      };
+      const analysis = await apiService.streamAnalysis(sessionId, (event, data) => {
+        if (event !== 'section') return;
+        if (data.name === 'summary') {
+          setSessionData(prev => ({ ...prev, ai_summary: data.value }));
           setActiveTab('analysis');
-          setIsAnalysisLoading(false);
+        } else {
+          detailed[data.name] = data.value;
+          setSessionData(prev => ({ ...prev, ai_detailed_analysis: { ...detailed } }));
         }
-      }, 5000); // Check every 5 seconds
+      });
       
-      // Stop polling after 2 minutes
-      setTimeout(() => {
-        clearInterval(pollInterval);
-        if (isAnalysisLoading) {
-          setIsAnalysisLoading(false);
-          setError('Analysis is taking longer than expected. Please check back later.');
-        }
-      }, 120000);
+      // The final (saved) result replaces the partial sections
+      setSessionData(prev => ({
+        ...prev,
+        ai_summary: analysis.summary,
+        ai_detailed_analysis: analysis.detailed,
+      }));
+      setActiveTab('analysis');
+      setIsAnalysisLoading(false);
       
     } catch (err) {
       console.error('Error generating analysis:', err);
@@ -2,6 +2,16 @@
 import { API_URL } from '../config';
 import axios from 'axios';
 
+// Recordings are uploaded in pieces of this size (server may lower it)
+const CHUNK_SIZE = 4 * 1024 * 1024;
+
+const sha256Hex = async (blob) => {
+  const digest = await crypto.subtle.digest('SHA-256', await blob.arrayBuffer());
+  return Array.from(new Uint8Array(digest))
+    .map((b) => b.toString(16).padStart(2, '0'))
+    .join('');
+};
+
 /**
  * Service for handling API calls to the backend
  */
@@ -13,7 +23,9 @@ class ApiService {
    */
   async fetchSession(sessionId) {
     try {
-      const response = await axios.get(`${API_URL}/api/interviews/${sessionId}`);
+      const response = await axios.get(`${API_URL}/api/interviews/${sessionId}`, {
+        headers: { Authorization: `Bearer ${localStorage.getItem('token')}` },
+      });
       return response.data;
     } catch (error) {
       console.error('Error fetching session:', error);
@@ -80,6 +92,97 @@ class ApiService {
     }
   }
 
+  /**
+   * Upload a recording in checksummed chunks, resuming after failures
+   * @param {number} sessionId - The interview session ID
+   * @param {Blob} blob - The recorded media
+   * @returns {Promise<Object>} - The upload result (queued transcription job)
+   */
+  async uploadRecording(sessionId, blob) {
+    const url = `${API_URL}/api/interviews/${sessionId}/recording/upload`;
+    const headers = { Authorization: `Bearer ${localStorage.getItem('token')}` };
+    const maxRetries = 5;
+
+    try {
+      const start = await axios.post(url, null, { headers });
+      const chunkSize = Math.min(CHUNK_SIZE, start.data.max_chunk_size);
+      let offset = 0;
+      let retries = 0;
+
+      while (offset < blob.size) {
+        const chunk = blob.slice(offset, offset + chunkSize);
+        try {
+          const response = await axios.put(url, chunk, {
+            params: { offset },
+            headers: {
+              ...headers,
+              'Content-Type': 'application/octet-stream',
+              'X-Chunk-SHA256': await sha256Hex(chunk),
+            },
+          });
+          offset = response.data.offset;
+          retries = 0;
+        } catch (error) {
+          if (++retries > maxRetries) throw error;
+          // Resume from whatever the server actually has
+          const status = await axios.get(url, { headers });
+          offset = status.data.offset;
+        }
+      }
+
+      const response = await axios.post(`${url}/complete`, null, { headers });
+      return response.data;
+    } catch (error) {
+      console.error('Error uploading recording:', error);
+      throw error;
+    }
+  }
+
+  /**
+   * Run AI analysis and receive it as Server-Sent Events while it is generated
+   * @param {number} sessionId - The interview session ID
+   * @param {Function} onEvent - Called with (event, data) for every event
+   * @returns {Promise<Object>} - The final analysis ({ summary, detailed })
+   */
+  async streamAnalysis(sessionId, onEvent) {
+    // EventSource can't POST or send headers, so read the stream with fetch
+    const response = await fetch(`${API_URL}/api/interviews/${sessionId}/analysis/stream`, {
+      method: 'POST',
+      headers: { Authorization: `Bearer ${localStorage.getItem('token')}` },
+    });
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}));
+      throw new Error(errorData.detail || `Failed to analyze interview: Status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = null;
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const message = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        let event = 'message';
+        let data = '';
+        message.split('\n').forEach((line) => {
+          if (line.startsWith('event:')) event = line.slice(6).trim();
+          else if (line.startsWith('data:')) data += line.slice(5).trim();
+        });
+        const payload = data ? JSON.parse(data) : null;
+        if (event === 'error') throw new Error(payload.detail);
+        if (event === 'done') result = payload;
+        onEvent(event, payload);
+      }
+    }
+    return result;
+  }
+
   /**
    * Get the recording URL for an interview session
    * @param {number} sessionId - The interview session ID
@@ -60,6 +60,11 @@ class WebRTCService {
         const message = JSON.parse(event.data);
         
         switch (message.type) {
+          case 'ping':
+            // Server heartbeat; unanswered sockets are closed as idle
+            this.socket.send(JSON.stringify({ type: 'pong' }));
+            break;
+
           case 'offer':
             if (this.role === 'candidate') {
               await this.handleOffer(message.offer);